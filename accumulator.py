@@ -0,0 +1,294 @@
+from rational import Rational
+from complex import Complex, _operand_parts
+from math import gcd
+
+# Terms whose denominator does not divide the running one wait in a buffer, grouped
+# by denominator; a full buffer is added up as a balanced tree and pushed onto a
+# stack of partial sums.
+_PENDING_LIMIT = 64
+
+# Divisibility by the running denominator is only tested while it is this small;
+# beyond that the test costs more than grouping the term with the pending ones.
+_DIVISIBLE_BITS = 4096
+
+
+def _tree_sum(terms: list[tuple[int, int]]) -> tuple[int, int]:
+    """
+    Adds fractions num/den pairwise in a balanced tree over the lcm of their denominators.
+
+    Operands of similar size meet at every level, so the cost stays close to one
+    multiplication of the final size instead of growing with every term.
+
+    :param terms: A non-empty list of (den, num) pairs.
+    :return: The sum as a (den, num) pair, not reduced.
+    """
+    while len(terms) > 1:
+        combined = []
+        for i in range(0, len(terms) - 1, 2):
+            (den1, num1), (den2, num2) = terms[i], terms[i + 1]
+            common = gcd(den1, den2)
+            scale = den2 // common
+            combined.append((den1 * scale, num1 * scale + num2 * (den1 // common)))
+        if len(terms) % 2:
+            combined.append(terms[-1])
+        terms = combined
+    return terms[0]
+
+
+def _push(blocks: list, block: tuple[int, int]):
+    """
+    Pushes a merged batch onto a stack of partial sums, binary-counter style.
+
+    The top two partial sums are combined while the lower one is at most twice as
+    large, so every term takes part in O(log n) additions of similar size.
+
+    :param blocks: The stack of (den, num) partial sums; modified in place.
+    :param block: The new partial sum.
+    """
+    blocks.append(block)
+    while len(blocks) > 1 and blocks[-2][0].bit_length() <= 2 * blocks[-1][0].bit_length():
+        top = blocks.pop()
+        blocks[-1] = _tree_sum([blocks[-1], top])
+
+
+class RationalAccumulator:
+    """
+    A mutable running total of rational numbers.
+
+    The total is kept as a raw integer numerator over the lcm of the denominators
+    merged so far. A term whose denominator divides the running one costs a single
+    integer multiply-add: no Rational is created and no gcd runs. Other terms are
+    grouped by denominator and summed in batches that are combined like a balanced
+    tree, so many distinct denominators do not make every addition pay for the full
+    size of the total. The total is reduced only when value() is called or when the
+    denominator grows past max_bits.
+    """
+    __slots__ = ('_num', '_den', '_pending', '_blocks', '_limit', '_max_bits')
+
+    def __init__(self, start=0, max_bits: int = 1024):
+        """
+        :param start: The initial total (Rational/int/float/Fraction).
+        :param max_bits: The denominator size in bits above which the total is reduced eagerly;
+            the bound doubles with the total when the reduction does not shrink it.
+        :raises TypeError: If start is not a supported number.
+        """
+        self._num, self._den = Rational._parts(start)
+        self._pending = {}
+        self._blocks = []
+        self._limit = max_bits
+        self._max_bits = max_bits
+
+    def _add_parts(self, num: int, den: int):
+        d = self._den
+        if den == d:
+            self._num += num
+        elif d.bit_length() <= _DIVISIBLE_BITS and d % den == 0:
+            self._num += num * (d // den)
+        else:
+            pending = self._pending
+            pending[den] = pending.get(den, 0) + num
+            if len(pending) >= _PENDING_LIMIT:
+                self._merge()
+
+    def _merge(self, final: bool = False):
+        """
+        Moves the pending terms onto the partial sums and folds partial sums into
+        the running total once they are about as large as it is, or all of them if final.
+        """
+        if self._pending:
+            _push(self._blocks, _tree_sum(list(self._pending.items())))
+            self._pending.clear()
+        blocks = self._blocks
+        while blocks and (final or self._den.bit_length() <= 2 * blocks[-1][0].bit_length()):
+            den, num = blocks.pop()
+            d = self._den
+            common = gcd(d, den)
+            scale = den // common
+            self._num = self._num * scale + num * (d // common)
+            self._den = d * scale
+            if self._den.bit_length() > self._limit:
+                self._normalize()
+                # Reducing a total that keeps growing anyway pays off only every doubling.
+                self._limit = max(self._max_bits, 2 * self._den.bit_length())
+
+    def _normalize(self):
+        common = gcd(self._num, self._den)
+        if common != 1:
+            self._num //= common
+            self._den //= common
+
+    def add(self, value):
+        """
+        Adds a term to the total.
+
+        :param value: A Rational, int, float or Fraction.
+        :raises TypeError: If value is not a supported number.
+        """
+        if type(value) is Rational:
+            self._add_parts(value._num, value._den)
+        elif type(value) is int:
+            self._num += value * self._den
+        else:
+            self._add_parts(*Rational._parts(value))
+
+    def sub(self, value):
+        """
+        Subtracts a term from the total.
+
+        :param value: A Rational, int, float or Fraction.
+        :raises TypeError: If value is not a supported number.
+        """
+        num, den = Rational._parts(value)
+        self._add_parts(-num, den)
+
+    def addmul(self, a, b):
+        """
+        Adds the product a*b to the total without building the product as a Rational.
+
+        :param a: The first factor (Rational/int/float/Fraction).
+        :param b: The second factor (Rational/int/float/Fraction).
+        :raises TypeError: If a factor is not a supported number.
+        """
+        num1, den1 = Rational._parts(a)
+        num2, den2 = Rational._parts(b)
+        self._add_parts(num1 * num2, den1 * den2)
+
+    def extend(self, values):
+        """
+        Adds every term of an iterable to the total.
+
+        :param values: An iterable of Rational/int/float/Fraction terms.
+        :raises TypeError: If a term is not a supported number.
+        """
+        add_parts = self._add_parts
+        for value in values:
+            if type(value) is Rational:
+                add_parts(value._num, value._den)
+            elif type(value) is int:
+                self._num += value * self._den
+            else:
+                add_parts(*Rational._parts(value))
+
+    def value(self) -> Rational:
+        """
+        Reduces the total and returns it.
+
+        :return: The current total as a Rational.
+        """
+        self._merge(final=True)
+        self._normalize()
+        return Rational._result(self._num, self._den)
+
+    def __iadd__(self, value):
+        self.add(value)
+        return self
+
+    def __isub__(self, value):
+        self.sub(value)
+        return self
+
+
+def _complex_parts(value) -> tuple[tuple[int, int], tuple[int, int]]:
+    """
+    Splits a number into the (num, den) pairs of its real and imaginary parts.
+
+    :param value: A Complex, Rational, int, float, Fraction or complex.
+    :raises TypeError: If value is not a supported number.
+    :return: ((re.num, re.den), (im.num, im.den)).
+    """
+    if type(value) is Complex:
+        re, im = value._Re, value._Im
+        return (re._num, re._den), (im._num, im._den)
+    parts = _operand_parts.get(type(value))
+    if parts is None:
+        raise TypeError(f"Can't accumulate complex and {type(value)}")
+    re, im = parts(value)
+    return Rational._parts(re), (0, 1) if im is None else (im._num, im._den)
+
+
+class ComplexAccumulator:
+    """
+    A mutable running total of complex numbers.
+
+    Each part is a RationalAccumulator of its own: sharing one denominator between
+    the parts would make every gcd on the total about twice as large, while the
+    parts of most inputs have unrelated denominators anyway.
+    """
+    __slots__ = ('_re', '_im')
+
+    def __init__(self, start=0, max_bits: int = 1024):
+        """
+        :param start: The initial total (Complex/Rational/int/float/Fraction/complex).
+        :param max_bits: The denominator size in bits above which a part is reduced eagerly.
+        :raises TypeError: If start is not a supported number.
+        """
+        (re_num, re_den), (im_num, im_den) = _complex_parts(start)
+        self._re = RationalAccumulator(Rational._make(re_num, re_den), max_bits)
+        self._im = RationalAccumulator(Rational._make(im_num, im_den), max_bits)
+
+    def add(self, value):
+        """
+        Adds a term to the total.
+
+        :param value: A Complex, Rational, int, float, Fraction or complex.
+        :raises TypeError: If value is not a supported number.
+        """
+        re, im = _complex_parts(value)
+        self._re._add_parts(*re)
+        self._im._add_parts(*im)
+
+    def sub(self, value):
+        """
+        Subtracts a term from the total.
+
+        :param value: A Complex, Rational, int, float, Fraction or complex.
+        :raises TypeError: If value is not a supported number.
+        """
+        (re_num, re_den), (im_num, im_den) = _complex_parts(value)
+        self._re._add_parts(-re_num, re_den)
+        self._im._add_parts(-im_num, im_den)
+
+    def addmul(self, a, b):
+        """
+        Adds the product a*b to the total without building the product as a Complex.
+
+        :param a: The first factor.
+        :param b: The second factor.
+        :raises TypeError: If a factor is not a supported number.
+        """
+        (p1, d1), (q1, e1) = _complex_parts(a)
+        (p2, d2), (q2, e2) = _complex_parts(b)
+        self._re._add_parts(p1 * p2, d1 * d2)
+        self._re._add_parts(-q1 * q2, e1 * e2)
+        self._im._add_parts(p1 * q2, d1 * e2)
+        self._im._add_parts(q1 * p2, e1 * d2)
+
+    def extend(self, values):
+        """
+        Adds every term of an iterable to the total.
+
+        :param values: An iterable of supported numbers.
+        :raises TypeError: If a term is not a supported number.
+        """
+        add_re = self._re._add_parts
+        add_im = self._im._add_parts
+        for value in values:
+            re, im = _complex_parts(value)
+            add_re(*re)
+            add_im(*im)
+
+    def value(self) -> Complex:
+        """
+        Reduces the total and returns it.
+
+        :return: The current total as a Complex.
+        """
+        return Complex._make(self._re.value(), self._im.value())
+
+    def __iadd__(self, value):
+        self.add(value)
+        return self
+
+    def __isub__(self, value):
+        self.sub(value)
+        return self
@@ -0,0 +1,134 @@
+import unittest
+import random
+from fractions import Fraction
+from rational import Rational
+from complex import Complex
+from accumulator import RationalAccumulator, ComplexAccumulator
+
+class TestRationalAccumulator(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(23)
+        self.values = [Rational(rng.randint(-100, 100), rng.randint(1, 60)) for _ in range(300)]
+
+    def test_add_matches_sum(self):
+        acc = RationalAccumulator()
+        for value in self.values:
+            acc.add(value)
+        self.assertEqual(acc.value(), Rational.sum(self.values))
+
+    def test_extend(self):
+        acc = RationalAccumulator(Rational(1, 7))
+        acc.extend(self.values)
+        acc.extend([3, 0.5, Fraction(1, 3)])
+        expected = Rational.sum(self.values + [Rational(1, 7), 3, Rational(1, 2), Rational(1, 3)])
+        self.assertEqual(acc.value(), expected)
+
+    def test_sub(self):
+        acc = RationalAccumulator()
+        acc.extend(self.values)
+        for value in self.values:
+            acc.sub(value)
+        self.assertEqual(acc.value(), 0)
+        self.assertEqual(acc.value().den, 1)
+
+    def test_addmul(self):
+        acc = RationalAccumulator()
+        for a, b in zip(self.values, reversed(self.values)):
+            acc.addmul(a, b)
+        self.assertEqual(acc.value(), Rational.sum([a * b for a, b in zip(self.values, reversed(self.values))]))
+
+    def test_inplace_operators(self):
+        acc = RationalAccumulator()
+        same = acc
+        acc += Rational(1, 2)
+        acc -= Rational(1, 3)
+        self.assertIs(acc, same)
+        self.assertEqual(acc.value(), Rational(1, 6))
+
+    def test_value_keeps_accumulating(self):
+        acc = RationalAccumulator()
+        acc.add(Rational(1, 2))
+        self.assertEqual(acc.value(), Rational(1, 2))
+        acc.add(Rational(1, 2))
+        self.assertEqual(acc.value(), 1)
+
+    def test_size_threshold_normalizes(self):
+        acc = RationalAccumulator(max_bits=64)
+        primes = [p for p in range(1000, 1500) if all(p % k for k in range(2, 40))][:63]
+        for p in primes:
+            acc.add(Rational(1, p))
+            acc.sub(Rational(1, p))
+        # The 64th pending denominator triggers a merge; the total over the huge lcm
+        # of the batch is reduced right away.
+        acc.add(Rational(1, 2))
+        self.assertEqual(acc._den, 2)
+        self.assertEqual(acc.value(), Rational(1, 2))
+
+    def test_many_denominators(self):
+        rng = random.Random(31)
+        values = [Rational(rng.randint(-10**9, 10**9), rng.randint(1, 10**9)) for _ in range(500)]
+        acc = RationalAccumulator()
+        acc.extend(values[:250])
+        for value in values[250:]:
+            acc.add(value)
+        self.assertEqual(acc.value(), Rational.sum(values))
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            RationalAccumulator().add("a")
+        with self.assertRaises(TypeError):
+            RationalAccumulator().extend([1, Complex(1, 1)])
+
+
+class TestComplexAccumulator(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(29)
+        self.values = [Complex(Rational(rng.randint(-50, 50), rng.randint(1, 20)),
+                               Rational(rng.randint(-50, 50), rng.randint(1, 20))) for _ in range(200)]
+
+    def test_extend_matches_sum(self):
+        acc = ComplexAccumulator()
+        acc.extend(self.values)
+        self.assertEqual(acc.value(), Complex.sum(self.values))
+
+    def test_mixed_terms(self):
+        acc = ComplexAccumulator(Complex(1, 1))
+        acc.add(Rational(1, 2))
+        acc.add(3)
+        acc.add(Fraction(1, 4))
+        acc.add(1 + 2j)
+        acc.sub(Complex(0, Rational(1, 3)))
+        self.assertEqual(acc.value(), Complex(Rational(23, 4), Rational(8, 3)))
+
+    def test_addmul(self):
+        acc = ComplexAccumulator()
+        pairs = list(zip(self.values, self.values[1:]))
+        for a, b in pairs:
+            acc.addmul(a, b)
+        acc.addmul(Rational(1, 2), Complex(0, 2))
+        self.assertEqual(acc.value(), Complex.sum([a * b for a, b in pairs]) + Complex(0, 1))
+
+    def test_many_denominators(self):
+        rng = random.Random(37)
+        values = [Complex(Rational(rng.randint(-999, 999), rng.randint(1, 10**6)), rng.randint(-9, 9))
+                  for _ in range(300)]
+        acc = ComplexAccumulator()
+        acc.extend(values)
+        self.assertEqual(acc.value(), Complex.sum(values))
+
+    def test_value_parts_reduced(self):
+        acc = ComplexAccumulator()
+        acc.add(Complex(Rational(1, 2), Rational(1, 3)))
+        acc.add(Complex(Rational(1, 2), 0))
+        value = acc.value()
+        self.assertEqual((value.Re.num, value.Re.den, value.Im.num, value.Im.den), (1, 1, 1, 3))
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            ComplexAccumulator().add("a")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,54 @@
+from benchmarks import harness
+import benchmarks.micro
+import benchmarks.macro
+from statistics import median
+import argparse
+import sys
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks",
+        description="Runs the Rational/Complex benchmarks and compares them with a JSON baseline.")
+    parser.add_argument("-k", "--filter", help="regular expression selecting benchmarks by name")
+    parser.add_argument("-r", "--repeat", type=int, default=15, help="samples per benchmark (default 15)")
+    parser.add_argument("--save", metavar="PATH", help="write the results as a new baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare the results with a saved baseline")
+    parser.add_argument("--threshold", type=float, default=1.10,
+                        help="median slowdown ratio that counts as a regression (default 1.10)")
+    parser.add_argument("--alpha", type=float, default=0.01,
+                        help="significance level of the slowdown test (default 0.01)")
+    parser.add_argument("--list", action="store_true", help="list the selected benchmarks and exit")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for bench in harness.benchmarks(args.filter):
+            print(bench.name)
+        return 0
+
+    items = {bench.name: bench.items for bench in harness.benchmarks(args.filter)}
+
+    def report(name, samples):
+        line = f"{name:<36} {median(samples) * 1e6:12.2f}us"
+        if items[name]:
+            line += f" {items[name] / median(samples):12.0f} items/s"
+        print(line, flush=True)
+
+    results = harness.run(args.filter, args.repeat, report)
+    if args.save:
+        harness.save_baseline(results, args.save)
+    if args.compare:
+        comparisons = harness.compare(harness.load_baseline(args.compare), results, args.threshold, args.alpha)
+        print()
+        print(f"{'benchmark':<36} {'baseline':>14} {'current':>14} {'ratio':>8}")
+        for comparison in comparisons:
+            print(comparison)
+        regressions = [c.name for c in comparisons if c.regression]
+        if regressions:
+            print(f"\n{len(regressions)} significant regression(s): {', '.join(regressions)}")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,78 @@
+from rational import Rational
+from complex import Complex
+import random
+
+
+def random_int(rng: random.Random, bits: int) -> int:
+    """
+    Draws a signed integer whose absolute value has exactly the given bit length.
+
+    :param rng: The random generator to draw from.
+    :param bits: The bit length of the absolute value; at least 1.
+    :return: The integer.
+    """
+    value = rng.getrandbits(bits - 1) | (1 << (bits - 1)) if bits > 1 else 1
+    return -value if rng.random() < 0.5 else value
+
+
+def random_rational(rng: random.Random, bits: int) -> Rational:
+    """
+    Draws a rational number whose numerator and denominator are drawn with the given bit length.
+
+    Normalization may shorten both by the bits of their common factor, which is
+    small for random operands.
+
+    :param rng: The random generator to draw from.
+    :param bits: The bit length of the drawn numerator and denominator.
+    :return: The rational number.
+    """
+    return Rational(random_int(rng, bits), abs(random_int(rng, bits)))
+
+
+def random_complex(rng: random.Random, bits: int) -> Complex:
+    """
+    Draws a complex number whose parts are random rationals of the given bit size.
+
+    :param rng: The random generator to draw from.
+    :param bits: The bit length of every drawn numerator and denominator.
+    :return: The complex number.
+    """
+    return Complex(random_rational(rng, bits), random_rational(rng, bits))
+
+
+def rationals(seed: int, bits: int, n: int) -> list[Rational]:
+    """
+    Returns n reproducible random rationals of the given bit size.
+
+    :param seed: The seed; the same seed always yields the same values.
+    :param bits: The bit length of every numerator and denominator.
+    :param n: The number of values.
+    :return: The values.
+    """
+    rng = random.Random(seed)
+    return [random_rational(rng, bits) for _ in range(n)]
+
+
+def complexes(seed: int, bits: int, n: int) -> list[Complex]:
+    """
+    Returns n reproducible random complex numbers of the given bit size.
+
+    :param seed: The seed; the same seed always yields the same values.
+    :param bits: The bit length of every numerator and denominator.
+    :param n: The number of values.
+    :return: The values.
+    """
+    rng = random.Random(seed)
+    return [random_complex(rng, bits) for _ in range(n)]
+
+
+def floats(seed: int, n: int) -> list[float]:
+    """
+    Returns n reproducible random floats spread over many binary exponents.
+
+    :param seed: The seed; the same seed always yields the same values.
+    :param n: The number of values.
+    :return: The values.
+    """
+    rng = random.Random(seed)
+    return [rng.uniform(-1, 1) * 2.0 ** rng.randint(-30, 30) for _ in range(n)]
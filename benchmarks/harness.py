@@ -0,0 +1,215 @@
+from statistics import NormalDist, median
+import json
+import platform
+import re
+import sys
+import time
+
+# Registered benchmarks by name, in registration order.
+_registry = {}
+
+# Every sample times enough calls to take at least this long, so timer resolution is negligible.
+_MIN_SAMPLE_TIME = 0.01
+
+
+class Benchmark:
+    """
+    A named workload: setup() builds the inputs once and returns the function to time.
+
+    items, if set, is the number of items (e.g. parsed lines) one call processes, so
+    a throughput can be reported next to the time per call.
+    """
+    __slots__ = ('name', 'setup', 'items')
+
+    def __init__(self, name: str, setup, items: int|None = None):
+        self.name = name
+        self.setup = setup
+        self.items = items
+
+
+def benchmark(name: str, items: int|None = None):
+    """
+    Registers the decorated setup function as a benchmark.
+
+    :param name: The unique benchmark name, e.g. "rational.add[64]".
+    :param items: The number of items one call processes, for throughput reports.
+    :raises ValueError: If the name is already registered.
+    :return: The decorator; it returns the setup function unchanged.
+    """
+    def register(setup):
+        if name in _registry:
+            raise ValueError(f"Benchmark {name!r} is already registered")
+        _registry[name] = Benchmark(name, setup, items)
+        return setup
+    return register
+
+
+def benchmarks(pattern: str|None = None) -> list[Benchmark]:
+    """
+    Returns the registered benchmarks whose name matches pattern.
+
+    :param pattern: A regular expression searched in each name; None selects all.
+    :return: The matching benchmarks in registration order.
+    """
+    if pattern is None:
+        return list(_registry.values())
+    regex = re.compile(pattern)
+    return [bench for bench in _registry.values() if regex.search(bench.name)]
+
+
+def measure(bench: Benchmark, repeat: int = 15) -> list[float]:
+    """
+    Times a benchmark.
+
+    The number of calls per sample is calibrated once so that every sample takes
+    at least _MIN_SAMPLE_TIME; each sample is the mean time of one call.
+
+    :param bench: The benchmark to time.
+    :param repeat: The number of samples.
+    :return: The per-call times in seconds, one per sample.
+    """
+    fn = bench.setup()
+    fn()
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        elapsed = time.perf_counter() - start
+        if elapsed >= _MIN_SAMPLE_TIME:
+            break
+        number *= 2 if elapsed * 10 > _MIN_SAMPLE_TIME else 10
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        samples.append((time.perf_counter() - start) / number)
+    return samples
+
+
+def run(pattern: str|None = None, repeat: int = 15, report=None) -> dict[str, list[float]]:
+    """
+    Times every matching benchmark.
+
+    :param pattern: A regular expression selecting benchmarks by name; None runs all.
+    :param repeat: The number of samples per benchmark.
+    :param report: Called with (name, samples) after each benchmark, if given.
+    :return: The samples per benchmark name.
+    """
+    results = {}
+    for bench in benchmarks(pattern):
+        results[bench.name] = measure(bench, repeat)
+        if report is not None:
+            report(bench.name, results[bench.name])
+    return results
+
+
+def save_baseline(results: dict[str, list[float]], path):
+    """
+    Writes results to a JSON baseline file, together with the interpreter and machine.
+
+    :param results: The samples per benchmark name, as returned by run().
+    :param path: The file to write.
+    """
+    data = {
+        "python": sys.version,
+        "machine": platform.platform(),
+        "results": results,
+    }
+    with open(path, "w") as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+
+
+def load_baseline(path) -> dict[str, list[float]]:
+    """
+    Reads the samples per benchmark name from a JSON baseline file.
+
+    :param path: The file written by save_baseline().
+    :return: The samples per benchmark name.
+    """
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def _slower_p_value(base: list[float], current: list[float]) -> float:
+    """
+    One-sided Mann-Whitney U test that current samples tend to be larger than base.
+
+    Uses the normal approximation with tie correction, which is accurate for the
+    usual 10+ samples per side.
+
+    :param base: The baseline samples.
+    :param current: The new samples.
+    :return: The p-value; small values mean current is significantly slower.
+    """
+    n1, n2 = len(base), len(current)
+    pooled = sorted([(x, 0) for x in base] + [(x, 1) for x in current])
+    # Average ranks over ties.
+    ranks = [0.0] * len(pooled)
+    tie_term = 0
+    i = 0
+    while i < len(pooled):
+        j = i
+        while j + 1 < len(pooled) and pooled[j + 1][0] == pooled[i][0]:
+            j += 1
+        for k in range(i, j + 1):
+            ranks[k] = (i + j) / 2 + 1
+        t = j - i + 1
+        tie_term += t ** 3 - t
+        i = j + 1
+    u = sum(rank for rank, (_, side) in zip(ranks, pooled) if side == 1) - n2 * (n2 + 1) / 2
+    n = n1 + n2
+    variance = n1 * n2 / 12 * ((n + 1) - tie_term / (n * (n - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n1 * n2 / 2 - 0.5) / variance ** 0.5
+    return 1 - NormalDist().cdf(z)
+
+
+class Comparison:
+    """
+    The result of comparing one benchmark against its baseline.
+
+    A regression is flagged only when the median slowed down by more than the
+    threshold and the slowdown is statistically significant.
+    """
+    __slots__ = ('name', 'base', 'current', 'ratio', 'p_value', 'regression')
+
+    def __init__(self, name: str, base: float, current: float, p_value: float, regression: bool):
+        self.name = name
+        self.base = base
+        self.current = current
+        self.ratio = current / base
+        self.p_value = p_value
+        self.regression = regression
+
+    def __str__(self) -> str:
+        flag = "  REGRESSION" if self.regression else ""
+        return (f"{self.name:<36} {self.base * 1e6:12.2f}us {self.current * 1e6:12.2f}us "
+                f"{self.ratio:7.3f}x  p={self.p_value:.4f}{flag}")
+
+
+def compare(baseline: dict[str, list[float]], results: dict[str, list[float]],
+            threshold: float = 1.10, alpha: float = 0.01) -> list[Comparison]:
+    """
+    Compares new results with a baseline, benchmark by benchmark.
+
+    Benchmarks missing from either side are skipped.
+
+    :param baseline: The baseline samples per benchmark name.
+    :param results: The new samples per benchmark name.
+    :param threshold: The smallest median ratio current/base that counts as a slowdown.
+    :param alpha: The significance level of the one-sided Mann-Whitney U test.
+    :return: One Comparison per benchmark present on both sides.
+    """
+    comparisons = []
+    for name, current in results.items():
+        base = baseline.get(name)
+        if not base or not current:
+            continue
+        base_median, current_median = median(base), median(current)
+        p_value = _slower_p_value(base, current)
+        regression = current_median > threshold * base_median and p_value < alpha
+        comparisons.append(Comparison(name, base_median, current_median, p_value, regression))
+    return comparisons
@@ -0,0 +1,159 @@
+from rational import Rational
+from complex import Complex
+from matrix import RationalMatrix, ComplexMatrix
+from polynomial import Polynomial
+from accumulator import RationalAccumulator, ComplexAccumulator
+from lazy_rational import LazyRational
+from parsing import iter_parse, parse_array
+from benchmarks.harness import benchmark
+from benchmarks.generators import rationals, complexes
+
+
+@benchmark("macro.sum_loop[64]")
+def _sum_loop():
+    # The running denominator grows to the lcm of all addends, so this stays short.
+    values = rationals(10, 64, 200)
+    def run():
+        total = Rational(0, 1)
+        for value in values:
+            total += value
+        return total
+    return run
+
+
+@benchmark("macro.rational_sum[64]")
+def _rational_sum():
+    values = rationals(10, 64, 2000)
+    return lambda: Rational.sum(values)
+
+
+@benchmark("macro.complex_sum[64]")
+def _complex_sum():
+    values = complexes(11, 64, 2000)
+    return lambda: Complex.sum(values)
+
+
+@benchmark("macro.accumulate[64]")
+def _accumulate():
+    values = rationals(10, 64, 2000)
+    def run():
+        acc = RationalAccumulator()
+        acc.extend(values)
+        return acc.value()
+    return run
+
+
+@benchmark("macro.complex_accumulate[64]")
+def _complex_accumulate():
+    values = complexes(11, 64, 2000)
+    def run():
+        acc = ComplexAccumulator()
+        acc.extend(values)
+        return acc.value()
+    return run
+
+
+def _chain_values():
+    # Small denominators, so most of the eager cost is the gcd run after every step.
+    values = rationals(16, 8, 3000)
+    return [values[i:i + 3] for i in range(0, len(values), 3)]
+
+
+@benchmark("macro.rational_chain[1000]")
+def _rational_chain():
+    steps = _chain_values()
+    def run():
+        acc = Rational(0, 1)
+        for a, b, c in steps:
+            acc = acc + a * b - c
+        return acc
+    return run
+
+
+@benchmark("macro.lazy_chain[1000]")
+def _lazy_chain():
+    steps = [(LazyRational.from_rational(a), b, c) for a, b, c in _chain_values()]
+    def run():
+        acc = LazyRational(0)
+        for a, b, c in steps:
+            acc = acc + a * b - c
+        return acc.to_rational()
+    return run
+
+
+@benchmark("macro.harmonic[500]")
+def _harmonic():
+    values = [Rational(1, k) for k in range(1, 501)]
+    def run():
+        total = Rational(0, 1)
+        for value in values:
+            total = total + value
+        return total
+    return run
+
+
+@benchmark("macro.rational_solve[12x12]")
+def _rational_solve():
+    values = rationals(12, 32, 12 * 13)
+    m = RationalMatrix([values[i * 12:(i + 1) * 12] for i in range(12)])
+    b = values[144:]
+    return lambda: m.solve(b)
+
+
+@benchmark("macro.complex_det[8x8]")
+def _complex_det():
+    values = complexes(13, 32, 64)
+    m = ComplexMatrix([values[i * 8:(i + 1) * 8] for i in range(8)])
+    return m.det
+
+
+@benchmark("macro.polynomial_eval[deg 40]")
+def _polynomial_eval():
+    p = Polynomial(complexes(14, 32, 41))
+    points = complexes(15, 16, 20)
+    return lambda: [p(x) for x in points]
+
+
+@benchmark("macro.newton_sqrt2[6]")
+def _newton_sqrt2():
+    def run():
+        x = Rational(1, 1)
+        for _ in range(6):
+            x = (x + 2 / x) / 2
+        return x
+    return run
+
+
+@benchmark("macro.complex_power_series[30]")
+def _complex_power_series():
+    z = Complex(Rational(1, 3), Rational(-2, 7))
+    def run():
+        total = Complex(0, 0)
+        term = Complex(1, 0)
+        for k in range(1, 31):
+            total += term
+            term = term * z / k
+        return total
+    return run
+
+
+# Lines per call of the bulk parser benchmarks; throughput is reported in lines/s.
+PARSE_LINES = 20000
+
+
+@benchmark(f"macro.parse_array[rational {PARSE_LINES}]", items=PARSE_LINES)
+def _parse_array_rational():
+    lines = [f"{value}\n" for value in rationals(17, 32, PARSE_LINES)]
+    return lambda: parse_array(lines)
+
+
+@benchmark(f"macro.parse_array[complex {PARSE_LINES}]", items=PARSE_LINES)
+def _parse_array_complex():
+    lines = [f"{value}\n" for value in complexes(18, 32, PARSE_LINES)]
+    return lambda: parse_array(lines, Complex)
+
+
+@benchmark(f"macro.iter_parse[rational {PARSE_LINES}]", items=PARSE_LINES)
+def _iter_parse_rational():
+    lines = [f"{value}\n" for value in rationals(19, 32, PARSE_LINES)]
+    return lambda: sum(1 for _ in iter_parse(lines))
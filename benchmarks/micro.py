@@ -0,0 +1,87 @@
+from rational import Rational
+from complex import Complex
+from benchmarks.harness import benchmark
+from benchmarks.generators import random_int, rationals, complexes, floats
+import random
+
+# Bit sizes of the generated numerators and denominators.
+BITS = (64, 512, 2048)
+# Operands per call; every benchmark call loops over this many values.
+N = 50
+
+
+def _register_binary(name: str, make_values, op):
+    for bits in BITS:
+        def setup(bits=bits):
+            xs = make_values(1, bits, N)
+            ys = make_values(2, bits, N)
+            pairs = list(zip(xs, ys))
+            return lambda: [op(x, y) for x, y in pairs]
+        benchmark(f"{name}[{bits}]")(setup)
+
+
+def _register_unary(name: str, make_values, op):
+    for bits in BITS:
+        def setup(bits=bits):
+            xs = make_values(3, bits, N)
+            return lambda: [op(x) for x in xs]
+        benchmark(f"{name}[{bits}]")(setup)
+
+
+def _rational_init():
+    for bits in BITS:
+        def setup(bits=bits):
+            rng = random.Random(4)
+            # Share a factor so the constructor's gcd does real work.
+            pairs = []
+            for _ in range(N):
+                common = abs(random_int(rng, bits // 2))
+                pairs.append((random_int(rng, bits) * common, abs(random_int(rng, bits)) * common))
+            return lambda: [Rational(num, den) for num, den in pairs]
+        benchmark(f"rational.init[{bits}]")(setup)
+
+
+_rational_init()
+_register_binary("rational.add", rationals, lambda x, y: x + y)
+_register_binary("rational.sub", rationals, lambda x, y: x - y)
+_register_binary("rational.mul", rationals, lambda x, y: x * y)
+_register_binary("rational.truediv", rationals, lambda x, y: x / y)
+_register_binary("rational.lt", rationals, lambda x, y: x < y)
+_register_unary("rational.pow5", rationals, lambda x: x ** 5)
+_register_unary("rational.hash", rationals, lambda x: hash(Rational._make(x.num, x.den)))
+_register_binary("complex.add", complexes, lambda x, y: x + y)
+_register_binary("complex.mul", complexes, lambda x, y: x * y)
+_register_binary("complex.truediv", complexes, lambda x, y: x / y)
+_register_unary("complex.pow3", complexes, lambda x: x ** 3)
+
+
+@benchmark("rational.float_to_rational")
+def _float_to_rational():
+    values = floats(5, N)
+    return lambda: [Rational.float_to_rational(x) for x in values]
+
+
+@benchmark("rational.from_float")
+def _from_float():
+    values = floats(5, N)
+    return lambda: [Rational.from_float(x) for x in values]
+
+
+@benchmark("complex.parse")
+def _complex_parse():
+    texts = [str(c) for c in complexes(6, 64, N)]
+    return lambda: [Complex.parse(text) for text in texts]
+
+
+@benchmark("rational.root[degree 10007]")
+def _root_large_degree():
+    perfect = Rational(3**10007, 7**10007)
+    near = Rational(3**10007 + 1, 1)
+
+    def run():
+        Rational.root(perfect, 10007)
+        try:
+            Rational.root(near, 10007)
+        except ValueError:
+            pass
+    return run
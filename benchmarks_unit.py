@@ -0,0 +1,85 @@
+import unittest
+import os
+import random
+import tempfile
+from rational import Rational
+from complex import Complex
+from benchmarks import generators, harness
+
+class TestGenerators(unittest.TestCase):
+
+    def test_random_int_bits(self):
+        rng = random.Random(1)
+        for bits in (1, 2, 64, 513):
+            for _ in range(20):
+                self.assertEqual(abs(generators.random_int(rng, bits)).bit_length(), bits)
+
+    def test_seeded(self):
+        self.assertEqual(generators.rationals(3, 128, 10), generators.rationals(3, 128, 10))
+        self.assertEqual(generators.complexes(3, 32, 5), generators.complexes(3, 32, 5))
+        self.assertNotEqual(generators.rationals(3, 128, 10), generators.rationals(4, 128, 10))
+        self.assertEqual(generators.floats(7, 4), generators.floats(7, 4))
+
+    def test_types(self):
+        self.assertTrue(all(type(x) is Rational for x in generators.rationals(1, 16, 5)))
+        self.assertTrue(all(type(x) is Complex for x in generators.complexes(1, 16, 5)))
+
+
+class TestHarness(unittest.TestCase):
+
+    def test_measure(self):
+        bench = harness.Benchmark("noop", lambda: (lambda: None))
+        samples = harness.measure(bench, repeat=3)
+        self.assertEqual(len(samples), 3)
+        self.assertTrue(all(s >= 0 for s in samples))
+
+    def test_registry(self):
+        import benchmarks.micro
+        import benchmarks.macro
+        names = [bench.name for bench in harness.benchmarks(r"^rational\.add\[")]
+        self.assertEqual(names, ["rational.add[64]", "rational.add[512]", "rational.add[2048]"])
+        self.assertTrue(harness.benchmarks("^macro\\."))
+        with self.assertRaises(ValueError):
+            harness.benchmark("rational.add[64]")(lambda: None)
+
+    def test_parse_throughput_registered(self):
+        import benchmarks.macro
+        parsers = harness.benchmarks(r"^macro\.(parse_array|iter_parse)\[")
+        self.assertEqual(len(parsers), 3)
+        self.assertTrue(all(bench.items == benchmarks.macro.PARSE_LINES for bench in parsers))
+        self.assertIsNone(harness.benchmarks(r"^macro\.sum_loop\[")[0].items)
+
+    def test_compare_flags_slowdown(self):
+        rng = random.Random(2)
+        base = [1.0 + rng.random() * 0.01 for _ in range(15)]
+        slower = [1.3 + rng.random() * 0.01 for _ in range(15)]
+        same = [1.0 + rng.random() * 0.01 for _ in range(15)]
+        faster = [0.7 + rng.random() * 0.01 for _ in range(15)]
+        baseline = {"a": base, "b": base, "c": base, "only_base": base}
+        results = {"a": slower, "b": same, "c": faster, "only_new": same}
+        comparisons = {c.name: c for c in harness.compare(baseline, results)}
+        self.assertEqual(set(comparisons), {"a", "b", "c"})
+        self.assertTrue(comparisons["a"].regression)
+        self.assertFalse(comparisons["b"].regression)
+        self.assertFalse(comparisons["c"].regression)
+        self.assertLess(comparisons["a"].p_value, 0.001)
+
+    def test_compare_ignores_small_slowdown(self):
+        base = [1.0] * 10
+        slightly = [1.02] * 10
+        [comparison] = harness.compare({"a": base}, {"a": slightly})
+        self.assertFalse(comparison.regression)
+
+    def test_baseline_round_trip(self):
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            results = {"a": [1.0, 2.0], "b": [0.5]}
+            harness.save_baseline(results, path)
+            self.assertEqual(harness.load_baseline(path), results)
+        finally:
+            os.remove(path)
+
+
+if __name__ == '__main__':
+    unittest.main()
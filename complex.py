@@ -1,132 +1,546 @@
-from rational import Rational
+from rational import Rational, _widening, _restore
+from decimal import Decimal
+from fractions import Fraction
+from operator import attrgetter
+import decimal
 import math
+import sys
+
+_HASH_IMAG = sys.hash_info.imag
+_HASH_BITS = sys.hash_info.width
+
+# Parts whose binary exponent stays inside this range convert to float directly.
+_FLOAT_EXP_LIMIT = 1000
+_GUARD_DIGITS = 10
+
+# Interning of small Gaussian integers is off while _intern_limit is 0.
+_intern_limit = 0
+_interned = {}
 
 class Complex:
+    """An immutable complex number Re + Im*i with Rational parts.
+
+    Augmented assignment rebinds the name to a new value, as it does for the
+    builtin complex, so instances can be shared freely. The hash, abs(), arg() and
+    the squared norm are computed on first use and cached.
+    """
+    # _abs, _arg and _norm are cache slots left unset until first use, so
+    # construction does not pay for them.
+    __slots__ = ('_Re', '_Im', '_hash', '_abs', '_arg', '_norm')
+
+    # How float parts are converted: "decimal" rounds to 10 digits (Rational.float_to_rational),
+    # "exact" keeps the binary value, "limit" takes the closest rational with den <= float_max_den.
+    float_mode = "decimal"
+    float_max_den = 1000000
+
     def __init__(self, Re : Rational|int|float, Im : Rational|int|float):
-        self.Re = Re
-        self.Im = Im
+        self._Re = Complex._part(Re, "Re")
+        self._Im = Complex._part(Im, "Im")
+        self._hash = None
+
+    @classmethod
+    def _make(cls, Re: Rational, Im: Rational) -> 'Complex':
+        """Builds a complex number from two Rational parts without revalidation.
+
+        :param Re: The real part, already a Rational.
+        :param Im: The imaginary part, already a Rational.
+        :return: The complex number Re + Im*i.
+        """
+        if _intern_limit and Re.den == 1 and Im.den == 1 \
+                and -_intern_limit <= Re.num <= _intern_limit and -_intern_limit <= Im.num <= _intern_limit:
+            key = (Re.num, Im.num)
+            obj = _interned.get(key)
+            if obj is None:
+                obj = object.__new__(cls)
+                obj._Re = Re
+                obj._Im = Im
+                obj._hash = None
+                _interned[key] = obj
+            return obj
+        obj = object.__new__(cls)
+        obj._Re = Re
+        obj._Im = Im
+        obj._hash = None
+        return obj
+
+    @staticmethod
+    def enable_interning(limit: int = 16):
+        """Turns on the interning cache for small Gaussian integers.
+
+        While enabled, every result of Complex arithmetic whose parts are integers
+        with absolute value <= limit is shared instead of allocated anew.
+
+        :param limit: The largest absolute value of an interned real or imaginary part.
+        :raises ValueError: If limit is not positive.
+        """
+        global _intern_limit
+        if limit <= 0:
+            raise ValueError("limit must be a positive integer")
+        Complex.disable_interning()
+        _intern_limit = limit
+
+    @staticmethod
+    def disable_interning():
+        """Turns off the interning cache and drops all interned values."""
+        global _intern_limit
+        _intern_limit = 0
+        _interned.clear()
+
+    @staticmethod
+    def _from_float(value: float) -> Rational:
+        """Converts a float part according to Complex.float_mode.
+
+        :param value: The float to convert.
+        :raises ValueError: If float_mode is not "decimal", "exact" or "limit".
+        :return: The converted Rational.
+        """
+        if Complex.float_mode == "decimal":
+            return Rational.float_to_rational(value)
+        elif Complex.float_mode == "exact":
+            return Rational.from_float(value)
+        elif Complex.float_mode == "limit":
+            return Rational.from_float(value, Complex.float_max_den)
+        else:
+            raise ValueError(f"Unknown float conversion mode {Complex.float_mode!r}")
+
+    @staticmethod
+    def _part(value, name: str) -> Rational:
+        if type(value) is Rational:
+            return value
+        elif type(value) is int:
+            return Rational._make(value, 1)
+        elif type(value) is float:
+            return Complex._from_float(value)
+        else:
+            raise TypeError(f"{name} must be a Rational/int/float")
 
     @property
     def Re(self):
         return self._Re
-    
-    @Re.setter
-    def Re(self, Re):
-        if type(Re) is Rational:
-            self._Re = Re
-        elif type(Re) is int:
-            self._Re = Rational(Re, 1)
-        elif type(Re) is float:
-            self._Re = Rational.float_to_rational(Re)
-        else:
-            raise TypeError("Re must be a Rational/int/float")
-        
+
     @property
     def Im(self):
         return self._Im
-    
-    @Im.setter
-    def Im(self, Im):
-        if type(Im) is Rational:
-            self._Im = Im
-        elif type(Im) is int:
-            self._Im = Rational(Im, 1)
-        elif type(Im) is float:
-            self._Im = Rational.float_to_rational(Im)
-        else:
-            raise TypeError("Im must be a Rational/int/float")
 
     def __add__(self, other):
+        # Same-type operands skip the dispatch table; every other type is one lookup.
         if type(other) is Complex:
-            return Complex(self.Re + other.Re, self.Im + other.Im)
-        elif type(other) in (Rational, int):
-            return Complex(self.Re + other, self.Im)
-        else:
-            raise TypeError("Cannot add Complex and " + type(other))
+            return Complex._make(self._Re + other._Re, self._Im + other._Im)
+        parts = _operand_parts.get(type(other))
+        if parts is None:
+            return NotImplemented
+        re, im = parts(other)
+        return Complex._make(self._Re + re, self._Im if im is None else self._Im + im)
+
+    __radd__ = __add__
 
     def __sub__(self, other):
-        return self.__add__(-other)
+        if type(other) is Complex:
+            return Complex._make(self._Re - other._Re, self._Im - other._Im)
+        parts = _operand_parts.get(type(other))
+        if parts is None:
+            return NotImplemented
+        re, im = parts(other)
+        return Complex._make(self._Re - re, self._Im if im is None else self._Im - im)
+
+    def __rsub__(self, other):
+        parts = _operand_parts.get(type(other))
+        if parts is None:
+            return NotImplemented
+        re, im = parts(other)
+        return Complex._make(re - self._Re, -self._Im if im is None else im - self._Im)
     
     def __neg__(self):
-        return Complex(-self.Re, -self.Im)
+        return Complex._make(-self._Re, -self._Im)
     
     def __mul__(self, other):
         if type(other) is Complex:
-            return Complex(self.Re * other.Re - self.Im * other.Im, self.Re * other.Im + self.Im * other.Re)
-        elif type(other) in (Rational, int):
-            return Complex(self.Re * other, self.Im * other)
+            re, im = other._Re, other._Im
         else:
-            raise TypeError("Cannot multiply Complex and " + type(other))
+            parts = _operand_parts.get(type(other))
+            if parts is None:
+                return NotImplemented
+            re, im = parts(other)
+            if im is None:
+                return Complex._make(self._Re * re, self._Im * re)
+        return Complex._make(self._Re * re - self._Im * im, self._Re * im + self._Im * re)
+
+    __rmul__ = __mul__
+
+    def _div(self, re, im) -> 'Complex':
+        """Divides by re + im*i, where im is None for a real divisor.
+
+        :param re: The real part of the divisor (Rational, or an int/Fraction when im is None).
+        :param im: The imaginary part of the divisor, or None.
+        :raises ZeroDivisionError: If the divisor is zero.
+        :return: The quotient.
+        """
+        if im is None or not im._num:
+            if re == 0:
+                raise ZeroDivisionError("Cannot divide by zero")
+            return Complex._make(self._Re / re, self._Im / re)
+        norm = re * re + im * im
+        return Complex._make((self._Re * re + self._Im * im) / norm,
+                             (self._Im * re - self._Re * im) / norm)
     
     def __truediv__(self, other):
         if type(other) is Complex:
-            if other.Re == 0 and other.Im == 0:
-                raise ZeroDivisionError("Cannot divide by zero")
-            return Complex(((self.Re*other.Re+self.Im*other.Im)/(other.Re**2 + other.Im**2)),\
-                            ((self.Im*other.Re-self.Re*other.Im)/(other.Re**2 + other.Im**2)))
-        elif type(other) in (Rational, int):
-            if other == 0:
-                raise ZeroDivisionError("Cannot divide by zero")
-            return Complex(self.Re / other, self.Im / other)
-        else:
-            raise TypeError("Cannot divide Complex and " + type(other))
+            return self._div(other._Re, other._Im)
+        parts = _operand_parts.get(type(other))
+        if parts is None:
+            return NotImplemented
+        return self._div(*parts(other))
+
+    def __rtruediv__(self, other):
+        parts = _operand_parts.get(type(other))
+        if parts is None:
+            return NotImplemented
+        re, im = parts(other)
+        if im is not None:
+            return Complex._make(re, im)._div(self._Re, self._Im)
+        if not self._Re._num and not self._Im._num:
+            raise ZeroDivisionError("Cannot divide by zero")
+        norm = self._Re * self._Re + self._Im * self._Im
+        return Complex._make(self._Re * re / norm, -self._Im * re / norm)
         
     def __eq__(self, other):
         if type(other) is Complex:
-            return self.Re == other.Re and self.Im == other.Im
-        elif type(other) in (Rational, int):
-            return self.Re == other and self.Im == 0
+            return self._Re == other._Re and self._Im == other._Im
+        elif type(other) is complex:
+            return self._Re == other.real and self._Im == other.imag
+        elif type(other) in (Rational, int, Fraction, float):
+            # Real operands compare exactly, floats included.
+            return not self._Im._num and self._Re == other
         else:
-            return False
+            return NotImplemented
 
-    def __iadd__(self, other):
-        self.__dict__ = self.__add__(other).__dict__
-        return self
+    def __hash__(self):
+        # Same combination as the builtin complex, so Complex(a, 0) hashes like a.
+        result = self._hash
+        if result is None:
+            self._hash = result = _hash_complex(hash(self._Re), hash(self._Im))
+        return result
 
-    def __imul__(self, other):
-        self.__dict__ = self.__mul__(other).__dict__
-        return self
+    def _scaled_parts(self) -> tuple[float, float, int]:
+        """Converts both parts to floats after a common power-of-two scaling.
 
-    def __isub__(self, other):
-        self.__iadd__(-other)
-        return self
+        The scaling keeps the larger part near 1 whenever a part would not fit in a
+        float on its own, so huge numerators or denominators never overflow.
 
-    def __itruediv__(self, other):
-        self.__dict__ = self.__truediv__(other).__dict__
-        return self
+        :return: (re, im, shift) such that Re ~ re * 2**shift and Im ~ im * 2**shift.
+        """
+        exponents = [part.num.bit_length() - part.den.bit_length()
+                     for part in (self._Re, self._Im) if part.num != 0]
+        shift = max(exponents) if exponents else 0
+        if -_FLOAT_EXP_LIMIT < shift < _FLOAT_EXP_LIMIT:
+            return self._Re.num / self._Re.den, self._Im.num / self._Im.den, 0
+
+        def scaled(part: Rational) -> float:
+            if shift > 0:
+                return part.num / (part.den << shift)
+            return (part.num << -shift) / part.den
 
+        return scaled(self._Re), scaled(self._Im), shift
 
-    def abs(self):
+    def abs(self, prec: int|None = None):
         """Calculates the modulus (absolute value) of the complex number.
 
+        Without prec the result is a float computed with math.hypot on scaled parts,
+        so it works for parts of any bit size as long as the modulus itself fits in
+        a float. With prec the result is a decimal.Decimal correctly rounded to prec
+        significant digits: the integer square root of the exact squared modulus is
+        taken with extra digits and rounded only once.
+
+        :param prec: Optional number of significant digits for a Decimal result.
+        :raises OverflowError: If the modulus is too large for a float.
         :return: The modulus of the complex number.
         """
-        num = self.Re**2 + self.Im**2
-        return math.sqrt(num.num/num.den)
+        if prec is not None:
+            norm = self.norm()
+            num, den = norm.num, norm.den
+            # Scales by 10**(2*k) so the integer root has at least prec + 1 digits.
+            k = prec + 3 - (num.bit_length() - den.bit_length()) * 3 // 20
+            if k >= 0:
+                num *= 10 ** (2 * k)
+            else:
+                den *= 10 ** (-2 * k)
+            root = math.isqrt(num // den)
+            if root * root * den != num:
+                # A trailing 1 stands for the discarded remainder, so rounding it is exact.
+                root, k = root * 10 + 1, k + 1
+            else:
+                while k > 0 and root % 10 == 0:
+                    root, k = root // 10, k - 1
+            with Complex._decimal_context(prec):
+                return +Decimal(f"{root}E{-k}")
 
-    def arg(self):
+        try:
+            return self._abs
+        except AttributeError:
+            pass
+        re, im, shift = self._scaled_parts()
+        try:
+            self._abs = result = math.ldexp(math.hypot(re, im), shift)
+        except OverflowError:
+            raise OverflowError("The modulus is too large for a float, pass prec for a Decimal result")
+        return result
+
+    def arg(self, prec: int|None = None):
         """Calculates the argument (phase) of the complex number in radians.
 
+        Without prec the result is a float from math.atan2 on commonly scaled parts,
+        which is exact in direction for parts of any bit size. With prec the result
+        is a decimal.Decimal with prec significant digits, computed with guard digits
+        and rounded again, so it is within one unit in the last digit.
+
+        :param prec: Optional number of significant digits for a Decimal result.
         :return: The argument (phase) of the complex number.
         """
-        Re = self.Re.num/self.Re.den
-        Im = self.Im.num/self.Im.den
-        return math.atan2(Im, Re)
+        if prec is not None:
+            with Complex._decimal_context(prec + _GUARD_DIGITS):
+                if self._Re == 0:
+                    if self._Im == 0:
+                        result = Decimal(0)
+                    else:
+                        result = Complex._decimal_pi() / 2 * Rational.sign(self._Im.num)
+                else:
+                    ratio = self._Im / self._Re
+                    result = Complex._decimal_atan(Decimal(ratio.num) / Decimal(ratio.den))
+                    if self._Re.num < 0:
+                        result += Complex._decimal_pi() * (1 if self._Im.num >= 0 else -1)
+            with Complex._decimal_context(prec):
+                return +result
+
+        try:
+            return self._arg
+        except AttributeError:
+            re, im, _ = self._scaled_parts()
+            self._arg = result = math.atan2(im, re)
+            return result
+
+    def norm(self) -> Rational:
+        """Calculates the exact squared modulus Re**2 + Im**2.
+
+        :return: The squared modulus.
+        """
+        try:
+            return self._norm
+        except AttributeError:
+            self._norm = result = self._Re * self._Re + self._Im * self._Im
+            return result
 
-    def __pow__(self, n: int):
+    @staticmethod
+    def _decimal_context(prec: int):
+        context = decimal.Context(prec=prec, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+        return decimal.localcontext(context)
+
+    @staticmethod
+    def _decimal_atan(x: Decimal) -> Decimal:
+        """Calculates atan(x) in the current decimal context.
+
+        The argument is halved with atan(x) = 2*atan(x / (1 + sqrt(1 + x*x))) until
+        it is small, then the Taylor series is summed.
+
+        :param x: The argument.
+        :return: atan(x) to the current context precision.
+        """
+        if x < 0:
+            return -Complex._decimal_atan(-x)
+        halvings = 0
+        while x > Decimal("0.1"):
+            x = x / (1 + (1 + x * x).sqrt())
+            halvings += 1
+
+        eps = Decimal(10) ** (-decimal.getcontext().prec - 2)
+        x_squared = x * x
+        term = x
+        result = x
+        k = 1
+        while abs(term) > eps * abs(result):
+            term = -term * x_squared
+            result += term / (2 * k + 1)
+            k += 1
+        return result * (1 << halvings)
+
+    @staticmethod
+    def _decimal_pi() -> Decimal:
+        return 4 * Complex._decimal_atan(Decimal(1))
+
+    @staticmethod
+    def _int_pow(p: int, q: int, n: int, m: int|None = None) -> tuple[int, int]:
+        """Raises the Gaussian integer p + q*i to a non-negative power by repeated squaring.
+
+        :param p: The real part.
+        :param q: The imaginary part.
+        :param n: The non-negative exponent.
+        :param m: Optional modulus applied to both parts after every step.
+        :return: The real and imaginary parts of (p + q*i)**n.
+        """
+        x, y = 1, 0
+        while n:
+            if n & 1:
+                x, y = x * p - y * q, x * q + y * p
+                if m is not None:
+                    x, y = x % m, y % m
+            n >>= 1
+            if n:
+                p, q = (p - q) * (p + q), 2 * p * q
+                if m is not None:
+                    p, q = p % m, q % m
+        return x, y
+
+    def __pow__(self, n: int, modulo: int|None = None):
         if type(n) is not int:
             raise TypeError("power should be int")
-        r = self.abs()
-        phi = self.arg()
 
-        r_n = r ** n
-        cos_n_phi = math.cos(n * phi)
-        sin_n_phi = math.sin(n * phi)
+        if modulo is not None:
+            if type(modulo) is not int:
+                raise TypeError("modulus should be int")
+            if modulo <= 0:
+                raise ValueError("modulus must be a positive integer")
+            if n < 0:
+                raise ValueError("modular power requires a non-negative exponent")
+            if self._Re.den != 1 or self._Im.den != 1:
+                raise ValueError("modular power is only defined for Gaussian integers")
+            x, y = Complex._int_pow(self._Re.num % modulo, self._Im.num % modulo, n, modulo)
+            return Complex._make(Rational._make(x % modulo, 1), Rational._make(y % modulo, 1))
+
+        # z = (p + q*i) / d with integer p, q, d, so z**n = (p + q*i)**n / d**n
+        re_den, im_den = self._Re.den, self._Im.den
+        d = re_den * im_den // math.gcd(re_den, im_den)
+        p = self._Re.num * (d // re_den)
+        q = self._Im.num * (d // im_den)
+
+        x, y = Complex._int_pow(p, q, abs(n))
+        d_n = d ** abs(n)
+        if n >= 0:
+            return Complex._make(Rational._reduced(x, d_n), Rational._reduced(y, d_n))
+
+        norm = x * x + y * y
+        if norm == 0:
+            raise ZeroDivisionError("Cannot raise zero to a negative power")
+        return Complex._make(Rational._reduced(x * d_n, norm), Rational._reduced(-y * d_n, norm))
+
+    @staticmethod
+    def _parts(value) -> tuple[int, int, int]:
+        """Returns (p, q, d) with value == (p + q*i) / d for a Complex, Rational or int term.
+
+        :param value: The term to split.
+        :raises TypeError: If value is not a Complex, Rational or int.
+        :return: The integer parts over a common denominator.
+        """
+        if type(value) is Complex:
+            re_den, im_den = value._Re.den, value._Im.den
+            d = re_den // math.gcd(re_den, im_den) * im_den
+            return value._Re.num * (d // re_den), value._Im.num * (d // im_den), d
+        elif type(value) is Rational:
+            return value.num, 0, value.den
+        elif type(value) is int:
+            return value, 0, 1
+        else:
+            raise TypeError(f"Can't sum or multiply Complex and {type(value)}")
+
+    @staticmethod
+    def sum(values) -> 'Complex':
+        """Calculates the exact sum of an iterable of complex numbers.
+
+        The real and imaginary parts are summed separately with Rational.sum.
+
+        :param values: An iterable of Complex/Rational/int terms.
+        :raises TypeError: If a term is not a Complex, Rational or int.
+        :return: The sum of the terms.
+        """
+        re_parts = []
+        im_parts = []
+        for value in values:
+            if type(value) is Complex:
+                re_parts.append(value._Re)
+                im_parts.append(value._Im)
+            elif type(value) in (Rational, int):
+                re_parts.append(value)
+            else:
+                raise TypeError(f"Can't sum or multiply Complex and {type(value)}")
+        return Complex._make(Rational.sum(re_parts), Rational.sum(im_parts))
+
+    @staticmethod
+    def prod(values) -> 'Complex':
+        """Calculates the exact product of an iterable of complex numbers.
+
+        Factors are multiplied as Gaussian integers over a common denominator in a
+        balanced tree, and the result is reduced only once at the end.
 
-        new_real = r_n * cos_n_phi
-        new_imag = r_n * sin_n_phi
+        :param values: An iterable of Complex/Rational/int factors.
+        :raises TypeError: If a factor is not a Complex, Rational or int.
+        :return: The product of the factors.
+        """
+        terms = [Complex._parts(value) for value in values]
+        if not terms:
+            return Complex(1, 0)
+        while len(terms) > 1:
+            combined = []
+            for i in range(0, len(terms) - 1, 2):
+                (p1, q1, d1), (p2, q2, d2) = terms[i], terms[i + 1]
+                combined.append((p1 * p2 - q1 * q2, p1 * q2 + q1 * p2, d1 * d2))
+            if len(terms) % 2:
+                combined.append(terms[-1])
+            terms = combined
+        p, q, d = terms[0]
+        return Complex._make(Rational._reduced(p, d), Rational._reduced(q, d))
+
+    @staticmethod
+    def parse(text: str) -> 'Complex':
+        """Parses a complex number; the exact inverse of __str__.
+
+        Accepts the __str__ forms such as "7/3", "-1/2i" and "(1/2) - 3i", plus "a+bi"
+        written without spaces, a "j" suffix, a bare "i", and decimal parts like "1.5-2.25i".
+
+        :param text: The string to parse.
+        :raises ValueError: If text is not a valid literal.
+        :return: The parsed complex number.
+        """
+        re_num, re_den, im_num, im_den = Complex._parse_parts(text)
+        return Complex._make(Rational._make(re_num, re_den), Rational._make(im_num, im_den))
+
+    @staticmethod
+    def _parse_parts(text: str) -> tuple[int, int, int, int]:
+        """Parses a complex literal into normalized (re.num, re.den, im.num, im.den).
 
-        return Complex(new_real, new_imag)
+        :param text: The string to parse.
+        :raises ValueError: If text is not a valid literal.
+        :return: The numerators and denominators of both parts.
+        """
+        try:
+            return Complex._split_parts(text)
+        except ValueError as error:
+            raise ValueError(f"Invalid complex literal {text!r}") from error
+
+    @staticmethod
+    def _split_parts(text: str) -> tuple[int, int, int, int]:
+        body = text.strip()
+        if body[-1:] not in ("i", "j"):
+            return Rational._parse_parts(body) + (0, 1)
+        body = body[:-1].replace(" ", "")
+        # The real and imaginary parts are split at the last sign that does not open
+        # the literal, follow an exponent marker, or sit inside "(" or after "/".
+        split = len(body)
+        while True:
+            split = max(body.rfind("+", 0, split), body.rfind("-", 0, split))
+            if split <= 0 or body[split - 1] not in "eE(/":
+                break
+        if split > 0:
+            re_parts = Rational._parse_parts(body[:split])
+            body = body[split:]
+        else:
+            re_parts = (0, 1)
+        if body in ("", "+", "-"):
+            im_parts = (-1 if body == "-" else 1, 1)
+        else:
+            im_parts = Rational._parse_parts(body)
+        return re_parts + im_parts
+
+    def __reduce__(self):
+        # Pickles as four plain ints; the cached hash, abs, arg and norm are left behind.
+        return _restore_complex, (self._Re._num, self._Re._den, self._Im._num, self._Im._den)
 
     def __str__(self):
         if self.Im == 0:
@@ -148,7 +562,8 @@ class Complex:
         :param digits: The number of decimal places to round the modulus and argument to.
         """
         phi = round(self.arg(), digits)
-        r = round(int(self.abs()) if (int(self.abs()) == self.abs()) else self.abs(), digits)
+        r = self.abs()
+        r = round(int(r) if int(r) == r else r, digits)
         print(f"{r}*(cos({phi}) + isin({phi}))")
     
     def print_exp_form(self, digits: int):
@@ -160,5 +575,48 @@ class Complex:
         :param digits: The number of decimal places to round the modulus and argument to.
         """
         phi = round(self.arg(), digits)
-        r = round(int(self.abs()) if (int(self.abs()) == self.abs()) else self.abs(), digits)
+        r = self.abs()
+        r = round(int(r) if int(r) == r else r, digits)
         print(f"{r}*exp({phi}i)")
+
+
+
+def _restore_complex(re_num: int, re_den: int, im_num: int, im_den: int) -> Complex:
+    """Rebuilds a pickled complex number from the normalized parts of Re and Im."""
+    obj = object.__new__(Complex)
+    obj._Re = _restore(re_num, re_den)
+    obj._Im = _restore(im_num, im_den)
+    obj._hash = None
+    return obj
+
+
+def _hash_complex(re_hash: int, im_hash: int) -> int:
+    """
+    Combines the hashes of the real and imaginary parts the way the builtin complex does.
+
+    Complex and GaussianInt both hash this way, so equal values hash alike.
+    """
+    result = (re_hash + _HASH_IMAG * im_hash) & ((1 << _HASH_BITS) - 1)
+    if result >= 1 << (_HASH_BITS - 1):
+        result -= 1 << _HASH_BITS
+    return -2 if result == -1 else result
+
+
+def _real(value) -> tuple:
+    return value, None
+
+
+# Operand dispatch: each supported type maps to a function returning its (Re, Im) parts.
+# Operators do a single lookup here instead of a chain of type tests. Real operands
+# give Im = None and keep Re as is, since Rational arithmetic accepts int and Fraction.
+_operand_parts = {
+    Complex: attrgetter('_Re', '_Im'),
+    Rational: _real,
+    int: _real,
+    Fraction: _real,
+    float: lambda value: (Complex._from_float(value), None),
+    complex: lambda value: (Complex._from_float(value.real), Complex._from_float(value.imag)),
+}
+
+# Rational operators hand builtin complex operands over to Complex.
+_widening[complex] = lambda value: Complex._make(Complex._from_float(value.real), Complex._from_float(value.imag))
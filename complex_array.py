@@ -0,0 +1,216 @@
+from rational import Rational
+from complex import Complex
+from rational_array import RationalArray
+import numpy as np
+
+class ComplexArray:
+    """
+    A one-dimensional array of complex numbers stored as two RationalArray columns,
+    one for the real parts and one for the imaginary parts.
+    """
+    __slots__ = ('_Re', '_Im')
+
+    def __init__(self, values=()):
+        re_parts = []
+        im_parts = []
+        for value in values:
+            if type(value) is Complex:
+                re_parts.append(value.Re)
+                im_parts.append(value.Im)
+            elif type(value) in (Rational, int):
+                re_parts.append(value)
+                im_parts.append(0)
+            else:
+                raise TypeError(f"ComplexArray elements must be Complex/Rational/int, not {type(value)}")
+        self._Re = RationalArray(re_parts)
+        self._Im = RationalArray(im_parts)
+
+    @classmethod
+    def _make(cls, Re: RationalArray, Im: RationalArray) -> 'ComplexArray':
+        """
+        Builds an array from two RationalArray columns of equal length.
+
+        :param Re: The column of real parts.
+        :param Im: The column of imaginary parts.
+        :return: The complex array Re + Im*i.
+        """
+        obj = object.__new__(cls)
+        obj._Re = Re
+        obj._Im = Im
+        return obj
+
+    @staticmethod
+    def from_parts(Re: RationalArray, Im: RationalArray) -> 'ComplexArray':
+        """
+        Builds an array from separate real and imaginary columns.
+
+        :param Re: The column of real parts.
+        :param Im: The column of imaginary parts.
+        :raises ValueError: If the columns have different lengths.
+        :return: The complex array Re + Im*i.
+        """
+        if len(Re) != len(Im):
+            raise ValueError("real and imaginary columns must have the same length")
+        return ComplexArray._make(Re, Im)
+
+    @property
+    def Re(self) -> RationalArray:
+        return self._Re
+
+    @property
+    def Im(self) -> RationalArray:
+        return self._Im
+
+    def __len__(self) -> int:
+        return len(self._Re)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Complex._make(self._Re[index], self._Im[index])
+        return ComplexArray._make(self._Re[index], self._Im[index])
+
+    def __iter__(self):
+        for Re, Im in zip(self._Re, self._Im):
+            yield Complex._make(Re, Im)
+
+    def to_list(self) -> list[Complex]:
+        """
+        Unpacks the array into a list of Complex values.
+
+        :return: The list of Complex values.
+        """
+        return list(self)
+
+    @staticmethod
+    def _split(other):
+        """
+        Returns the real and imaginary parts of other as RationalArray or scalar operands.
+
+        :param other: A ComplexArray, Complex, Rational or int.
+        :return: A (Re, Im) pair, or None if other is unsupported.
+        """
+        if type(other) is ComplexArray:
+            return other._Re, other._Im
+        if type(other) is Complex:
+            return other.Re, other.Im
+        if type(other) in (Rational, int):
+            return other, 0
+        return None
+
+    def __add__(self, other):
+        parts = ComplexArray._split(other)
+        if parts is None:
+            return NotImplemented
+        return ComplexArray._make(self._Re + parts[0], self._Im + parts[1])
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return ComplexArray._make(-self._Re, -self._Im)
+
+    def __sub__(self, other):
+        parts = ComplexArray._split(other)
+        if parts is None:
+            return NotImplemented
+        return ComplexArray._make(self._Re - parts[0], self._Im - parts[1])
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        parts = ComplexArray._split(other)
+        if parts is None:
+            return NotImplemented
+        Re, Im = parts
+        if type(other) in (Rational, int):
+            return ComplexArray._make(self._Re * Re, self._Im * Re)
+        return ComplexArray._make(self._Re * Re - self._Im * Im, self._Re * Im + self._Im * Re)
+
+    __rmul__ = __mul__
+
+    @staticmethod
+    def _divide(a, b, c, d) -> 'ComplexArray':
+        """
+        Computes (a + b*i) / (c + d*i) where at least one operand is an array.
+
+        :raises ZeroDivisionError: If any divisor lane is zero.
+        :return: The quotient array.
+        """
+        norm = c * c + d * d
+        if type(norm) is RationalArray:
+            if np.any(norm.num == 0):
+                raise ZeroDivisionError("Cannot divide by zero")
+        elif norm == 0:
+            raise ZeroDivisionError("Cannot divide by zero")
+        Re = a * c + b * d
+        Im = b * c - a * d
+        return ComplexArray._make(Re / norm, Im / norm)
+
+    def __truediv__(self, other):
+        parts = ComplexArray._split(other)
+        if parts is None:
+            return NotImplemented
+        return ComplexArray._divide(self._Re, self._Im, parts[0], parts[1])
+
+    def __rtruediv__(self, other):
+        parts = ComplexArray._split(other)
+        if parts is None:
+            return NotImplemented
+        return ComplexArray._divide(parts[0], parts[1], self._Re, self._Im)
+
+    def __eq__(self, other):
+        parts = ComplexArray._split(other)
+        if parts is None:
+            return NotImplemented
+        return (self._Re == parts[0]) & (self._Im == parts[1])
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return ~result
+
+    __hash__ = None
+
+    def conjugate(self) -> 'ComplexArray':
+        """
+        Returns the complex conjugate of every element.
+
+        :return: The conjugated array.
+        """
+        return ComplexArray._make(self._Re, -self._Im)
+
+    def norm(self) -> RationalArray:
+        """
+        Returns the exact squared modulus Re**2 + Im**2 of every element.
+
+        :return: The squared moduli as a RationalArray.
+        """
+        return self._Re * self._Re + self._Im * self._Im
+
+    def abs(self) -> np.ndarray:
+        """
+        Calculates the modulus of every element as float64.
+
+        :return: The moduli as a float64 array.
+        """
+        return np.hypot(self._Re.to_float(), self._Im.to_float())
+
+    def arg(self) -> np.ndarray:
+        """
+        Calculates the argument of every element in radians as float64.
+
+        :return: The arguments as a float64 array.
+        """
+        return np.arctan2(self._Im.to_float(), self._Re.to_float())
+
+    def sum(self) -> Complex:
+        """
+        Returns the exact sum of all elements.
+
+        :return: The sum as a Complex.
+        """
+        return Complex._make(self._Re.sum(), self._Im.sum())
+
+    def __repr__(self) -> str:
+        return "ComplexArray([" + ", ".join(str(value) for value in self) + "])"
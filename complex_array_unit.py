@@ -0,0 +1,94 @@
+import unittest
+import math
+import random
+from rational import Rational
+from complex import Complex
+from complex_array import ComplexArray
+from rational_array import RationalArray
+
+class TestComplexArray(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(2)
+        def rand_rational():
+            return Rational(rng.randint(-30, 30), rng.randint(1, 30))
+        self.xs = [Complex(rand_rational(), rand_rational()) for _ in range(30)]
+        self.ys = [Complex(rand_rational(), rand_rational()) for _ in range(30)]
+        self.ys = [y if y != 0 else Complex(1, 1) for y in self.ys]
+        self.a = ComplexArray(self.xs)
+        self.b = ComplexArray(self.ys)
+
+    def test_init_and_to_list(self):
+        arr = ComplexArray([Complex(1, 2), Rational(1, 2), 3])
+        self.assertEqual(arr.to_list(), [Complex(1, 2), Complex(Rational(1, 2), 0), Complex(3, 0)])
+
+    def test_init_type_error(self):
+        with self.assertRaises(TypeError):
+            ComplexArray(["a"])
+
+    def test_from_parts_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            ComplexArray.from_parts(RationalArray([1, 2]), RationalArray([1]))
+
+    def test_add(self):
+        self.assertEqual((self.a + self.b).to_list(), [x + y for x, y in zip(self.xs, self.ys)])
+
+    def test_sub(self):
+        self.assertEqual((self.a - self.b).to_list(), [x - y for x, y in zip(self.xs, self.ys)])
+
+    def test_mul(self):
+        self.assertEqual((self.a * self.b).to_list(), [x * y for x, y in zip(self.xs, self.ys)])
+
+    def test_truediv(self):
+        self.assertEqual((self.a / self.b).to_list(), [x / y for x, y in zip(self.xs, self.ys)])
+
+    def test_truediv_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            _ = self.a / ComplexArray([0] * len(self.a))
+
+    def test_scalar_broadcast(self):
+        z = Complex(Rational(1, 2), -3)
+        self.assertEqual((self.a + z).to_list(), [x + z for x in self.xs])
+        self.assertEqual((self.a * z).to_list(), [x * z for x in self.xs])
+        self.assertEqual((self.a / z).to_list(), [x / z for x in self.xs])
+        self.assertEqual((3 * self.a).to_list(), [x * 3 for x in self.xs])
+        self.assertEqual((self.a - Rational(1, 3)).to_list(), [x - Rational(1, 3) for x in self.xs])
+
+    def test_rtruediv(self):
+        self.assertEqual((1 / self.b).to_list(), [Complex(1, 0) / y for y in self.ys])
+        # Rational scalar parts times RationalArray parts go through the reflected operators.
+        z = Complex(Rational(1, 2), Rational(-3, 7))
+        self.assertEqual((z / self.b).to_list(), [z / y for y in self.ys])
+
+    def test_conjugate(self):
+        self.assertEqual(self.a.conjugate().to_list(), [Complex(x.Re, -x.Im) for x in self.xs])
+
+    def test_norm(self):
+        self.assertEqual(self.a.norm().to_list(), [x.Re * x.Re + x.Im * x.Im for x in self.xs])
+
+    def test_abs_and_arg(self):
+        for value, modulus, phase in zip(self.xs, self.a.abs(), self.a.arg()):
+            self.assertAlmostEqual(modulus, value.abs())
+            self.assertAlmostEqual(phase, value.arg())
+
+    def test_abs_pythagorean(self):
+        self.assertAlmostEqual(ComplexArray([Complex(3, 4)]).abs()[0], 5.0)
+        self.assertAlmostEqual(ComplexArray([Complex(0, 1)]).arg()[0], math.pi / 2)
+
+    def test_indexing(self):
+        self.assertEqual(self.a[4], self.xs[4])
+        self.assertEqual(self.a[1:6:2].to_list(), self.xs[1:6:2])
+
+    def test_eq(self):
+        self.assertTrue(all(self.a == self.a))
+        self.assertEqual((self.a != self.b).tolist(), [x != y for x, y in zip(self.xs, self.ys)])
+
+    def test_sum(self):
+        expected = Complex(0, 0)
+        for x in self.xs:
+            expected += x
+        self.assertEqual(self.a.sum(), expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
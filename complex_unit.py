@@ -2,6 +2,7 @@ import unittest
 import math
 from rational import Rational
 from complex import Complex
+from decimal import Decimal
 from io import StringIO
 from unittest.mock import patch
 
@@ -17,35 +18,23 @@ class TestComplex(unittest.TestCase):
         self.assertEqual(c.Re, Rational(1, 1))
         self.assertEqual(c.Im, Rational(2, 1))
 
-    def test_re_setter_rational(self):
+    def test_re_read_only(self):
         c = Complex(1, 0)
-        c.Re = Rational(3, 5)
-        self.assertEqual(c.Re, Rational(3, 5))
-
-    def test_re_setter_int(self):
-        c = Complex(Rational(1, 2), 0)
-        c.Re = 4
-        self.assertEqual(c.Re, Rational(4, 1))
-
-    def test_re_setter_type_error(self):
-        c = Complex(0, 0)
-        with self.assertRaises(TypeError):
-            c.Re = "invalid"
+        with self.assertRaises(AttributeError):
+            c.Re = Rational(3, 5)
+        self.assertEqual(c.Re, Rational(1, 1))
 
-    def test_im_setter_rational(self):
+    def test_im_read_only(self):
         c = Complex(0, 1)
-        c.Im = Rational(7, 8)
-        self.assertEqual(c.Im, Rational(7, 8))
-
-    def test_im_setter_int(self):
-        c = Complex(0, Rational(1, 3))
-        c.Im = -3
-        self.assertEqual(c.Im, Rational(-3, 1))
+        with self.assertRaises(AttributeError):
+            c.Im = -3
+        self.assertEqual(c.Im, Rational(1, 1))
 
-    def test_im_setter_type_error(self):
-        c = Complex(1, 2)
+    def test_init_type_error(self):
+        with self.assertRaises(TypeError):
+            Complex("invalid", 0)
         with self.assertRaises(TypeError):
-            c.Im = "invalid"
+            Complex(1, "invalid")
 
     def test_add_complex(self):
         c1 = Complex(1, 2)
@@ -65,10 +54,15 @@ class TestComplex(unittest.TestCase):
         result = c + n
         self.assertEqual(result, Complex(Rational(4, 1), Rational(2, 1)))
 
+    def test_add_float(self):
+        c = Complex(1, 2)
+        result = c + 1.5
+        self.assertEqual(result, Complex(Rational(5, 2), Rational(2, 1)))
+
     def test_add_type_error(self):
         c = Complex(1, 2)
         with self.assertRaises(TypeError):
-            _ = c + 1.5
+            _ = c + "invalid"
 
     def test_sub_complex(self):
         c1 = Complex(4, 6)
@@ -301,7 +295,8 @@ class TestComplex(unittest.TestCase):
     def test_itruediv_zero(self):
         c = Complex(6, 8)
         r = Rational(0, 1)
-        self.assertRaises(ZeroDivisionError, c.__itruediv__, r)
+        with self.assertRaises(ZeroDivisionError):
+            c /= r
 
     def test_abs(self):
         c = Complex(3, 4)
@@ -464,17 +459,242 @@ class TestComplex(unittest.TestCase):
     def test_pow_large_numbers(self):
         c = Complex(10**50, 10**50)
         result = c ** 5
-        r = (2 * (10**100))**0.5
-        phi = math.pi / 4
-        r_pow_n = r ** 5
-        cos_n_phi = math.cos(5 * phi)
-        sin_n_phi = math.sin(5 * phi)
-        expected_real = r_pow_n * cos_n_phi
-        expected_imag = r_pow_n * sin_n_phi
-        expected_real_rational = Rational.float_to_rational(expected_real)
-        expected_imag_rational = Rational.float_to_rational(expected_imag)
-        self.assertEqual(result.Re, expected_real_rational)
-        self.assertEqual(result.Im, expected_imag_rational)
+        self.assertEqual(result, Complex(-4 * 10**250, -4 * 10**250))
+
+    def test_pow_exact(self):
+        c = Complex(1, 1)
+        self.assertEqual(c ** 40, Complex(2**20, 0))
+
+    def test_pow_fractional_parts(self):
+        c = Complex(Rational(1, 2), Rational(1, 3))
+        self.assertEqual(c ** 3, c * c * c)
+
+    def test_pow_negative_fractional_parts(self):
+        c = Complex(Rational(1, 2), Rational(-2, 3))
+        self.assertEqual(c ** -3, Complex(1, 0) / (c * c * c))
+
+    def test_pow_zero_negative_exponent(self):
+        with self.assertRaises(ZeroDivisionError):
+            _ = Complex(0, 0) ** -1
+
+    def test_pow_huge_exponent(self):
+        c = Complex(0, 1)
+        self.assertEqual(c ** (10**20 + 3), Complex(0, -1))
+
+    def test_pow_modular(self):
+        c = Complex(3, 2)
+        expected = c ** 13
+        result = pow(c, 13, 7)
+        self.assertEqual(result, Complex(expected.Re.num % 7, expected.Im.num % 7))
+
+    def test_pow_modular_not_gaussian_integer(self):
+        with self.assertRaises(ValueError):
+            pow(Complex(Rational(1, 2), 1), 3, 5)
+
+    def test_pow_modular_negative_exponent(self):
+        with self.assertRaises(ValueError):
+            pow(Complex(1, 1), -1, 5)
+
+    def test_slots_no_instance_dict(self):
+        c = Complex(1, 2)
+        self.assertFalse(hasattr(c, "__dict__"))
+        with self.assertRaises(AttributeError):
+            c.other = 1
+
+    def test_make_skips_validation(self):
+        c = Complex._make(Rational(1, 2), Rational(3, 1))
+        self.assertEqual(c, Complex(Rational(1, 2), 3))
+
+    def test_imul_rebinds(self):
+        c = Complex(1, 2)
+        same = c
+        c *= Complex(3, 4)
+        self.assertIsNot(c, same)
+        self.assertEqual(c, Complex(-5, 10))
+        self.assertEqual(same, Complex(1, 2))
+
+    def test_cached_derived_values(self):
+        c = Complex(3, 4)
+        self.assertEqual(c.abs(), 5.0)
+        self.assertIs(c.abs(), c.abs())
+        self.assertIs(c.arg(), c.arg())
+        self.assertEqual(c.norm(), 25)
+        self.assertIs(c.norm(), c.norm())
+        self.assertEqual(c.abs(5), Decimal(5))
+
+    def test_sum(self):
+        values = [Complex(1, 2), Complex(Rational(1, 2), Rational(-1, 3)), Rational(1, 4), 3]
+        self.assertEqual(Complex.sum(values), Complex(Rational(19, 4), Rational(5, 3)))
+
+    def test_sum_type_error(self):
+        with self.assertRaises(TypeError):
+            Complex.sum([Complex(1, 2), "a"])
+
+    def test_prod(self):
+        values = [Complex(1, 2), Complex(Rational(1, 2), Rational(-1, 3)), Rational(3, 4), 2, Complex(0, 1)]
+        expected = Complex(1, 0)
+        for value in values:
+            expected *= value
+        self.assertEqual(Complex.prod(values), expected)
+
+    def test_prod_empty(self):
+        self.assertEqual(Complex.prod([]), Complex(1, 0))
+
+    def test_hash_matches_builtin_complex(self):
+        self.assertEqual(hash(Complex(3, 4)), hash(complex(3, 4)))
+        self.assertEqual(hash(Complex(-1, -1)), hash(complex(-1, -1)))
+        self.assertEqual(hash(Complex(Rational(1, 2), Rational(-3, 4))), hash(complex(0.5, -0.75)))
+
+    def test_hash_real_matches_rational(self):
+        self.assertEqual(hash(Complex(Rational(1, 3), 0)), hash(Rational(1, 3)))
+
+    def test_hash_set(self):
+        self.assertEqual(len({Complex(1, 2), Complex(Rational(2, 2), 2), Complex(2, 1)}), 2)
+
+    def test_interning(self):
+        Complex.enable_interning()
+        try:
+            self.assertIs(Complex(1, 1) * Complex(1, -1), Complex(1, 0) + Complex(1, 0))
+            value = Complex(0, 1) * Complex(0, 1)
+            alias = value
+            alias *= 3
+            self.assertEqual(value, Complex(-1, 0))
+            self.assertEqual(alias, Complex(-3, 0))
+            with self.assertRaises(AttributeError):
+                value.Re = 2
+        finally:
+            Complex.disable_interning()
+
+    def test_float_mode_decimal(self):
+        c = Complex(0.1, 0.5)
+        self.assertEqual(c.Re, Rational(1, 10))
+        self.assertEqual(c.Im, Rational(1, 2))
+
+    def test_float_mode_exact(self):
+        Complex.float_mode = "exact"
+        try:
+            c = Complex(0.1, 1.5)
+            self.assertEqual(c.Re, Rational(3602879701896397, 2**55))
+            self.assertEqual(c.Im, Rational(3, 2))
+        finally:
+            Complex.float_mode = "decimal"
+
+    def test_float_mode_limit(self):
+        Complex.float_mode = "limit"
+        try:
+            c = Complex(1 / 3, 0.1)
+            self.assertEqual(c.Re, Rational(1, 3))
+            self.assertEqual(c.Im, Rational(1, 10))
+        finally:
+            Complex.float_mode = "decimal"
+
+    def test_float_mode_unknown(self):
+        Complex.float_mode = "bogus"
+        try:
+            with self.assertRaises(ValueError):
+                Complex(0.5, 0)
+        finally:
+            Complex.float_mode = "decimal"
+
+    def test_abs_huge_parts(self):
+        c = Complex(Rational(3 * 10**400, 7**500), Rational(4 * 10**400, 7**500))
+        self.assertAlmostEqual(c.abs() / ((5 * 10**400) / 7**500), 1.0)
+
+    def test_arg_huge_parts(self):
+        c = Complex(-10**400, 10**400)
+        self.assertAlmostEqual(c.arg(), 3 * math.pi / 4)
+        tiny = Complex(Rational(1, 10**500), Rational(-1, 10**500))
+        self.assertAlmostEqual(tiny.arg(), -math.pi / 4)
+
+    def test_abs_overflow(self):
+        with self.assertRaises(OverflowError):
+            Complex(10**400, 0).abs()
+
+    def test_abs_prec(self):
+        self.assertEqual(str(Complex(1, 1).abs(30)), "1.41421356237309504880168872421")
+        self.assertEqual(str(Complex(10**400, 0).abs(5)), "1.0000E+400")
+        # Just above a halfway point: rounding the guard-digit result again would give 2.
+        self.assertEqual(Complex(Rational(25 * 10**24 + 1, 10**25), 0).abs(1), Decimal(3))
+        self.assertEqual(Complex(0, 0).abs(5), Decimal(0))
+
+    def test_arg_prec(self):
+        self.assertEqual(str(Complex(-1, 0).arg(30)), "3.14159265358979323846264338328")
+        self.assertEqual(str(Complex(0, -1).arg(20)), "-1.5707963267948966192")
+        self.assertEqual(str(Complex(0, 0).arg(5)), "0")
+        self.assertAlmostEqual(float(Complex(-3, -4).arg(25)), math.atan2(-4, -3))
+
+    def test_reflected_operators(self):
+        c = Complex(1, 1)
+        self.assertEqual(3 * c, Complex(3, 3))
+        self.assertEqual(2 + c, Complex(3, 1))
+        self.assertEqual(2 - c, Complex(1, -1))
+        self.assertEqual(2 / c, Complex(1, -1))
+        self.assertEqual(Rational(1, 2) * c, Complex(Rational(1, 2), Rational(1, 2)))
+
+    def test_rtruediv_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            _ = 1 / Complex(0, 0)
+
+    def test_float_operands(self):
+        c = Complex(1, 1)
+        self.assertEqual(c * 0.5, Complex(Rational(1, 2), Rational(1, 2)))
+        self.assertEqual(0.5 - c, Complex(Rational(-1, 2), -1))
+        self.assertEqual(c / 0.5, Complex(2, 2))
+        self.assertTrue(Complex(Rational(1, 2), 0) == 0.5)
+
+    def test_fraction_operands(self):
+        from fractions import Fraction
+        c = Complex(1, 1)
+        self.assertEqual(c + Fraction(1, 2), Complex(Rational(3, 2), 1))
+        self.assertEqual(Fraction(1, 2) * c, Complex(Rational(1, 2), Rational(1, 2)))
+        self.assertTrue(Complex(Rational(1, 3), 0) == Fraction(1, 3))
+
+    def test_localcontext_pow_and_prod(self):
+        z = Complex(Rational(1, 3), Rational(2, 7))
+        with Rational.localcontext(max_den=100):
+            square = z * z
+            self.assertEqual(z ** 2, square)
+            self.assertEqual(Complex.prod([z, z]), square)
+            inverse = z ** -1
+        self.assertEqual(square, Complex(Rational(1, 34), Rational(4, 21)))
+        self.assertLessEqual(inverse.Re.den, 100)
+        self.assertLessEqual(inverse.Im.den, 100)
+
+    def test_builtin_complex_operands(self):
+        c = Complex(1, 1)
+        self.assertEqual(c + 2j, Complex(1, 3))
+        self.assertEqual(2j * c, Complex(-2, 2))
+        self.assertEqual(1j - c, Complex(-1, 0))
+        self.assertEqual((1 + 1j) / c, 1)
+        self.assertTrue(c == 1 + 1j)
+        self.assertTrue(1 + 1j == c)
+
+    def test_unsupported_returns_not_implemented(self):
+        c = Complex(1, 1)
+        self.assertIs(c.__mul__("a"), NotImplemented)
+        self.assertIs(c.__rsub__([1]), NotImplemented)
+        self.assertIs(c.__eq__("a"), NotImplemented)
+        with self.assertRaises(TypeError):
+            c -= "a"
+
+    def test_parse_inverts_str(self):
+        values = [Complex(Rational(1, 2), -3), Complex(0, 1), Complex(0, -1), Complex(Rational(7, 3), 0),
+                  Complex(0, Rational(-2, 5)), Complex(-4, 1), Complex(0, 0)]
+        for c in values:
+            self.assertEqual(Complex.parse(str(c)), c)
+
+    def test_parse_forms(self):
+        self.assertEqual(Complex.parse("1+2i"), Complex(1, 2))
+        self.assertEqual(Complex.parse("1 - 2j"), Complex(1, -2))
+        self.assertEqual(Complex.parse("-i"), Complex(0, -1))
+        self.assertEqual(Complex.parse("1.5e-1-0.5i"), Complex(Rational(3, 20), Rational(-1, 2)))
+        self.assertEqual(Complex.parse("1e+2+3/4i"), Complex(100, Rational(3, 4)))
+        self.assertEqual(Complex.parse("7/3"), Complex(Rational(7, 3), 0))
+
+    def test_parse_errors(self):
+        for text in ["", "i2", "1+", "1+xi", "1++2i", "(1/2"]:
+            with self.assertRaises(ValueError):
+                Complex.parse(text)
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
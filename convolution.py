@@ -0,0 +1,234 @@
+from rational import Rational
+from complex import Complex
+from math import gcd
+
+# Sequences no longer than this are multiplied directly; Karatsuba recurses down to it.
+_SCHOOLBOOK_CUTOFF = 32
+# Kronecker packing pads every slot to the widest coefficient; past this ratio of padded
+# to actual bits Karatsuba on the coefficient lists is cheaper.
+_PACKING_WASTE_LIMIT = 4
+
+
+def _schoolbook(a: list[int], b: list[int]) -> list[int]:
+    result = [0] * (len(a) + len(b) - 1)
+    for i, x in enumerate(a):
+        if x:
+            for j, y in enumerate(b):
+                result[i + j] += x * y
+    return result
+
+
+def _add_into(target: list[int], source: list[int], offset: int):
+    for i, x in enumerate(source):
+        target[offset + i] += x
+
+
+def _karatsuba(a: list[int], b: list[int]) -> list[int]:
+    """
+    Convolves two integer lists with Karatsuba's method.
+
+    Unbalanced inputs are cut into blocks the length of the shorter list, so
+    the recursion always works on equal halves.
+
+    :param a: The first coefficient list.
+    :param b: The second coefficient list.
+    :return: The convolution of a and b.
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if len(b) <= _SCHOOLBOOK_CUTOFF:
+        return _schoolbook(a, b)
+    if len(a) > len(b):
+        result = [0] * (len(a) + len(b) - 1)
+        for start in range(0, len(a), len(b)):
+            _add_into(result, _karatsuba(a[start:start + len(b)], b), start)
+        return result
+
+    half = len(a) // 2
+    a_low, a_high = a[:half], a[half:]
+    b_low, b_high = b[:half], b[half:]
+    low = _karatsuba(a_low, b_low)
+    high = _karatsuba(a_high, b_high)
+    a_sum = [x + y for x, y in zip(a_high, a_low)] + a_high[len(a_low):]
+    b_sum = [x + y for x, y in zip(b_high, b_low)] + b_high[len(b_low):]
+    middle = _karatsuba(a_sum, b_sum)
+    for i, x in enumerate(low):
+        middle[i] -= x
+    for i, x in enumerate(high):
+        middle[i] -= x
+
+    result = [0] * (len(a) + len(b) - 1)
+    _add_into(result, low, 0)
+    _add_into(result, middle, half)
+    _add_into(result, high, 2 * half)
+    return result
+
+
+def _pack(values: list[int], slot_bytes: int) -> int:
+    """
+    Packs signed integers into one big integer, values[k] * 2**(8*slot_bytes*k).
+
+    Every coefficient is written as a two's complement slot; the borrows of the
+    negative slots are then subtracted in one step.
+
+    :param values: The coefficients; each must fit in a signed slot.
+    :param slot_bytes: The width of a slot in bytes.
+    :return: The packed integer.
+    """
+    chunks = b"".join(x.to_bytes(slot_bytes, "little", signed=True) for x in values)
+    packed = int.from_bytes(chunks, "little")
+    borrow_slot = (1).to_bytes(slot_bytes, "little")
+    empty_slot = bytes(slot_bytes)
+    borrows = b"".join(borrow_slot if x < 0 else empty_slot for x in values)
+    return packed - (int.from_bytes(borrows, "little") << (8 * slot_bytes))
+
+
+def _unpack(packed: int, count: int, slot_bytes: int) -> list[int]:
+    """
+    Splits a packed integer back into count signed coefficients.
+
+    Adding half a slot to every slot makes all digits non-negative, so the bytes can
+    be sliced directly.
+
+    :param packed: The packed integer.
+    :param count: The number of coefficients.
+    :param slot_bytes: The width of a slot in bytes.
+    :return: The coefficients.
+    """
+    half = 1 << (8 * slot_bytes - 1)
+    offset_slot = half.to_bytes(slot_bytes, "little")
+    offset = int.from_bytes(offset_slot * count, "little")
+    data = (packed + offset).to_bytes(slot_bytes * count, "little")
+    return [int.from_bytes(data[k:k + slot_bytes], "little") - half
+            for k in range(0, slot_bytes * count, slot_bytes)]
+
+
+def convolve_ints(a: list[int], b: list[int]) -> list[int]:
+    """
+    Convolves two integer sequences exactly.
+
+    The sequences are packed into single big integers (Kronecker substitution) and
+    multiplied with CPython's big-int multiplication. When a few huge coefficients
+    would make the fixed-width slots mostly padding, Karatsuba on the lists is used
+    instead.
+
+    :param a: The first sequence.
+    :param b: The second sequence.
+    :return: The sequence c with c[k] = sum(a[i] * b[k - i]).
+    """
+    if not a or not b:
+        return []
+    if min(len(a), len(b)) <= _SCHOOLBOOK_CUTOFF // 4:
+        return _schoolbook(a, b) if len(a) >= len(b) else _schoolbook(b, a)
+
+    a_bits = [abs(x).bit_length() for x in a]
+    b_bits = [abs(x).bit_length() for x in b]
+    a_max, b_max = max(a_bits), max(b_bits)
+    if a_max == 0 or b_max == 0:
+        return [0] * (len(a) + len(b) - 1)
+
+    padded = a_max * len(a) + b_max * len(b)
+    actual = sum(a_bits) + sum(b_bits) + len(a) + len(b)
+    if padded > _PACKING_WASTE_LIMIT * actual:
+        return _karatsuba(a, b)
+
+    # |c[k]| < min(len) * 2**(a_max + b_max), plus a sign bit.
+    slot_bits = a_max + b_max + min(len(a), len(b)).bit_length() + 1
+    slot_bytes = (slot_bits + 7) // 8
+    product = _pack(a, slot_bytes) * _pack(b, slot_bytes)
+    return _unpack(product, len(a) + len(b) - 1, slot_bytes)
+
+
+def convolve_gaussian(a: list[tuple[int, int]], b: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """
+    Convolves two sequences of Gaussian integers (p, q) = p + q*i.
+
+    Uses three real convolutions: re = ac - bd, im = (a + b)(c + d) - ac - bd.
+
+    :param a: The first sequence of (re, im) pairs.
+    :param b: The second sequence of (re, im) pairs.
+    :return: The convolution as (re, im) pairs.
+    """
+    if not a or not b:
+        return []
+    a_re = [p for p, _ in a]
+    a_im = [q for _, q in a]
+    b_re = [p for p, _ in b]
+    b_im = [q for _, q in b]
+    real = convolve_ints(a_re, b_re)
+    imag = convolve_ints(a_im, b_im)
+    mixed = convolve_ints([p + q for p, q in a], [p + q for p, q in b])
+    return [(r - i, m - r - i) for r, i, m in zip(real, imag, mixed)]
+
+
+def _common_denominator(values) -> int:
+    d = 1
+    for value in values:
+        d = d // gcd(d, value.den) * value.den
+    return d
+
+
+def _rational_parts(values: list) -> tuple[list[int], int]:
+    """
+    Clears the denominators of a sequence of Rational/int values.
+
+    :param values: The sequence.
+    :return: (ints, d) with values[k] == ints[k] / d.
+    """
+    values = [Rational._make(x, 1) if type(x) is int else x for x in values]
+    d = _common_denominator(values)
+    return [x.num * (d // x.den) for x in values], d
+
+
+def _gaussian_parts(values: list) -> tuple[list[tuple[int, int]], int]:
+    """
+    Clears the denominators of a sequence of Complex/Rational/int values to Gaussian integers.
+
+    :param values: The sequence.
+    :return: ([(p, q), ...], d) with values[k] == (p_k + q_k*i) / d.
+    """
+    re_parts = []
+    im_parts = []
+    for value in values:
+        if type(value) is Complex:
+            re_parts.append(value.Re)
+            im_parts.append(value.Im)
+        else:
+            re_parts.append(Rational._make(value, 1) if type(value) is int else value)
+            im_parts.append(Rational._make(0, 1))
+    d = _common_denominator(re_parts + im_parts)
+    return [(re.num * (d // re.den), im.num * (d // im.den)) for re, im in zip(re_parts, im_parts)], d
+
+
+def convolve(a, b) -> list:
+    """
+    Convolves two sequences of exact numbers.
+
+    Rational/int sequences give a list of Rational; if either sequence contains a
+    Complex, the result is a list of Complex. Denominators are cleared to their lcm
+    first, so the work is a single exact integer convolution and each output is
+    normalized once.
+
+    :param a: The first sequence of Complex/Rational/int values.
+    :param b: The second sequence of Complex/Rational/int values.
+    :raises TypeError: If a value is not Complex, Rational or int.
+    :return: The sequence c with c[k] = sum(a[i] * b[k - i]).
+    """
+    a = list(a)
+    b = list(b)
+    for value in a + b:
+        if type(value) not in (Complex, Rational, int):
+            raise TypeError(f"Can't convolve {type(value)}")
+    if not a or not b:
+        return []
+
+    if any(type(x) is Complex for x in a + b):
+        a_parts, a_den = _gaussian_parts(a)
+        b_parts, b_den = _gaussian_parts(b)
+        d = a_den * b_den
+        return [Complex._make(Rational._reduced(p, d), Rational._reduced(q, d)) for p, q in convolve_gaussian(a_parts, b_parts)]
+
+    a_ints, a_den = _rational_parts(a)
+    b_ints, b_den = _rational_parts(b)
+    d = a_den * b_den
+    return [Rational._reduced(x, d) for x in convolve_ints(a_ints, b_ints)]
@@ -0,0 +1,85 @@
+import unittest
+import random
+from rational import Rational
+from complex import Complex
+from convolution import convolve, convolve_ints, convolve_gaussian, _karatsuba, _schoolbook
+
+class TestConvolution(unittest.TestCase):
+
+    def setUp(self):
+        self.rng = random.Random(7)
+
+    def random_ints(self, n, bits):
+        return [self.rng.randint(-2**bits, 2**bits) for _ in range(n)]
+
+    def test_convolve_ints_matches_schoolbook(self):
+        for n, m, bits in [(50, 50, 8), (100, 37, 64), (200, 3, 5), (64, 64, 300)]:
+            a = self.random_ints(n, bits)
+            b = self.random_ints(m, bits)
+            self.assertEqual(convolve_ints(a, b), _schoolbook(a, b))
+
+    def test_convolve_ints_mixed_sizes(self):
+        a = self.random_ints(80, 4)
+        a[5] = 3**5000
+        b = self.random_ints(90, 4)
+        self.assertEqual(convolve_ints(a, b), _schoolbook(a, b))
+
+    def test_convolve_ints_zeros(self):
+        self.assertEqual(convolve_ints([0] * 20, [1] * 20), [0] * 39)
+        self.assertEqual(convolve_ints([], [1, 2]), [])
+
+    def test_karatsuba_unbalanced(self):
+        a = self.random_ints(300, 20)
+        b = self.random_ints(70, 20)
+        self.assertEqual(_karatsuba(a, b), _schoolbook(a, b))
+        self.assertEqual(_karatsuba(b, a), _schoolbook(a, b))
+
+    def test_convolve_gaussian(self):
+        a = list(zip(self.random_ints(40, 10), self.random_ints(40, 10)))
+        b = list(zip(self.random_ints(45, 10), self.random_ints(45, 10)))
+        expected = [(0, 0)] * (len(a) + len(b) - 1)
+        for i, (p1, q1) in enumerate(a):
+            for j, (p2, q2) in enumerate(b):
+                re, im = expected[i + j]
+                expected[i + j] = (re + p1 * p2 - q1 * q2, im + p1 * q2 + q1 * p2)
+        self.assertEqual(convolve_gaussian(a, b), expected)
+
+    def test_convolve_rational(self):
+        a = [Rational(self.rng.randint(-20, 20), self.rng.randint(1, 9)) for _ in range(30)]
+        b = [Rational(self.rng.randint(-20, 20), self.rng.randint(1, 9)) for _ in range(25)] + [3]
+        expected = [Rational(0, 1)] * (len(a) + len(b) - 1)
+        for i, x in enumerate(a):
+            for j, y in enumerate(b):
+                expected[i + j] = expected[i + j] + x * y
+        self.assertEqual(convolve(a, b), expected)
+
+    def test_convolve_complex(self):
+        a = [Complex(Rational(1, 2), 3), 2, Rational(1, 3)]
+        b = [Complex(0, 1), Complex(Rational(-1, 4), 1)]
+        expected = [Complex(0, 0)] * 4
+        for i, x in enumerate(a):
+            for j, y in enumerate(b):
+                expected[i + j] = expected[i + j] + y * x
+        self.assertEqual(convolve(a, b), expected)
+
+    def test_convolve_localcontext(self):
+        a = [Rational(1, 7), Rational(2, 9), Complex(Rational(1, 13), 1)]
+        b = [Rational(1, 11), 1]
+        exact = convolve(a, b)
+        with Rational.localcontext(max_den=10):
+            result = convolve(a, b)
+        self.assertEqual(result, [Complex(v.Re.limit_denominator(10), v.Im.limit_denominator(10)) for v in exact])
+        with Rational.localcontext(max_den=10):
+            result = convolve(a[:2], b)
+        self.assertEqual(result, [v.Re.limit_denominator(10) for v in exact[:3]])
+
+    def test_convolve_type_error(self):
+        with self.assertRaises(TypeError):
+            convolve([1, 2], [1.5])
+
+    def test_convolve_empty(self):
+        self.assertEqual(convolve([], [Rational(1, 2)]), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,406 @@
+from rational import Rational
+from complex import Complex, _operand_parts, _hash_complex
+from modular import _is_prime
+from math import gcd, isqrt
+import random
+
+# Factors below this bound are found by trial division before Pollard's rho takes over.
+_TRIAL_LIMIT = 1000
+_SMALL_PRIMES = [p for p in range(2, _TRIAL_LIMIT) if all(p % d for d in range(2, isqrt(p) + 1))]
+
+
+def _rho(n: int) -> int:
+    """
+    Finds a non-trivial factor of an odd composite n with Brent's variant of Pollard's rho.
+
+    :param n: An odd composite number.
+    :return: A factor d with 1 < d < n.
+    """
+    rng = random.Random(n)
+    while True:
+        c = rng.randrange(1, n)
+        y = rng.randrange(n)
+        m = 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # The batched product overshot; retrace one step at a time.
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % n
+                g = gcd(abs(x - saved), n)
+        if g != n:
+            return g
+
+
+def _factor_int(n: int) -> dict[int, int]:
+    """
+    Factors a positive integer into primes.
+
+    :param n: The number to factor.
+    :return: The exponent of every prime factor.
+    """
+    factors = {}
+    for p in _SMALL_PRIMES:
+        if p * p > n:
+            break
+        while n % p == 0:
+            factors[p] = factors.get(p, 0) + 1
+            n //= p
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        root = isqrt(m)
+        if _is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+        elif root * root == m:
+            # Norms hold every rational prime p = 3 (mod 4) squared, and rho is slow on p**2.
+            stack += [root, root]
+        else:
+            d = _rho(m)
+            stack += [d, m // d]
+    return dict(sorted(factors.items()))
+
+
+def _divmod_parts(a: int, b: int, c: int, d: int) -> tuple[int, int, int, int]:
+    """
+    Divides a + b*i by the non-zero c + d*i, rounding the quotient to the nearest Gaussian integer.
+
+    :return: (x, y, r, s) with quotient x + y*i and remainder r + s*i, where the
+        remainder's norm is at most half the divisor's norm.
+    """
+    n = c * c + d * d
+    x = (2 * (a * c + b * d) + n) // (2 * n)
+    y = (2 * (b * c - a * d) + n) // (2 * n)
+    return x, y, a - (x * c - y * d), b - (x * d + y * c)
+
+
+def _normalized(a: int, b: int) -> tuple[int, int, int, int]:
+    """
+    Splits a non-zero a + b*i into a unit times the associate in the first quadrant.
+
+    :return: (re, im, u, v) with a + b*i == (u + v*i) * (re + im*i), re > 0 and im >= 0.
+    """
+    if a > 0 and b >= 0:
+        return a, b, 1, 0
+    if a <= 0 and b > 0:
+        return b, -a, 0, 1
+    if a < 0 and b <= 0:
+        return -a, -b, -1, 0
+    return -b, a, 0, -1
+
+
+class GaussianInt:
+    """
+    An immutable Gaussian integer Re + Im*i with plain int parts.
+
+    Arithmetic with ints and other Gaussian integers works on the ints directly and
+    never builds a Rational. Operations with other numbers (Rational, Complex,
+    float, ...) and true division go through Complex and return a Complex.
+    Associates are normalized to the first quadrant (Re > 0, Im >= 0) wherever a
+    result is only defined up to a unit, as for gcd() and factor().
+    """
+    __slots__ = ('_re', '_im')
+
+    def __init__(self, Re: int = 0, Im: int = 0):
+        if type(Re) is not int or type(Im) is not int:
+            raise TypeError("parts of a Gaussian integer must be integers")
+        self._re = Re
+        self._im = Im
+
+    @classmethod
+    def _make(cls, Re: int, Im: int) -> 'GaussianInt':
+        obj = object.__new__(cls)
+        obj._re = Re
+        obj._im = Im
+        return obj
+
+    @staticmethod
+    def from_complex(value: Complex) -> 'GaussianInt':
+        """
+        Converts a Complex with integer parts.
+
+        :param value: The number to convert.
+        :raises ValueError: If a part is not an integer.
+        :return: The Gaussian integer.
+        """
+        if value.Re.den != 1 or value.Im.den != 1:
+            raise ValueError("Complex number is not a Gaussian integer")
+        return GaussianInt._make(value.Re.num, value.Im.num)
+
+    def to_complex(self) -> Complex:
+        return Complex._make(Rational._make(self._re, 1), Rational._make(self._im, 1))
+
+    @property
+    def Re(self) -> int:
+        return self._re
+
+    @property
+    def Im(self) -> int:
+        return self._im
+
+    @staticmethod
+    def _coerce(other) -> tuple[int, int]|None:
+        if type(other) is GaussianInt:
+            return other._re, other._im
+        if type(other) is int:
+            return other, 0
+        return None
+
+    def __add__(self, other):
+        parts = GaussianInt._coerce(other)
+        if parts is None:
+            return self.to_complex() + other if type(other) in _operand_parts else NotImplemented
+        return GaussianInt._make(self._re + parts[0], self._im + parts[1])
+
+    __radd__ = __add__
+
+    def __sub__(self, other):
+        parts = GaussianInt._coerce(other)
+        if parts is None:
+            return self.to_complex() - other if type(other) in _operand_parts else NotImplemented
+        return GaussianInt._make(self._re - parts[0], self._im - parts[1])
+
+    def __rsub__(self, other):
+        parts = GaussianInt._coerce(other)
+        if parts is None:
+            return other - self.to_complex() if type(other) in _operand_parts else NotImplemented
+        return GaussianInt._make(parts[0] - self._re, parts[1] - self._im)
+
+    def __neg__(self):
+        return GaussianInt._make(-self._re, -self._im)
+
+    def __mul__(self, other):
+        parts = GaussianInt._coerce(other)
+        if parts is None:
+            return self.to_complex() * other if type(other) in _operand_parts else NotImplemented
+        c, d = parts
+        return GaussianInt._make(self._re * c - self._im * d, self._re * d + self._im * c)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if type(other) is GaussianInt:
+            other = other.to_complex()
+        return self.to_complex().__truediv__(other)
+
+    def __rtruediv__(self, other):
+        return self.to_complex().__rtruediv__(other)
+
+    def __divmod__(self, other):
+        """
+        Divides with remainder, rounding the quotient to the nearest Gaussian integer.
+
+        :param other: The non-zero divisor (GaussianInt/int).
+        :raises ZeroDivisionError: If other is zero.
+        :return: The (quotient, remainder) pair; the remainder's norm is at most half the divisor's.
+        """
+        parts = GaussianInt._coerce(other)
+        if parts is None:
+            return NotImplemented
+        if parts == (0, 0):
+            raise ZeroDivisionError("Cannot divide by zero")
+        x, y, r, s = _divmod_parts(self._re, self._im, *parts)
+        return GaussianInt._make(x, y), GaussianInt._make(r, s)
+
+    def __rdivmod__(self, other):
+        parts = GaussianInt._coerce(other)
+        if parts is None:
+            return NotImplemented
+        return divmod(GaussianInt._make(*parts), self)
+
+    def __floordiv__(self, other):
+        result = divmod(self, other)
+        return result if result is NotImplemented else result[0]
+
+    def __rfloordiv__(self, other):
+        result = self.__rdivmod__(other)
+        return result if result is NotImplemented else result[0]
+
+    def __mod__(self, other):
+        result = divmod(self, other)
+        return result if result is NotImplemented else result[1]
+
+    def __rmod__(self, other):
+        result = self.__rdivmod__(other)
+        return result if result is NotImplemented else result[1]
+
+    def __pow__(self, n: int, modulo: int|None = None):
+        if type(n) is not int:
+            raise TypeError("power should be int")
+        if n < 0:
+            return self.to_complex() ** n
+        if modulo is None:
+            return GaussianInt._make(*Complex._int_pow(self._re, self._im, n))
+        if type(modulo) is not int:
+            raise TypeError("modulus should be int")
+        if modulo <= 0:
+            raise ValueError("modulus must be a positive integer")
+        x, y = Complex._int_pow(self._re % modulo, self._im % modulo, n, modulo)
+        return GaussianInt._make(x % modulo, y % modulo)
+
+    def conjugate(self) -> 'GaussianInt':
+        return GaussianInt._make(self._re, -self._im)
+
+    def norm(self) -> int:
+        """
+        Calculates the norm Re**2 + Im**2, the squared modulus.
+
+        :return: The norm.
+        """
+        return self._re * self._re + self._im * self._im
+
+    def __bool__(self) -> bool:
+        return bool(self._re or self._im)
+
+    def __eq__(self, other):
+        parts = GaussianInt._coerce(other)
+        if parts is None:
+            return self.to_complex() == other if type(other) in _operand_parts else NotImplemented
+        return self._re == parts[0] and self._im == parts[1]
+
+    def __hash__(self):
+        # The Complex hash, so equal Complex and int values hash alike.
+        return _hash_complex(hash(self._re), hash(self._im))
+
+    @staticmethod
+    def gcd(a, b) -> 'GaussianInt':
+        """
+        Calculates the greatest common divisor with the Euclidean algorithm.
+
+        :param a: A GaussianInt or int.
+        :param b: A GaussianInt or int.
+        :raises TypeError: If an argument is not a GaussianInt or int.
+        :return: The gcd, normalized to the first quadrant; 0 if both arguments are 0.
+        """
+        a, b = GaussianInt._parts(a), GaussianInt._parts(b)
+        while b != (0, 0):
+            r, s = _divmod_parts(*a, *b)[2:]
+            a, b = b, (r, s)
+        if a == (0, 0):
+            return GaussianInt._make(0, 0)
+        return GaussianInt._make(*_normalized(*a)[:2])
+
+    @staticmethod
+    def xgcd(a, b) -> tuple['GaussianInt', 'GaussianInt', 'GaussianInt']:
+        """
+        Calculates the gcd together with Bezout coefficients.
+
+        :param a: A GaussianInt or int.
+        :param b: A GaussianInt or int.
+        :raises TypeError: If an argument is not a GaussianInt or int.
+        :return: (g, x, y) with a*x + b*y == g, where g is the gcd as returned by gcd().
+        """
+        (a0, a1), (b0, b1) = GaussianInt._parts(a), GaussianInt._parts(b)
+        # Invariant: a == a_in*x + b_in*y and b == a_in*u + b_in*v.
+        x0, x1, y0, y1 = 1, 0, 0, 0
+        u0, u1, v0, v1 = 0, 0, 1, 0
+        while b0 or b1:
+            q0, q1, r0, r1 = _divmod_parts(a0, a1, b0, b1)
+            a0, a1, b0, b1 = b0, b1, r0, r1
+            x0, x1, u0, u1 = u0, u1, x0 - (q0 * u0 - q1 * u1), x1 - (q0 * u1 + q1 * u0)
+            y0, y1, v0, v1 = v0, v1, y0 - (q0 * v0 - q1 * v1), y1 - (q0 * v1 + q1 * v0)
+        if not (a0 or a1):
+            zero = GaussianInt._make(0, 0)
+            return zero, zero, zero
+        g0, g1, w0, w1 = _normalized(a0, a1)
+        # Dividing by the unit w multiplies by its conjugate.
+        w1 = -w1
+        return (GaussianInt._make(g0, g1),
+                GaussianInt._make(x0 * w0 - x1 * w1, x0 * w1 + x1 * w0),
+                GaussianInt._make(y0 * w0 - y1 * w1, y0 * w1 + y1 * w0))
+
+    @staticmethod
+    def _parts(value) -> tuple[int, int]:
+        parts = GaussianInt._coerce(value)
+        if parts is None:
+            raise TypeError(f"Expected a GaussianInt or int, got {type(value)}")
+        return parts
+
+    def is_prime(self) -> bool:
+        """
+        Tests whether this is a Gaussian prime.
+
+        a + b*i is prime exactly when its norm is a rational prime, or when it is an
+        associate of a rational prime p = 3 (mod 4). Both cases reduce to one
+        Miller-Rabin test, deterministic for norms below 3.3 * 10**24.
+
+        :return: True if the number is a Gaussian prime.
+        """
+        a, b = abs(self._re), abs(self._im)
+        if a and b:
+            return _is_prime(a * a + b * b)
+        p = a or b
+        return p % 4 == 3 and _is_prime(p)
+
+    def factor(self) -> tuple['GaussianInt', list[tuple['GaussianInt', int]]]:
+        """
+        Factors into Gaussian primes.
+
+        The norm is factored over the integers; every rational prime p of it then
+        gives the Gaussian primes above it: 1 + i for p = 2, p itself for p = 3 (mod 4),
+        and gcd(p, k + i) with k**2 = -1 (mod p) and its conjugate for p = 1 (mod 4).
+        The norm is factored by trial division and Pollard's rho, which stays fast
+        while all but the largest prime factor of the norm are below about 10**12.
+
+        :raises ValueError: If the number is zero.
+        :return: (unit, factors) where the number equals unit times the product of
+            prime**exponent over factors; the primes are normalized to the first
+            quadrant and ordered by norm.
+        """
+        if not self:
+            raise ValueError("0 has no factorization")
+        a, b = self._re, self._im
+        factors = []
+
+        def divide_out(c: int, d: int):
+            nonlocal a, b
+            exponent = 0
+            while True:
+                x, y, r, s = _divmod_parts(a, b, c, d)
+                if r or s:
+                    break
+                a, b = x, y
+                exponent += 1
+            if exponent:
+                factors.append((GaussianInt._make(c, d), exponent))
+
+        for p in _factor_int(a * a + b * b):
+            if p == 2:
+                divide_out(1, 1)
+            elif p % 4 == 3:
+                divide_out(p, 0)
+            else:
+                # k = g**((p-1)/4) for a quadratic non-residue g is a square root of -1 mod p.
+                g = 2
+                while pow(g, (p - 1) // 2, p) != p - 1:
+                    g += 1
+                pi = GaussianInt.gcd(p, GaussianInt._make(pow(g, (p - 1) // 4, p), 1))
+                conjugate = _normalized(pi._re, -pi._im)[:2]
+                for c, d in sorted([(pi._re, pi._im), conjugate]):
+                    divide_out(c, d)
+        # p = 3 (mod 4) gives a prime of norm p**2, so the rational primes are not in norm order.
+        factors.sort(key=lambda factor: factor[0].norm())
+        return GaussianInt._make(a, b), factors
+
+    def __reduce__(self):
+        return GaussianInt, (self._re, self._im)
+
+    def __str__(self) -> str:
+        return str(self.to_complex())
+
+
+# Complex arithmetic accepts Gaussian integers as operands.
+_operand_parts[GaussianInt] = lambda value: (Rational._make(value._re, 1), Rational._make(value._im, 1))
@@ -0,0 +1,126 @@
+import unittest
+import pickle
+import random
+from rational import Rational
+from complex import Complex
+from gaussian import GaussianInt
+
+
+class TestGaussianInt(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(25)
+        self.pairs = []
+        while len(self.pairs) < 300:
+            a = GaussianInt(rng.randint(-10**6, 10**6), rng.randint(-10**6, 10**6))
+            b = GaussianInt(rng.randint(-999, 999), rng.randint(-999, 999))
+            if a and b:
+                self.pairs.append((a, b))
+
+    def test_arithmetic(self):
+        z = GaussianInt(3, 4)
+        self.assertEqual(z * z, GaussianInt(-7, 24))
+        self.assertEqual(z + 1, GaussianInt(4, 4))
+        self.assertEqual(2 - z, GaussianInt(-1, -4))
+        self.assertEqual(-z, GaussianInt(-3, -4))
+        self.assertEqual(z ** 3, GaussianInt(-117, 44))
+        self.assertEqual(pow(z, 5, 7), GaussianInt(*[x % 7 for x in ((z ** 5).Re, (z ** 5).Im)]))
+        self.assertEqual(z.conjugate(), GaussianInt(3, -4))
+        self.assertEqual(z.norm(), 25)
+        self.assertIs(type(z * 2), GaussianInt)
+
+    def test_mixed_with_complex(self):
+        z = GaussianInt(3, 4)
+        self.assertEqual(z / GaussianInt(1, 1), Complex(Rational(7, 2), Rational(1, 2)))
+        self.assertEqual(z + Rational(1, 2), Complex(Rational(7, 2), 4))
+        self.assertEqual(Complex(1, 1) * z, Complex(-1, 7))
+        self.assertEqual(z ** -1, Complex(Rational(3, 25), Rational(-4, 25)))
+        self.assertEqual(Complex(3, 4), z)
+        self.assertEqual(z, Complex(3, 4))
+        self.assertNotEqual(Complex(3, 0), z)
+        self.assertEqual(GaussianInt.from_complex(Complex(3, 4)), z)
+        with self.assertRaises(ValueError):
+            GaussianInt.from_complex(Complex(Rational(1, 2), 0))
+
+    def test_hash(self):
+        self.assertEqual(hash(GaussianInt(5, 0)), hash(5))
+        self.assertEqual(hash(GaussianInt(3, -4)), hash(complex(3, -4)))
+        self.assertEqual(hash(GaussianInt(3, 4)), hash(Complex(3, 4)))
+
+    def test_divmod(self):
+        for a, b in self.pairs:
+            q, r = divmod(a, b)
+            self.assertEqual(q * b + r, a)
+            self.assertLessEqual(2 * r.norm(), b.norm())
+            self.assertEqual(a // b, q)
+            self.assertEqual(a % b, r)
+        with self.assertRaises(ZeroDivisionError):
+            divmod(GaussianInt(1, 1), 0)
+
+    def test_gcd(self):
+        self.assertEqual(GaussianInt.gcd(GaussianInt(11, 3), GaussianInt(1, 8)), GaussianInt(2, 1))
+        self.assertEqual(GaussianInt.gcd(0, 0), 0)
+        self.assertEqual(GaussianInt.gcd(0, GaussianInt(-2, 0)), GaussianInt(2, 0))
+        for a, b in self.pairs:
+            g = GaussianInt.gcd(a, b)
+            self.assertTrue(g.Re > 0 and g.Im >= 0)
+            self.assertFalse(a % g or b % g)
+
+    def test_xgcd(self):
+        for a, b in self.pairs:
+            g, x, y = GaussianInt.xgcd(a, b)
+            self.assertEqual(a * x + b * y, g)
+            self.assertEqual(g, GaussianInt.gcd(a, b))
+        with self.assertRaises(TypeError):
+            GaussianInt.xgcd(GaussianInt(1, 1), Rational(1, 2))
+
+    def test_is_prime(self):
+        self.assertTrue(GaussianInt(1, 1).is_prime())
+        self.assertTrue(GaussianInt(2, 1).is_prime())
+        self.assertTrue(GaussianInt(0, -7).is_prime())
+        self.assertTrue(GaussianInt(2**61 - 1).is_prime())
+        self.assertFalse(GaussianInt(5).is_prime())
+        self.assertFalse(GaussianInt(2).is_prime())
+        self.assertFalse(GaussianInt(1).is_prime())
+        self.assertFalse(GaussianInt(3, 3).is_prime())
+
+    def test_factor(self):
+        for a, _ in self.pairs:
+            unit, factors = a.factor()
+            self.assertEqual(unit.norm(), 1)
+            product = unit
+            for prime, exponent in factors:
+                self.assertTrue(prime.is_prime())
+                self.assertTrue(prime.Re > 0 and prime.Im >= 0)
+                product = product * prime ** exponent
+            self.assertEqual(product, a)
+
+    def test_factor_norm_order(self):
+        unit, factors = GaussianInt(30).factor()
+        self.assertEqual([prime.norm() for prime, _ in factors], [2, 5, 5, 9])
+        self.assertEqual([exponent for _, exponent in factors], [2, 1, 1, 1])
+
+    def test_factor_large_prime_squared(self):
+        p = 2**61 - 1
+        unit, factors = GaussianInt(0, -3 * p * p).factor()
+        self.assertEqual(unit, GaussianInt(0, -1))
+        self.assertEqual(factors, [(GaussianInt(3), 1), (GaussianInt(p), 2)])
+        with self.assertRaises(ValueError):
+            GaussianInt(0).factor()
+
+    def test_pickle_and_str(self):
+        z = GaussianInt(-2, 5)
+        self.assertEqual(pickle.loads(pickle.dumps(z)), z)
+        self.assertEqual(str(z), str(Complex(-2, 5)))
+
+    def test_type_error(self):
+        with self.assertRaises(TypeError):
+            GaussianInt(1.5, 0)
+        with self.assertRaises(TypeError):
+            GaussianInt(1, 1) + "a"
+        with self.assertRaises(AttributeError):
+            GaussianInt(1, 1).Re = 2
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,179 @@
+from math import gcd
+from rational import Rational, _hash_parts
+
+class LazyRational:
+    """
+    A rational number that postpones gcd reduction.
+
+    Arithmetic keeps numerators and denominators unreduced and only normalizes when
+    the denominator grows past max_bits or when the value is observed through num/den,
+    __str__, __hash__ or a conversion. Equality is decided by cross-multiplication.
+    """
+    __slots__ = ('_num', '_den', '_reduced')
+
+    max_bits = 512
+
+    def __init__(self, num: int, den: int = 1):
+        if type(num) is not int:
+            raise TypeError("numerator must be an integer")
+        if type(den) is not int:
+            raise TypeError("denominator must be an integer")
+        if den == 0:
+            raise ValueError("denominator can't be 0")
+        if den < 0:
+            num, den = -num, -den
+        self._num = num
+        self._den = den
+        self._reduced = den == 1
+
+    @classmethod
+    def _make(cls, num: int, den: int) -> 'LazyRational':
+        """
+        Builds a lazy rational from parts with a positive denominator, reducing only if
+        the denominator has grown past max_bits.
+
+        :param num: The numerator.
+        :param den: The positive denominator.
+        :return: The lazy rational num/den.
+        """
+        obj = object.__new__(cls)
+        obj._num = num
+        obj._den = den
+        obj._reduced = den == 1
+        if den.bit_length() > cls.max_bits:
+            obj._normalize()
+        return obj
+
+    @staticmethod
+    def from_rational(value: Rational) -> 'LazyRational':
+        """
+        Converts a Rational to a LazyRational.
+
+        :param value: The rational number to convert.
+        :return: The same value as a LazyRational.
+        """
+        obj = LazyRational._make(value.num, value.den)
+        obj._reduced = True
+        return obj
+
+    def _normalize(self):
+        if not self._reduced:
+            common = gcd(self._num, self._den)
+            if common != 1:
+                self._num //= common
+                self._den //= common
+            self._reduced = True
+
+    @property
+    def num(self) -> int:
+        self._normalize()
+        return self._num
+
+    @property
+    def den(self) -> int:
+        self._normalize()
+        return self._den
+
+    def to_rational(self) -> Rational:
+        """
+        Normalizes the value and converts it to a Rational.
+
+        :return: The equivalent Rational.
+        """
+        self._normalize()
+        return Rational._make(self._num, self._den)
+
+    def __float__(self) -> float:
+        return self._num / self._den
+
+    @staticmethod
+    def _parts(other) -> tuple[int, int]:
+        if type(other) is LazyRational:
+            return other._num, other._den
+        if type(other) is Rational:
+            return other.num, other.den
+        if type(other) is int:
+            return other, 1
+        return None
+
+    def __add__(self, other):
+        parts = LazyRational._parts(other)
+        if parts is None:
+            return NotImplemented
+        num, den = parts
+        if den == self._den:
+            return LazyRational._make(self._num + num, den)
+        return LazyRational._make(self._num * den + num * self._den, self._den * den)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        obj = LazyRational._make(-self._num, self._den)
+        obj._reduced = self._reduced
+        return obj
+
+    def __sub__(self, other):
+        parts = LazyRational._parts(other)
+        if parts is None:
+            return NotImplemented
+        num, den = parts
+        if den == self._den:
+            return LazyRational._make(self._num - num, den)
+        return LazyRational._make(self._num * den - num * self._den, self._den * den)
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        parts = LazyRational._parts(other)
+        if parts is None:
+            return NotImplemented
+        num, den = parts
+        return LazyRational._make(self._num * num, self._den * den)
+
+    __rmul__ = __mul__
+
+    @staticmethod
+    def _divide(a: int, b: int, c: int, d: int) -> 'LazyRational':
+        if c == 0:
+            raise ValueError("denominator can't be 0")
+        if c < 0:
+            return LazyRational._make(-a * d, -b * c)
+        return LazyRational._make(a * d, b * c)
+
+    def __truediv__(self, other):
+        parts = LazyRational._parts(other)
+        if parts is None:
+            return NotImplemented
+        return LazyRational._divide(self._num, self._den, parts[0], parts[1])
+
+    def __rtruediv__(self, other):
+        parts = LazyRational._parts(other)
+        if parts is None:
+            return NotImplemented
+        return LazyRational._divide(parts[0], parts[1], self._num, self._den)
+
+    def __pow__(self, other):
+        if type(other) is not int:
+            raise TypeError("Exponent must be an integer")
+        if other >= 0:
+            return LazyRational._make(self._num ** other, self._den ** other)
+        return LazyRational._divide(1, 1, self._num ** -other, self._den ** -other)
+
+    def __eq__(self, other):
+        parts = LazyRational._parts(other)
+        if parts is None:
+            return False
+        num, den = parts
+        return self._num * den == num * self._den
+
+    def __hash__(self):
+        # Hashes like the equal Rational, int and Fraction values.
+        self._normalize()
+        return _hash_parts(self._num, self._den)
+
+    def __str__(self) -> str:
+        return str(self.to_rational())
+
+    def __repr__(self) -> str:
+        return f"LazyRational({self})"
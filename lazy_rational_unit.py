@@ -0,0 +1,85 @@
+import unittest
+import random
+from rational import Rational
+from lazy_rational import LazyRational
+
+class TestLazyRational(unittest.TestCase):
+
+    def test_init_keeps_unreduced(self):
+        r = LazyRational(4, 6)
+        self.assertEqual(r._num, 4)
+        self.assertEqual(r.num, 2)
+        self.assertEqual(r.den, 3)
+
+    def test_init_negative_den(self):
+        self.assertEqual(LazyRational(2, -4).to_rational(), Rational(-1, 2))
+
+    def test_init_type_error(self):
+        with self.assertRaises(TypeError):
+            LazyRational("a", 2)
+
+    def test_init_zero_den(self):
+        with self.assertRaises(ValueError):
+            LazyRational(1, 0)
+
+    def test_chain_matches_rational(self):
+        rng = random.Random(3)
+        values = [Rational(rng.randint(-100, 100), rng.randint(1, 20)) for _ in range(60)]
+        eager = Rational(0, 1)
+        lazy = LazyRational(0)
+        for i in range(0, len(values) - 2, 3):
+            a, b, c = values[i:i + 3]
+            eager = eager + a * b - c
+            lazy = lazy + LazyRational.from_rational(a) * b - c
+        self.assertEqual(lazy.to_rational(), eager)
+
+    def test_threshold_triggers_normalization(self):
+        old = LazyRational.max_bits
+        LazyRational.max_bits = 8
+        try:
+            r = LazyRational(1, 2**6) * LazyRational(2**6, 2**6)
+            self.assertEqual(r._den, 2**6)
+            self.assertTrue(r._reduced)
+        finally:
+            LazyRational.max_bits = old
+
+    def test_truediv(self):
+        self.assertEqual(LazyRational(1, 2) / LazyRational(-3, 4), Rational(-2, 3))
+        self.assertEqual(2 / LazyRational(4), Rational(1, 2))
+
+    def test_truediv_zero(self):
+        with self.assertRaises(ValueError):
+            _ = LazyRational(1, 2) / 0
+
+    def test_pow(self):
+        self.assertEqual(LazyRational(2, 4) ** 3, Rational(1, 8))
+        self.assertEqual(LazyRational(-2, 3) ** -3, Rational(-27, 8))
+
+    def test_reflected(self):
+        self.assertEqual(1 + LazyRational(1, 2), Rational(3, 2))
+        self.assertEqual(1 - LazyRational(1, 2), Rational(1, 2))
+        self.assertEqual(3 * LazyRational(1, 2), Rational(3, 2))
+
+    def test_eq_unreduced(self):
+        self.assertTrue(LazyRational(2, 4) == LazyRational(3, 6))
+        self.assertFalse(LazyRational(2, 4) == "a")
+
+    def test_hash_equal_values(self):
+        self.assertEqual(hash(LazyRational(2, 4)), hash(LazyRational(1, 2)))
+
+    def test_hash_matches_rational_and_int(self):
+        self.assertIn(LazyRational(2, 4), {Rational(1, 2)})
+        self.assertIn(LazyRational(6, 2), {3})
+        self.assertIn(LazyRational(-10, 4), {Rational(-5, 2): "x"})
+        self.assertEqual(hash(LazyRational(-6, 3)), hash(-2))
+
+    def test_str(self):
+        self.assertEqual(str(LazyRational(6, 4)), "3/2")
+        self.assertEqual(str(LazyRational(6, 3)), "2")
+
+    def test_float(self):
+        self.assertEqual(float(LazyRational(3, 4)), 0.75)
+
+
+if __name__ == '__main__':
+    unittest.main()
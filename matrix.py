@@ -0,0 +1,351 @@
+from rational import Rational
+from complex import Complex
+from math import gcd
+
+
+def _lcm(values) -> int:
+    d = 1
+    for value in values:
+        d = d // gcd(d, value) * value
+    return d
+
+
+def _gmul(a: tuple[int, int], b: tuple[int, int]) -> tuple[int, int]:
+    return a[0] * b[0] - a[1] * b[1], a[0] * b[1] + a[1] * b[0]
+
+
+def _gdiv(a: tuple[int, int], b: tuple[int, int]) -> tuple[int, int]:
+    # Exact division of Gaussian integers; Bareiss guarantees the remainder is zero.
+    norm = b[0] * b[0] + b[1] * b[1]
+    return (a[0] * b[0] + a[1] * b[1]) // norm, (a[1] * b[0] - a[0] * b[1]) // norm
+
+
+def _bareiss_int(rows: list[list[int]], pivot_cols: int) -> tuple[list[list[int]], list[int], int]:
+    """
+    Brings an integer matrix to fraction-free echelon form in place.
+
+    Every entry after step k is a (k+1)x(k+1) minor of the input, so the division by
+    the previous pivot is always exact and entry sizes grow only linearly.
+
+    :param rows: The matrix rows; modified in place.
+    :param pivot_cols: Only the first pivot_cols columns are searched for pivots.
+    :return: (rows, pivot column indices, sign of the row permutation).
+    """
+    n = len(rows)
+    m = len(rows[0]) if rows else 0
+    prev = 1
+    sign = 1
+    pivots = []
+    r = 0
+    for c in range(pivot_cols):
+        if r == n:
+            break
+        pivot = next((i for i in range(r, n) if rows[i][c] != 0), None)
+        if pivot is None:
+            continue
+        if pivot != r:
+            rows[r], rows[pivot] = rows[pivot], rows[r]
+            sign = -sign
+        pivot_row = rows[r]
+        p = pivot_row[c]
+        for i in range(r + 1, n):
+            row = rows[i]
+            factor = row[c]
+            for j in range(c + 1, m):
+                row[j] = (p * row[j] - factor * pivot_row[j]) // prev
+            row[c] = 0
+        prev = p
+        pivots.append(c)
+        r += 1
+    return rows, pivots, sign
+
+
+def _bareiss_gaussian(rows: list[list[tuple[int, int]]], pivot_cols: int) -> tuple[list, list[int], int]:
+    """
+    Gaussian integer counterpart of _bareiss_int; entries are (re, im) pairs.
+
+    :param rows: The matrix rows; modified in place.
+    :param pivot_cols: Only the first pivot_cols columns are searched for pivots.
+    :return: (rows, pivot column indices, sign of the row permutation).
+    """
+    n = len(rows)
+    m = len(rows[0]) if rows else 0
+    prev = (1, 0)
+    sign = 1
+    pivots = []
+    r = 0
+    for c in range(pivot_cols):
+        if r == n:
+            break
+        pivot = next((i for i in range(r, n) if rows[i][c] != (0, 0)), None)
+        if pivot is None:
+            continue
+        if pivot != r:
+            rows[r], rows[pivot] = rows[pivot], rows[r]
+            sign = -sign
+        pivot_row = rows[r]
+        p = pivot_row[c]
+        for i in range(r + 1, n):
+            row = rows[i]
+            factor = row[c]
+            for j in range(c + 1, m):
+                a = _gmul(p, row[j])
+                b = _gmul(factor, pivot_row[j])
+                row[j] = _gdiv((a[0] - b[0], a[1] - b[1]), prev)
+            row[c] = (0, 0)
+        prev = p
+        pivots.append(c)
+        r += 1
+    return rows, pivots, sign
+
+
+class RationalMatrix:
+    """
+    A dense matrix of Rational entries with exact fraction-free elimination.
+
+    Determinant, rank, solve and inverse clear the denominators row by row and run
+    Bareiss elimination on plain integers; only the final results are turned back
+    into Rational values.
+    """
+    __slots__ = ('_rows',)
+
+    def __init__(self, rows):
+        self._rows = [[self._entry(x) for x in row] for row in rows]
+        if any(len(row) != len(self._rows[0]) for row in self._rows):
+            raise ValueError("All matrix rows must have the same length")
+
+    @staticmethod
+    def _entry(value):
+        if type(value) is Rational:
+            return value
+        elif type(value) is int:
+            return Rational._make(value, 1)
+        else:
+            raise TypeError(f"RationalMatrix entries must be Rational/int, not {type(value)}")
+
+    @classmethod
+    def identity(cls, n: int):
+        """
+        Returns the n x n identity matrix.
+
+        :param n: The size of the matrix.
+        :return: The identity matrix.
+        """
+        return cls([[1 if i == j else 0 for j in range(n)] for i in range(n)])
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return len(self._rows), len(self._rows[0]) if self._rows else 0
+
+    @property
+    def rows(self) -> list[list]:
+        return [list(row) for row in self._rows]
+
+    def __getitem__(self, index):
+        i, j = index
+        return self._rows[i][j]
+
+    def _integer_rows(self, rows=None) -> tuple[list[list], list[int]]:
+        """
+        Multiplies every row by the lcm of its denominators.
+
+        :param rows: The rows to convert, self's rows by default.
+        :return: (integer rows, row scale factors).
+        """
+        result = []
+        scales = []
+        for row in (self._rows if rows is None else rows):
+            d = _lcm(x.den for x in row)
+            result.append([x.num * (d // x.den) for x in row])
+            scales.append(d)
+        return result, scales
+
+    _bareiss = staticmethod(_bareiss_int)
+
+    @staticmethod
+    def _ring_mul(a, b):
+        return a * b
+
+    @staticmethod
+    def _ring_sub(a, b):
+        return a - b
+
+    @staticmethod
+    def _ring_div(a, b):
+        return a // b
+
+    @staticmethod
+    def _from_ring(value, scale):
+        """
+        Converts an integer numerator over an integer denominator to an entry.
+        """
+        return Rational._reduced(value, scale)
+
+    def _check_square(self):
+        n, m = self.shape
+        if n != m:
+            raise ValueError("Matrix must be square")
+
+    def det(self):
+        """
+        Calculates the determinant.
+
+        :raises ValueError: If the matrix is not square.
+        :return: The exact determinant.
+        """
+        self._check_square()
+        n = len(self._rows)
+        if n == 0:
+            return self._from_ring(self._one, 1)
+        rows, scales = self._integer_rows()
+        rows, pivots, sign = self._bareiss(rows, n)
+        if len(pivots) < n:
+            return self._from_ring(self._zero, 1)
+        det = rows[n - 1][n - 1]
+        if sign < 0:
+            det = self._ring_sub(self._zero, det)
+        scale = 1
+        for s in scales:
+            scale *= s
+        return self._from_ring(det, scale)
+
+    def rank(self) -> int:
+        """
+        Calculates the rank.
+
+        :return: The number of linearly independent rows.
+        """
+        if not self._rows:
+            return 0
+        rows, _ = self._integer_rows()
+        _, pivots, _ = self._bareiss(rows, len(rows[0]))
+        return len(pivots)
+
+    def solve(self, b):
+        """
+        Solves self * x = b exactly.
+
+        The augmented system is eliminated fraction-free; back substitution then
+        yields det * x as exact ring elements, which are divided by det once.
+
+        :param b: The right-hand side: a list of entries or a matrix of the same type.
+        :raises ValueError: If the matrix is not square, sizes do not match or it is singular.
+        :return: A list of entries if b is a list, otherwise a matrix.
+        """
+        self._check_square()
+        n = len(self._rows)
+        is_vector = type(b) is not type(self)
+        b_rows = [[self._entry(x)] for x in b] if is_vector else b._rows
+        if len(b_rows) != n:
+            raise ValueError("Right-hand side has the wrong number of rows")
+        k = len(b_rows[0]) if b_rows else 0
+
+        rows, _ = self._integer_rows([a + r for a, r in zip(self._rows, b_rows)])
+        rows, pivots, _ = self._bareiss(rows, n)
+        if len(pivots) < n:
+            raise ValueError("Matrix is singular")
+
+        det = rows[n - 1][n - 1]
+        solution = [[None] * k for _ in range(n)]
+        for col in range(k):
+            for i in range(n - 1, -1, -1):
+                acc = self._ring_mul(det, rows[i][n + col])
+                for j in range(i + 1, n):
+                    acc = self._ring_sub(acc, self._ring_mul(rows[i][j], solution[j][col]))
+                solution[i][col] = self._ring_div(acc, rows[i][i])
+
+        det = self._from_ring(det, 1)
+        result = [[self._from_ring(y, 1) / det for y in row] for row in solution]
+        if is_vector:
+            return [row[0] for row in result]
+        return type(self)(result)
+
+    def inverse(self):
+        """
+        Calculates the inverse matrix.
+
+        :raises ValueError: If the matrix is not square or singular.
+        :return: The exact inverse.
+        """
+        self._check_square()
+        return self.solve(type(self).identity(len(self._rows)))
+
+    def __mul__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        n, m = self.shape
+        m2, k = other.shape
+        if m != m2:
+            raise ValueError("Matrix dimensions do not match")
+        columns = list(zip(*other._rows))
+        sum_entries = self._sum_entries
+        return type(self)([[sum_entries([a * b for a, b in zip(row, col)]) for col in columns]
+                           for row in self._rows])
+
+    _sum_entries = staticmethod(Rational.sum)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return False
+        return self._rows == other._rows
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        return "\n".join("[" + ", ".join(str(x) for x in row) + "]" for row in self._rows)
+
+    _zero = 0
+    _one = 1
+
+
+class ComplexMatrix(RationalMatrix):
+    """
+    A dense matrix of Complex entries with exact fraction-free elimination.
+
+    Rows are scaled to Gaussian integers and Bareiss elimination runs on (re, im)
+    integer pairs, where the pivot divisions are exact Gaussian integer divisions.
+    """
+    __slots__ = ()
+
+    @staticmethod
+    def _entry(value):
+        if type(value) is Complex:
+            return value
+        elif type(value) is Rational:
+            return Complex._make(value, Rational._make(0, 1))
+        elif type(value) is int:
+            return Complex._make(Rational._make(value, 1), Rational._make(0, 1))
+        else:
+            raise TypeError(f"ComplexMatrix entries must be Complex/Rational/int, not {type(value)}")
+
+    def _integer_rows(self, rows=None) -> tuple[list[list], list[int]]:
+        result = []
+        scales = []
+        for row in (self._rows if rows is None else rows):
+            d = _lcm(part.den for x in row for part in (x.Re, x.Im))
+            result.append([(x.Re.num * (d // x.Re.den), x.Im.num * (d // x.Im.den)) for x in row])
+            scales.append(d)
+        return result, scales
+
+    _bareiss = staticmethod(_bareiss_gaussian)
+
+    @staticmethod
+    def _ring_mul(a, b):
+        return _gmul(a, b)
+
+    @staticmethod
+    def _ring_sub(a, b):
+        return a[0] - b[0], a[1] - b[1]
+
+    @staticmethod
+    def _ring_div(a, b):
+        return _gdiv(a, b)
+
+    @staticmethod
+    def _from_ring(value, scale):
+        return Complex._make(Rational._reduced(value[0], scale), Rational._reduced(value[1], scale))
+
+    _sum_entries = staticmethod(Complex.sum)
+
+    _zero = (0, 0)
+    _one = (1, 0)
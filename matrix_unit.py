@@ -0,0 +1,111 @@
+import unittest
+import random
+from rational import Rational
+from complex import Complex
+from matrix import RationalMatrix, ComplexMatrix
+
+def naive_det(rows):
+    if len(rows) == 1:
+        return rows[0][0]
+    result = rows[0][0] * 0
+    for j, x in enumerate(rows[0]):
+        minor = [row[:j] + row[j + 1:] for row in rows[1:]]
+        term = x * naive_det(minor)
+        result = result + term if j % 2 == 0 else result - term
+    return result
+
+class TestRationalMatrix(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(11)
+        self.rows = [[Rational(rng.randint(-9, 9), rng.randint(1, 5)) for _ in range(5)] for _ in range(5)]
+        self.m = RationalMatrix(self.rows)
+
+    def test_init_errors(self):
+        with self.assertRaises(ValueError):
+            RationalMatrix([[1, 2], [3]])
+        with self.assertRaises(TypeError):
+            RationalMatrix([[1, 0.5]])
+
+    def test_det(self):
+        self.assertEqual(self.m.det(), naive_det(self.rows))
+        self.assertEqual(RationalMatrix([[Rational(1, 2), 1], [3, 4]]).det(), Rational(-1, 1))
+
+    def test_det_localcontext(self):
+        m = RationalMatrix([[Rational(1, 7), 1], [Rational(1, 3), Rational(1, 11)]])
+        exact = m.det()
+        with Rational.localcontext(max_den=10):
+            self.assertEqual(m.det(), exact.limit_denominator(10))
+
+    def test_det_needs_pivoting(self):
+        self.assertEqual(RationalMatrix([[0, 1], [1, 0]]).det(), -1)
+
+    def test_det_singular(self):
+        self.assertEqual(RationalMatrix([[1, 2], [Rational(1, 2), 1]]).det(), 0)
+
+    def test_det_not_square(self):
+        with self.assertRaises(ValueError):
+            RationalMatrix([[1, 2, 3], [4, 5, 6]]).det()
+
+    def test_rank(self):
+        self.assertEqual(self.m.rank(), 5)
+        self.assertEqual(RationalMatrix([[1, 2, 3], [2, 4, 6], [0, 0, 1]]).rank(), 2)
+        self.assertEqual(RationalMatrix([[0, 0], [0, 0]]).rank(), 0)
+        self.assertEqual(RationalMatrix([[0, 1, 2], [0, 2, 5]]).rank(), 2)
+
+    def test_solve_vector(self):
+        x = [Rational(1, 2), -3, Rational(7, 9), 0, 2]
+        b = [Rational.sum([a * v for a, v in zip(row, x)]) for row in self.rows]
+        self.assertEqual(self.m.solve(b), x)
+
+    def test_solve_singular(self):
+        with self.assertRaises(ValueError):
+            RationalMatrix([[1, 2], [2, 4]]).solve([1, 2])
+
+    def test_inverse(self):
+        inverse = self.m.inverse()
+        self.assertEqual(self.m * inverse, RationalMatrix.identity(5))
+        self.assertEqual(inverse * self.m, RationalMatrix.identity(5))
+
+    def test_large_entries(self):
+        rng = random.Random(3)
+        rows = [[Rational(rng.randint(-10**30, 10**30), rng.randint(1, 10**20)) for _ in range(8)] for _ in range(8)]
+        m = RationalMatrix(rows)
+        self.assertEqual(m * m.inverse(), RationalMatrix.identity(8))
+
+
+class TestComplexMatrix(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(13)
+        def rand_complex():
+            return Complex(Rational(rng.randint(-9, 9), rng.randint(1, 4)), Rational(rng.randint(-9, 9), rng.randint(1, 4)))
+        self.rows = [[rand_complex() for _ in range(4)] for _ in range(4)]
+        self.m = ComplexMatrix(self.rows)
+
+    def test_det(self):
+        self.assertEqual(self.m.det(), naive_det(self.rows))
+
+    def test_det_singular(self):
+        m = ComplexMatrix([[Complex(1, 1), 2], [Complex(2, 2), 4]])
+        self.assertEqual(m.det(), 0)
+
+    def test_rank(self):
+        self.assertEqual(self.m.rank(), 4)
+        self.assertEqual(ComplexMatrix([[Complex(0, 1), 1], [-1, Complex(0, 1)]]).rank(), 1)
+
+    def test_solve(self):
+        x = [Complex(1, 2), Rational(1, 3), Complex(0, -1), 4]
+        b = [Complex.sum([a * v for a, v in zip(row, x)]) for row in self.rows]
+        self.assertEqual(self.m.solve(b), x)
+
+    def test_inverse(self):
+        self.assertEqual(self.m * self.m.inverse(), ComplexMatrix.identity(4))
+
+    def test_entry_type_error(self):
+        with self.assertRaises(TypeError):
+            ComplexMatrix([["a"]])
+
+
+if __name__ == '__main__':
+    unittest.main()
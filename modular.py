@@ -0,0 +1,423 @@
+from rational import Rational
+from complex import Complex
+from matrix import RationalMatrix, ComplexMatrix
+from concurrent.futures import ProcessPoolExecutor
+from math import gcd, isqrt
+import numpy as np
+
+# Primes below 2**31 keep every product of two residues below 2**62, inside int64.
+_PRIME_LIMIT = 2**31
+
+# Limbs per block of the residue dot product: 2**15 products below 2**47 sum below 2**62.
+_LIMB_BLOCK = 2**15
+
+# Miller-Rabin witnesses: the first set is deterministic below 2**32, the second below
+# 3.3 * 10**24; above that the test is a strong probable-prime test.
+_WORD_WITNESSES = (2, 7, 61)
+_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+
+def _is_prime(n: int) -> bool:
+    """
+    Miller-Rabin test, deterministic for n < 3.3 * 10**24.
+
+    :param n: The number to test.
+    :return: True if n is (probably, for larger n) prime.
+    """
+    if n < 2:
+        return False
+    for p in _WITNESSES:
+        if n % p == 0:
+            return n == p
+    d = n - 1
+    s = 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    for a in _WORD_WITNESSES if n < 2**32 else _WITNESSES:
+        x = pow(a, d, n)
+        if x in (1, n - 1) or a % n == 0:
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+
+def _primes(gaussian: bool):
+    """
+    Yields word-sized primes in decreasing order.
+
+    :param gaussian: If True, only primes p = 1 (mod 4) are produced, together with a
+                     square root of -1 modulo p.
+    :return: An iterator of (p, sqrt(-1) mod p or None).
+    """
+    candidate = _PRIME_LIMIT - 1
+    while candidate > 2**16:
+        if _is_prime(candidate) and (not gaussian or candidate % 4 == 1):
+            if not gaussian:
+                yield candidate, None
+            else:
+                g = 2
+                while pow(g, (candidate - 1) // 2, candidate) != candidate - 1:
+                    g += 1
+                yield candidate, pow(g, (candidate - 1) // 4, candidate)
+        candidate -= 2 if candidate % 2 else 1
+
+
+def _inverse_mod(x: np.ndarray, p: np.ndarray) -> np.ndarray:
+    """
+    Inverts residues elementwise; one builtin pow per prime beats vectorized exponentiation.
+
+    :param x: Non-zero residues.
+    :param p: The prime for every residue.
+    :return: The inverses.
+    """
+    return np.array([pow(v, -1, q) for v, q in zip(x.tolist(), p.tolist())], dtype=np.int64)
+
+
+def _eliminate_mod(a: np.ndarray, n: int, p: np.ndarray) -> tuple:
+    """
+    Runs Gaussian elimination on a stack of matrices, one per prime, in place.
+
+    Each step works on all primes at once, so the Python-level cost is paid per
+    column rather than per column and prime. Every product of two residues is
+    below p**2 < 2**62, so the row updates never overflow int64. Pivot rows are
+    scaled to a leading 1, and the right-hand side columns are solved by back
+    substitution.
+
+    :param a: The stacked augmented matrices, shape (primes, n, n + k), entries in [0, p).
+    :param n: The number of rows (and of coefficient columns).
+    :param p: The prime for every matrix.
+    :return: (det mod p, solutions mod p with shape (primes, n, k), singular flags) per prime.
+    """
+    index = np.arange(a.shape[0])
+    modulus = p[:, None, None]
+    det = np.ones_like(p)
+    singular = np.zeros(a.shape[0], dtype=bool)
+    for c in range(n):
+        nonzero = a[:, c:, c] != 0
+        r = c + np.argmax(nonzero, axis=1)
+        found = nonzero[index, r - c]
+        singular |= ~found
+        swap = r != c
+        if swap.any():
+            top = a[index, c].copy()
+            a[index, c] = a[index, r]
+            a[index, r] = top
+            det = np.where(swap, (p - det) % p, det)
+        pivot = np.where(found, a[index, c, c], 1)
+        det = det * pivot % p
+        a[:, c, c:] = a[:, c, c:] * _inverse_mod(pivot, p)[:, None] % p[:, None]
+
+        block = a[:, c + 1:, c:]
+        block -= block[:, :, :1] * a[:, c, None, c:] % modulus
+        block += (block < 0) * modulus
+    det[singular] = 0
+
+    solution = a[:, :, n:]
+    for i in range(n - 2, -1, -1):
+        # Every product is reduced before summing, so n terms below 2**31 fit int64.
+        products = a[:, i, i + 1:n, None] * solution[:, i + 1:] % modulus
+        solution[:, i] = (solution[:, i] - products.sum(axis=1)) % p[:, None]
+    return det, solution, singular
+
+
+def _residues(values: list[int], p: np.ndarray) -> np.ndarray:
+    """
+    Reduces Python integers modulo many primes at once.
+
+    Each |value| is split into 16-bit limbs, so value mod p is the dot product of its
+    limbs with 2**(16*j) mod p. The limb products stay below 2**47, and the dot product
+    is summed in blocks of _LIMB_BLOCK limbs reduced mod p in between, so the sums fit
+    int64 for values of any size.
+
+    :param values: The integers.
+    :param p: The primes.
+    :return: An array of shape (len(values), len(p)) with entries in [0, p).
+    """
+    size = max((abs(x).bit_length() for x in values), default=0) // 16 + 1
+    data = b"".join(abs(x).to_bytes(2 * size, "little") for x in values)
+    limbs = np.frombuffer(data, dtype="<u2").reshape(len(values), size).astype(np.int64)
+    weights = np.empty((size, len(p)), dtype=np.int64)
+    weights[0] = 1
+    shift = (1 << 16) % p
+    for j in range(1, size):
+        weights[j] = weights[j - 1] * shift % p
+    result = np.zeros((len(values), len(p)), dtype=np.int64)
+    for start in range(0, size, _LIMB_BLOCK):
+        block = slice(start, start + _LIMB_BLOCK)
+        result = (result + limbs[:, block] @ weights[block]) % p
+    negative = np.array([x < 0 for x in values])
+    result[negative] = (p - result[negative]) % p
+    return result
+
+
+def _work(task) -> list:
+    """
+    Solves one batch of primes; runs in a worker process.
+
+    :param task: (integer rows, primes with their sqrt(-1), gaussian flag).
+    :return: A list of (p, det residue, solution residues or None) per prime.
+    """
+    rows, primes, gaussian = task
+    n = len(rows)
+    m = len(rows[0])
+    p = np.array([q for q, _ in primes], dtype=np.int64)
+    if not gaussian:
+        a = _residues([x for row in rows for x in row], p).T.reshape(len(p), n, m)
+        det, solution, singular = _eliminate_mod(a, n, p)
+        return [(int(p[k]), int(det[k]), None if singular[k] else solution[k].tolist())
+                for k in range(len(p))]
+
+    # a + b*i maps to a + b*root and a - b*root; both are ring homomorphisms onto Z/p.
+    root = np.array([s for _, s in primes], dtype=np.int64)
+    re = _residues([x for row in rows for x, _ in row], p)
+    im = _residues([y for row in rows for _, y in row], p) * root % p
+    plus = _eliminate_mod(((re + im) % p).T.reshape(len(p), n, m), n, p)
+    minus = _eliminate_mod(((re - im) % p).T.reshape(len(p), n, m), n, p)
+    half = _inverse_mod(np.full_like(p, 2), p)
+    half_root = _inverse_mod(2 * root % p, p)
+
+    det_re = (plus[0] + minus[0]) % p * half % p
+    det_im = (plus[0] - minus[0]) % p * half_root % p
+    sol_re = (plus[1] + minus[1]) % p[:, None, None] * half[:, None, None] % p[:, None, None]
+    sol_im = (plus[1] - minus[1]) % p[:, None, None] * half_root[:, None, None] % p[:, None, None]
+    results = []
+    for k in range(len(p)):
+        solution = None
+        if not (plus[2][k] or minus[2][k]):
+            solution = [[(int(x), int(y)) for x, y in zip(row_re, row_im)]
+                        for row_re, row_im in zip(sol_re[k].tolist(), sol_im[k].tolist())]
+        results.append((int(p[k]), (int(det_re[k]), int(det_im[k])), solution))
+    return results
+
+
+def crt(residues: list[int], modulus: int, images: list[int], p: int) -> list[int]:
+    """
+    Combines x = residues[k] (mod modulus) with x = images[k] (mod p) for coprime moduli.
+
+    :param residues: The residues modulo modulus.
+    :param modulus: The first modulus.
+    :param images: The residues modulo p.
+    :param p: The second modulus.
+    :return: The residues modulo modulus * p, each in [0, modulus * p).
+    """
+    inverse = pow(modulus % p, -1, p)
+    return [r + modulus * ((a - r) * inverse % p) for r, a in zip(residues, images)]
+
+
+def _symmetric(value: int, modulus: int) -> int:
+    return value - modulus if value > modulus // 2 else value
+
+
+def rational_reconstruction(u: int, m: int) -> Rational|None:
+    """
+    Finds n/d = u (mod m) with |n|, d <= sqrt(m/2), using the extended Euclidean algorithm.
+
+    :param u: The residue.
+    :param m: The modulus.
+    :return: The unique such Rational, or None if it does not exist.
+    """
+    bound = isqrt(m // 2)
+    r0, r1 = m, u % m
+    s0, s1 = 0, 1
+    while r1 > bound:
+        q = r0 // r1
+        r0, r1 = r1, r0 - q * r1
+        s0, s1 = s1, s0 - q * s1
+    if s1 == 0 or abs(s1) > bound:
+        return None
+    num, den = (r1, s1) if s1 > 0 else (-r1, -s1)
+    if gcd(num, den) != 1:
+        return None
+    return Rational._make(num, den)
+
+
+def _hadamard_bound(rows: list[list], gaussian: bool) -> int:
+    bound = 1
+    for row in rows:
+        if gaussian:
+            squares = sum(a * a + b * b for a, b in row)
+        else:
+            squares = sum(x * x for x in row)
+        bound *= isqrt(squares) + 1
+    return bound
+
+
+class _Engine:
+    """
+    Drives rounds of per-prime work; the caller combines each round and decides when to stop.
+
+    Rounds double in size, so an early stop wastes at most one round, but they never
+    go past the primes still needed to reach the hard bound.
+    """
+
+    def __init__(self, rows: list[list], gaussian: bool, workers: int, limit: int):
+        self.rows = rows
+        self.gaussian = gaussian
+        self.workers = max(workers, 1)
+        self.primes = _primes(gaussian)
+        self.chunk = 1
+        self.bits = limit.bit_length()
+
+    def rounds(self):
+        executor = ProcessPoolExecutor(self.workers) if self.workers > 1 else None
+        try:
+            while True:
+                needed = -(-self.bits // (30 * self.workers))
+                chunk = max(1, min(self.chunk, needed))
+                tasks = [(self.rows, [next(self.primes) for _ in range(chunk)], self.gaussian)
+                         for _ in range(self.workers)]
+                if executor is None:
+                    batches = [_work(task) for task in tasks]
+                else:
+                    batches = list(executor.map(_work, tasks))
+                self.chunk *= 2
+                self.bits -= 30 * chunk * self.workers
+                yield [result for batch in batches for result in batch]
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+
+def _check_type(matrix):
+    if type(matrix) not in (RationalMatrix, ComplexMatrix):
+        raise TypeError(f"Expected a RationalMatrix or ComplexMatrix, not {type(matrix)}")
+
+
+def _integer_form(matrix) -> tuple[list[list], list[int], bool]:
+    rows, scales = matrix._integer_rows()
+    return rows, scales, type(matrix) is ComplexMatrix
+
+
+def det(matrix, workers: int = 1):
+    """
+    Calculates an exact determinant with multi-modular arithmetic.
+
+    The integer-scaled matrix is reduced modulo word-sized primes and eliminated
+    per prime with NumPy kernels; the images are combined with the CRT. The loop
+    stops early once an extra round of primes leaves the value unchanged, and in
+    any case once the product of primes exceeds twice the Hadamard bound.
+
+    :param matrix: A square RationalMatrix or ComplexMatrix.
+    :param workers: The number of worker processes for the per-prime work.
+    :raises ValueError: If the matrix is not square.
+    :return: The determinant as a Rational or Complex.
+    """
+    _check_type(matrix)
+    matrix._check_square()
+    rows, scales, gaussian = _integer_form(matrix)
+    if not rows:
+        return matrix.det()
+    scale = 1
+    for s in scales:
+        scale *= s
+    limit = 2 * _hadamard_bound(rows, gaussian)
+
+    modulus = 1
+    residues = [0, 0]
+    previous = None
+    for results in _Engine(rows, gaussian, workers, limit).rounds():
+        for p, value, _ in results:
+            residues = crt(residues, modulus, value if gaussian else (value, 0), p)
+            modulus *= p
+        current = [_symmetric(r, modulus) for r in residues]
+        if current == previous or modulus > limit:
+            break
+        previous = current
+
+    if gaussian:
+        return Complex._make(Rational._reduced(current[0], scale), Rational._reduced(current[1], scale))
+    return Rational._reduced(current[0], scale)
+
+
+def solve(matrix, b, workers: int = 1) -> list:
+    """
+    Solves matrix * x = b exactly with multi-modular arithmetic.
+
+    Each prime gives the solution modulo p; the images are combined with the CRT and
+    turned into rationals by rational reconstruction. As soon as every component
+    reconstructs, the candidate is verified exactly against the system.
+
+    :param matrix: A square, non-singular RationalMatrix or ComplexMatrix.
+    :param b: The right-hand side as a list of entries.
+    :param workers: The number of worker processes for the per-prime work.
+    :raises ValueError: If the matrix is not square, b has the wrong size, or the matrix is singular.
+    :return: The solution as a list of Rational or Complex entries.
+    """
+    _check_type(matrix)
+    matrix._check_square()
+    n = matrix.shape[0]
+    if len(b) != n:
+        raise ValueError("Right-hand side has the wrong number of rows")
+    if n == 0:
+        return []
+    augmented = type(matrix)([row + [x] for row, x in zip(matrix.rows, b)])
+    rows, _, gaussian = _integer_form(augmented)
+    # A prime is unlucky only if it divides det; once their product passes the
+    # Hadamard bound, det must be zero.
+    limit = 2 * _hadamard_bound([row[:n] for row in rows], gaussian)
+    # By Cramer's rule numerators and denominators are minors of the augmented matrix;
+    # complex parts carry an extra factor conj(det) on both.
+    bound = _hadamard_bound(rows, gaussian) ** (4 if gaussian else 2)
+
+    modulus = 1
+    unlucky = 1
+    residues = [0] * (2 * n if gaussian else n)
+    for results in _Engine(rows, gaussian, workers, 2 * bound).rounds():
+        for p, _, solution in results:
+            if solution is None:
+                unlucky *= p
+                continue
+            images = [part for row in solution for part in row[0]] if gaussian else [row[0] for row in solution]
+            residues = crt(residues, modulus, images, p)
+            modulus *= p
+        if unlucky > limit:
+            raise ValueError("Matrix is singular")
+
+        candidate = _reconstruct(residues, modulus, gaussian)
+        if candidate is not None and _verify(matrix, candidate, b):
+            return candidate
+
+
+def _reconstruct(residues: list[int], modulus: int, gaussian: bool) -> list|None:
+    """
+    Turns solution residues into rationals.
+
+    The components of a solution share most of their denominator, so every residue is
+    first scaled by the denominators found so far; usually the result is already a
+    small integer and the Euclidean reconstruction is needed only a few times.
+
+    :param residues: The residues of the solution parts (re, im interleaved if gaussian).
+    :param modulus: The product of the primes.
+    :param gaussian: If True, pairs of parts are combined to Complex values.
+    :return: The candidate solution, or None if some part does not reconstruct.
+    """
+    bound = isqrt(modulus // 2)
+    den = 1
+    parts = []
+    for residue in residues:
+        scaled = _symmetric(residue * den % modulus, modulus)
+        if abs(scaled) <= bound and den <= bound:
+            parts.append(Rational._reduced(scaled, den))
+            continue
+        x = rational_reconstruction(scaled, modulus)
+        if x is None:
+            return None
+        parts.append(Rational._reduced(x.num, x.den * den))
+        den *= x.den
+    if gaussian:
+        return [Complex._make(parts[k], parts[k + 1]) for k in range(0, len(parts), 2)]
+    return parts
+
+
+def _verify(matrix, x: list, b: list) -> bool:
+    sum_entries = Complex.sum if type(matrix) is ComplexMatrix else Rational.sum
+    for row, rhs in zip(matrix.rows, b):
+        if sum_entries([a * v for a, v in zip(row, x)]) != rhs:
+            return False
+    return True
@@ -0,0 +1,99 @@
+import unittest
+import random
+import itertools
+import numpy as np
+from rational import Rational
+from complex import Complex
+from matrix import RationalMatrix, ComplexMatrix
+import modular
+
+class TestModular(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(15)
+        self.rows = [[Rational(rng.randint(-10**6, 10**6), rng.randint(1, 50)) for _ in range(8)] for _ in range(8)]
+        self.m = RationalMatrix(self.rows)
+        self.c_rows = [[Complex(Rational(rng.randint(-99, 99), rng.randint(1, 9)), rng.randint(-99, 99))
+                        for _ in range(5)] for _ in range(5)]
+        self.c = ComplexMatrix(self.c_rows)
+
+    def test_is_prime(self):
+        small = [n for n in range(2, 5000) if all(n % d for d in range(2, int(n ** 0.5) + 1))]
+        self.assertEqual([n for n in range(5000) if modular._is_prime(n)], small)
+        self.assertTrue(modular._is_prime(2**31 - 1))
+        self.assertTrue(modular._is_prime(2**61 - 1))
+        self.assertFalse(modular._is_prime(3215031751))
+        self.assertFalse(modular._is_prime((2**31 - 1) * (2**61 - 1)))
+
+    def test_rational_reconstruction(self):
+        m = 1000003 * 1000033
+        for value in (Rational(3, 7), Rational(-22, 5), Rational(0, 1), Rational(1, 1)):
+            residue = value.num * pow(value.den, -1, m) % m
+            self.assertEqual(modular.rational_reconstruction(residue, m), value)
+
+    def test_rational_reconstruction_fails(self):
+        self.assertIsNone(modular.rational_reconstruction(5, 7))
+
+    def test_crt(self):
+        x, y = modular.crt([2, 0], 3, [3, 4], 5)
+        self.assertEqual((x % 3, x % 5, y % 3, y % 5), (2, 3, 0, 4))
+        self.assertTrue(0 <= x < 15 and 0 <= y < 15)
+
+    def test_det(self):
+        self.assertEqual(modular.det(self.m), self.m.det())
+
+    def test_det_singular(self):
+        self.assertEqual(modular.det(RationalMatrix([[1, 2], [Rational(1, 2), 1]])), 0)
+
+    def test_det_large_entries(self):
+        m = RationalMatrix([[10**40 + i * j for j in range(4)] for i in range(1, 5)])
+        self.assertEqual(modular.det(m), m.det())
+
+    def test_residues_huge_entry(self):
+        # Over 2**16 limbs the unblocked int64 dot product used to wrap.
+        primes = [p for p, _ in itertools.islice(modular._primes(False), 4)]
+        x = 2**(2**22) - 1
+        residues = modular._residues([x, -x, 5], np.array(primes, dtype=np.int64))
+        self.assertEqual(residues.tolist(), [[v % p for p in primes] for v in (x, -x, 5)])
+        rows = [[x, 1], [1, 1]]
+        for p, det, _ in modular._work((rows, [(p, None) for p in primes], False)):
+            self.assertEqual(det, (x - 1) % p)
+
+    def test_det_complex(self):
+        self.assertEqual(modular.det(self.c), self.c.det())
+
+    def test_det_not_square(self):
+        with self.assertRaises(ValueError):
+            modular.det(RationalMatrix([[1, 2, 3], [4, 5, 6]]))
+
+    def test_det_type_error(self):
+        with self.assertRaises(TypeError):
+            modular.det([[1, 2], [3, 4]])
+
+    def test_solve(self):
+        x = [Rational(1, 2), -3, Rational(7, 9), 0, 2, Rational(-10**12, 3), 5, 1]
+        b = [Rational.sum([a * v for a, v in zip(row, x)]) for row in self.rows]
+        self.assertEqual(modular.solve(self.m, b), x)
+
+    def test_solve_complex(self):
+        x = [Complex(1, 2), Complex(Rational(1, 3), -1), 0, Complex(5, 0), Complex(0, Rational(-7, 2))]
+        b = [Complex.sum([a * v for a, v in zip(row, x)]) for row in self.c_rows]
+        self.assertEqual(modular.solve(self.c, b), x)
+
+    def test_solve_singular(self):
+        with self.assertRaises(ValueError):
+            modular.solve(RationalMatrix([[1, 2], [2, 4]]), [1, 2])
+
+    def test_solve_wrong_size(self):
+        with self.assertRaises(ValueError):
+            modular.solve(self.m, [1, 2])
+
+    def test_solve_type_error(self):
+        with self.assertRaises(TypeError):
+            modular.solve([[1, 2], [3, 4]], [1, 2])
+
+    def test_workers(self):
+        self.assertEqual(modular.det(self.m, workers=2), self.m.det())
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,136 @@
+from rational import Rational
+from complex import Complex
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain, repeat
+import os
+import sys
+
+# Every worker gets about this many shards, so an uneven shard does not leave the others idle.
+_SHARDS_PER_WORKER = 4
+
+_REDUCERS = {
+    "sum": (Rational.sum, Complex.sum),
+    "prod": (Rational.prod, Complex.prod),
+}
+
+
+def _gil_disabled() -> bool:
+    """
+    Tells whether this interpreter is a free-threaded build running without the GIL.
+    """
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is not None and not is_gil_enabled()
+
+
+def _workers(workers: int|None) -> int:
+    if workers is None:
+        return os.cpu_count() or 1
+    if workers <= 0:
+        raise ValueError("workers must be a positive integer")
+    return workers
+
+
+def _shards(values: list, workers: int, chunk_size: int|None) -> list[list]:
+    if chunk_size is None:
+        chunk_size = max(1, -(-len(values) // (workers * _SHARDS_PER_WORKER)))
+    elif chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    return [values[i:i + chunk_size] for i in range(0, len(values), chunk_size)]
+
+
+def _run(task, shards: list[list], workers: int, executor, args=()) -> list:
+    """
+    Runs task(*args, shard) for every shard and returns the results in shard order.
+
+    A single shard runs in the calling thread. Otherwise the shards go to executor,
+    or to a pool created for the call: a thread pool on free-threaded builds, a
+    process pool everywhere else.
+    """
+    if executor is None and (workers == 1 or len(shards) <= 1):
+        return [task(*args, shard) for shard in shards]
+    arguments = [repeat(arg, len(shards)) for arg in args]
+    if executor is not None:
+        return list(executor.map(task, *arguments, shards))
+    pool = ThreadPoolExecutor if _gil_disabled() else ProcessPoolExecutor
+    with pool(min(workers, len(shards))) as executor:
+        return list(executor.map(task, *arguments, shards))
+
+
+def _map_shard(func, shard: list) -> list:
+    return [func(value) for value in shard]
+
+
+def _starmap_shard(func, shard: list) -> list:
+    return [func(*args) for args in shard]
+
+
+def _reduce_shard(op: str, shard: list):
+    rational_reduce, complex_reduce = _REDUCERS[op]
+    if any(type(value) is Complex for value in shard):
+        return complex_reduce(shard)
+    return rational_reduce(shard)
+
+
+def map(func, values, workers: int|None = None, chunk_size: int|None = None, executor=None) -> list:
+    """
+    Applies func to every value in parallel.
+
+    The values are split into contiguous shards and every shard is mapped by one
+    task. With a process pool, func and the values must be picklable (func a
+    module-level function, not a lambda); Rational and Complex pickle as plain ints.
+    A PrecisionContext or interning enabled in the calling process is not applied
+    inside worker processes.
+
+    :param func: The function to apply.
+    :param values: An iterable of arguments.
+    :param workers: The number of workers; defaults to os.cpu_count().
+    :param chunk_size: The number of values per shard; by default every worker gets a few shards.
+    :param executor: A concurrent.futures executor to use instead of creating a pool for this call.
+    :raises ValueError: If workers or chunk_size is not positive.
+    :return: The results in the order of values.
+    """
+    workers = _workers(workers)
+    shards = _shards(list(values), workers, chunk_size)
+    return list(chain.from_iterable(_run(_map_shard, shards, workers, executor, (func,))))
+
+
+def starmap(func, arg_tuples, workers: int|None = None, chunk_size: int|None = None, executor=None) -> list:
+    """
+    Calls func(*args) for every tuple of arguments in parallel; see map().
+
+    :param func: The function to call.
+    :param arg_tuples: An iterable of argument tuples.
+    :param workers: The number of workers; defaults to os.cpu_count().
+    :param chunk_size: The number of calls per shard; by default every worker gets a few shards.
+    :param executor: A concurrent.futures executor to use instead of creating a pool for this call.
+    :raises ValueError: If workers or chunk_size is not positive.
+    :return: The results in the order of arg_tuples.
+    """
+    workers = _workers(workers)
+    shards = _shards(list(arg_tuples), workers, chunk_size)
+    return list(chain.from_iterable(_run(_starmap_shard, shards, workers, executor, (func,))))
+
+
+def reduce(values, op: str = "sum", workers: int|None = None, chunk_size: int|None = None,
+           executor=None) -> Rational|Complex:
+    """
+    Calculates the exact sum or product of an iterable in parallel.
+
+    Every shard is reduced with Rational.sum/prod, or Complex.sum/prod if it holds
+    a Complex, and the partial results are combined the same way, so both levels
+    use the tree-shaped reduction. See map() for the requirements of a process pool.
+
+    :param values: An iterable of Complex/Rational/int terms.
+    :param op: "sum" or "prod".
+    :param workers: The number of workers; defaults to os.cpu_count().
+    :param chunk_size: The number of terms per shard; by default every worker gets a few shards.
+    :param executor: A concurrent.futures executor to use instead of creating a pool for this call.
+    :raises ValueError: If op is unknown, or workers or chunk_size is not positive.
+    :raises TypeError: If a term is not a supported number.
+    :return: The sum or product; a Rational unless a term is a Complex.
+    """
+    if op not in _REDUCERS:
+        raise ValueError(f"op must be one of {', '.join(_REDUCERS)}")
+    workers = _workers(workers)
+    shards = _shards(list(values), workers, chunk_size)
+    return _reduce_shard(op, _run(_reduce_shard, shards, workers, executor, (op,)))
@@ -0,0 +1,90 @@
+import unittest
+import pickle
+import random
+from concurrent.futures import ThreadPoolExecutor
+from rational import Rational
+from complex import Complex
+import parallel
+
+
+def square(value):
+    return value * value
+
+
+def scale(value, factor):
+    return value * factor
+
+
+class TestPickling(unittest.TestCase):
+
+    def test_rational_round_trip(self):
+        value = Rational(-3**80, 7**40)
+        hash(value)
+        restored = pickle.loads(pickle.dumps(value))
+        self.assertEqual(restored, value)
+        self.assertEqual((restored.num, restored.den), (value.num, value.den))
+        self.assertEqual(hash(restored), hash(value))
+
+    def test_complex_round_trip(self):
+        value = Complex(Rational(1, 3), Rational(-5, 2))
+        value.abs()
+        restored = pickle.loads(pickle.dumps(value))
+        self.assertEqual(restored, value)
+        self.assertEqual(restored.abs(), value.abs())
+
+    def test_compact(self):
+        values = [Rational(i, 7) for i in range(1000)]
+        self.assertLess(len(pickle.dumps(values)), 12 * len(values))
+
+    def test_ignores_context(self):
+        data = pickle.dumps(Rational(1, 97))
+        with Rational.localcontext(max_den=10):
+            self.assertEqual(pickle.loads(data).den, 97)
+
+
+class TestParallel(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(24)
+        self.rationals = [Rational(rng.randint(-1000, 1000), rng.randint(1, 1000)) for _ in range(200)]
+        self.complexes = [Complex(Rational(rng.randint(-9, 9), rng.randint(1, 9)),
+                                  Rational(rng.randint(-9, 9), rng.randint(1, 9))) for _ in range(60)]
+
+    def test_map_processes(self):
+        result = parallel.map(square, self.rationals, workers=2, chunk_size=30)
+        self.assertEqual(result, [value * value for value in self.rationals])
+
+    def test_starmap_threads(self):
+        args = [(value, k) for k, value in enumerate(self.complexes)]
+        with ThreadPoolExecutor(3) as executor:
+            result = parallel.starmap(scale, args, chunk_size=7, executor=executor)
+        self.assertEqual(result, [value * k for value, k in args])
+
+    def test_reduce_sum(self):
+        self.assertEqual(parallel.reduce(self.rationals, workers=2, chunk_size=50), Rational.sum(self.rationals))
+
+    def test_reduce_prod_mixed(self):
+        values = self.rationals[:20] + self.complexes[:20] + [3]
+        with ThreadPoolExecutor(2) as executor:
+            result = parallel.reduce(values, "prod", chunk_size=6, executor=executor)
+        self.assertEqual(result, Complex.prod(values))
+
+    def test_in_process(self):
+        self.assertEqual(parallel.reduce(self.complexes, workers=1), Complex.sum(self.complexes))
+        self.assertEqual(parallel.map(square, [], workers=4), [])
+        self.assertEqual(parallel.reduce([], "sum"), 0)
+        self.assertEqual(parallel.reduce([], "prod"), 1)
+
+    def test_errors(self):
+        with self.assertRaises(ValueError):
+            parallel.reduce(self.rationals, "max")
+        with self.assertRaises(ValueError):
+            parallel.map(square, self.rationals, workers=0)
+        with self.assertRaises(ValueError):
+            parallel.map(square, self.rationals, chunk_size=0)
+        with self.assertRaises(TypeError):
+            parallel.reduce(["a"], workers=1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,124 @@
+from rational import Rational
+from complex import Complex
+from rational_array import RationalArray, _from_ints, _concat, _matched
+from complex_array import ComplexArray
+from itertools import islice
+import os
+import numpy as np
+
+# Lines parsed per chunk; memory use of the streaming parser is bounded by one chunk.
+_CHUNK = 65536
+
+
+def _parser(kind: type):
+    if kind is Rational:
+        return Rational._parse_parts
+    elif kind is Complex:
+        return Complex._parse_parts
+    else:
+        raise TypeError(f"kind must be Rational or Complex, not {kind}")
+
+
+def _chunks(source, kind: type, chunk_size: int):
+    """
+    Parses the source chunk by chunk into lists of normalized integer parts.
+
+    :param source: A path, or an iterable of lines.
+    :param kind: Rational or Complex.
+    :param chunk_size: The number of lines read per chunk.
+    :raises ValueError: If a line is not a valid literal; the message names the line number.
+    :return: An iterator of lists of (num, den) or (re.num, re.den, im.num, im.den) tuples.
+    """
+    parse = _parser(kind)
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be a positive integer")
+    owns_file = isinstance(source, (str, os.PathLike))
+    lines = open(source, "r") if owns_file else iter(source)
+    try:
+        line_no = 0
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                return
+            try:
+                # Fast path: no blank lines, nothing to report.
+                parts = list(map(parse, chunk))
+            except ValueError:
+                parts = []
+                for offset, line in enumerate(chunk, line_no + 1):
+                    if not line.strip():
+                        continue
+                    try:
+                        parts.append(parse(line))
+                    except ValueError as error:
+                        raise ValueError(f"line {offset}: {error}") from error
+            line_no += len(chunk)
+            yield parts
+    finally:
+        if owns_file:
+            lines.close()
+
+
+def iter_parse(source, kind: type = Rational, chunk_size: int = _CHUNK):
+    """
+    Parses one value per line without loading the whole input.
+
+    Every line is a literal accepted by Rational.parse or Complex.parse; blank lines
+    are skipped.
+
+    :param source: A path, or an iterable of lines such as an open text file.
+    :param kind: Rational or Complex.
+    :param chunk_size: The number of lines read per chunk.
+    :raises TypeError: If kind is not Rational or Complex.
+    :raises ValueError: If a line is not a valid literal; the message names the line number.
+    :return: An iterator of Rational or Complex values.
+    """
+    make = Rational._make
+    for parts in _chunks(source, kind, chunk_size):
+        if kind is Rational:
+            for num, den in parts:
+                yield make(num, den)
+        else:
+            for a, b, c, d in parts:
+                yield Complex._make(make(a, b), make(c, d))
+
+
+def _column(chunks: list[np.ndarray]) -> np.ndarray:
+    if not chunks:
+        return np.zeros(0, dtype=np.int64)
+    if any(chunk.dtype == object for chunk in chunks):
+        column = chunks[0]
+        for chunk in chunks[1:]:
+            column = _concat(column, chunk)
+        return column
+    return np.concatenate(chunks)
+
+
+def _rational_columns(num: list[np.ndarray], den: list[np.ndarray]) -> RationalArray:
+    return RationalArray._make(*_matched(_column(num), _column(den)))
+
+
+def parse_array(source, kind: type = Rational, chunk_size: int = _CHUNK):
+    """
+    Parses one value per line straight into a RationalArray or ComplexArray.
+
+    The parsed parts go into the int64 columns chunk by chunk without creating
+    Rational objects; a column switches to object storage only if one of its values
+    does not fit in int64.
+
+    :param source: A path, or an iterable of lines such as an open text file.
+    :param kind: Rational or Complex.
+    :param chunk_size: The number of lines read per chunk.
+    :raises TypeError: If kind is not Rational or Complex.
+    :raises ValueError: If a line is not a valid literal; the message names the line number.
+    :return: The parsed values as an array.
+    """
+    width = 2 if kind is Rational else 4
+    columns = [[] for _ in range(width)]
+    for parts in _chunks(source, kind, chunk_size):
+        for column, values in zip(columns, zip(*parts)):
+            column.append(_from_ints(list(values)))
+    re = _rational_columns(columns[0], columns[1])
+    if kind is Rational:
+        return re
+    return ComplexArray._make(re, _rational_columns(columns[2], columns[3]))
@@ -0,0 +1,93 @@
+import unittest
+import io
+import os
+import random
+import tempfile
+from rational import Rational
+from complex import Complex
+from rational_array import RationalArray
+from complex_array import ComplexArray
+from parsing import iter_parse, parse_array
+
+class TestParsing(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(19)
+        self.rationals = [Rational(rng.randint(-10**6, 10**6), rng.randint(1, 10**6)) for _ in range(300)]
+        self.rationals += [Rational(10**30 + 1, 7), Rational(-3, 1), Rational(0, 1)]
+        self.complexes = [Complex(x, y) for x, y in zip(self.rationals, reversed(self.rationals))]
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def write_lines(self, values):
+        with open(self.path, "w") as f:
+            f.write("\n".join(str(value) for value in values) + "\n")
+
+    def test_iter_parse_path(self):
+        self.write_lines(self.rationals)
+        self.assertEqual(list(iter_parse(self.path, chunk_size=64)), self.rationals)
+
+    def test_iter_parse_complex_file_object(self):
+        self.write_lines(self.complexes)
+        with open(self.path) as f:
+            self.assertEqual(list(iter_parse(f, Complex, chunk_size=50)), self.complexes)
+
+    def test_iter_parse_lines(self):
+        lines = ["1/2", "", "  -0.25 ", "3"]
+        self.assertEqual(list(iter_parse(lines)), [Rational(1, 2), Rational(-1, 4), Rational(3, 1)])
+
+    def test_localcontext_exact(self):
+        self.write_lines(self.rationals)
+        with Rational.localcontext(max_den=2):
+            self.assertEqual(list(iter_parse(self.path)), self.rationals)
+            self.assertEqual(list(iter_parse(["1/3 + 2/7i"], Complex)), [Complex(Rational(1, 3), Rational(2, 7))])
+
+    def test_error_reports_line(self):
+        lines = io.StringIO("1\n2\n\nx/3\n")
+        with self.assertRaisesRegex(ValueError, "line 4"):
+            list(iter_parse(lines, chunk_size=2))
+
+    def test_rejects_non_ascii_digits(self):
+        for line in ("1_000", "\u0661\u0662/3"):
+            with self.assertRaisesRegex(ValueError, "line 2"):
+                list(iter_parse(["1", line]))
+            with self.assertRaisesRegex(ValueError, "line 2"):
+                parse_array(["1", line + "i"], Complex)
+
+    def test_kind_error(self):
+        with self.assertRaises(TypeError):
+            list(iter_parse(["1"], float))
+
+    def test_parse_array_rational(self):
+        self.write_lines(self.rationals)
+        arr = parse_array(self.path, chunk_size=100)
+        self.assertIsInstance(arr, RationalArray)
+        self.assertEqual(arr.to_list(), self.rationals)
+        # The large numerator forces object storage; both columns keep one dtype.
+        self.assertEqual(arr.num.dtype, arr.den.dtype)
+
+    def test_parse_array_int64(self):
+        arr = parse_array(["1/2", "-3", "4/6"])
+        self.assertEqual(arr.num.dtype.name, "int64")
+        self.assertEqual(arr.to_list(), [Rational(1, 2), Rational(-3, 1), Rational(2, 3)])
+
+    def test_parse_array_int64_min(self):
+        arr = parse_array([str(-2**63), "1/2"])
+        self.assertEqual((-arr).to_list(), [Rational(2**63, 1), Rational(-1, 2)])
+
+    def test_parse_array_complex(self):
+        self.write_lines(self.complexes)
+        arr = parse_array(self.path, Complex, chunk_size=100)
+        self.assertIsInstance(arr, ComplexArray)
+        self.assertEqual(arr.to_list(), self.complexes)
+
+    def test_parse_array_empty(self):
+        self.assertEqual(len(parse_array([])), 0)
+        self.assertEqual(len(parse_array(["", "\n"], Complex)), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
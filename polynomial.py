@@ -0,0 +1,224 @@
+from rational import Rational
+from complex import Complex
+from convolution import convolve_gaussian, _gaussian_parts
+
+
+def _to_complex(value) -> Complex:
+    """
+    Converts a coefficient or evaluation point to Complex.
+
+    :param value: A Complex, Rational or int.
+    :raises TypeError: If value has another type.
+    :return: The value as a Complex.
+    """
+    if type(value) is Complex:
+        return value
+    elif type(value) is Rational:
+        return Complex._make(value, Rational._make(0, 1))
+    elif type(value) is int:
+        return Complex._make(Rational._make(value, 1), Rational._make(0, 1))
+    else:
+        raise TypeError(f"Polynomial coefficients must be Complex/Rational/int, not {type(value)}")
+
+
+def _from_gaussian(p: int, q: int, d: int) -> Complex:
+    return Complex._make(Rational._reduced(p, d), Rational._reduced(q, d))
+
+
+class Polynomial:
+    """
+    A polynomial with Complex coefficients, stored lowest degree first.
+    """
+    __slots__ = ('_coeffs', '_gaussian')
+
+    def __init__(self, coeffs=()):
+        coeffs = [_to_complex(c) for c in coeffs]
+        while coeffs and coeffs[-1] == 0:
+            coeffs.pop()
+        self._coeffs = coeffs
+        self._gaussian = None
+
+    @property
+    def coeffs(self) -> list[Complex]:
+        return list(self._coeffs)
+
+    @property
+    def degree(self) -> int:
+        """
+        The degree of the polynomial, -1 for the zero polynomial.
+        """
+        return len(self._coeffs) - 1
+
+    def _integer_form(self) -> tuple[list[tuple[int, int]], int]:
+        if self._gaussian is None:
+            self._gaussian = _gaussian_parts(self._coeffs)
+        return self._gaussian
+
+    def __call__(self, x):
+        """
+        Evaluates the polynomial at a point with Horner's rule.
+
+        The point and the coefficients are written as Gaussian integers over common
+        denominators, so Horner's rule runs on plain ints and the result is
+        normalized only once.
+
+        :param x: A Complex, Rational or int point.
+        :return: The value of the polynomial at x as a Complex.
+        """
+        x = _to_complex(x)
+        if not self._coeffs:
+            return Complex._make(Rational._make(0, 1), Rational._make(0, 1))
+        coeffs, d = self._integer_form()
+        [(u, v)], e = _gaussian_parts([x])
+        n = len(coeffs) - 1
+
+        # e**n * P(x) = sum(a_k * (u + v*i)**k * e**(n - k))
+        acc_re, acc_im = coeffs[n]
+        e_power = 1
+        for k in range(n - 1, -1, -1):
+            e_power *= e
+            p, q = coeffs[k]
+            acc_re, acc_im = acc_re * u - acc_im * v + p * e_power, acc_re * v + acc_im * u + q * e_power
+        return _from_gaussian(acc_re, acc_im, d * e_power)
+
+    def evaluate_many(self, points) -> list[Complex]:
+        """
+        Evaluates the polynomial at many points with the shared Horner evaluation of __call__.
+
+        :param points: An iterable of Complex, Rational or int points.
+        :return: The values at the points, in order.
+        """
+        return [self(x) for x in points]
+
+    def derivative(self) -> 'Polynomial':
+        """
+        Returns the derivative of the polynomial.
+
+        :return: The derivative polynomial.
+        """
+        return Polynomial([c * k for k, c in enumerate(self._coeffs) if k > 0])
+
+    def compose(self, other: 'Polynomial') -> 'Polynomial':
+        """
+        Returns the composition self(other(x)), computed with Horner's rule.
+
+        :param other: The inner polynomial.
+        :return: The composed polynomial.
+        """
+        result = Polynomial()
+        for c in reversed(self._coeffs):
+            result = result * other + Polynomial([c])
+        return result
+
+    @staticmethod
+    def _coerce(other) -> 'Polynomial':
+        if type(other) is Polynomial:
+            return other
+        if type(other) in (Complex, Rational, int):
+            return Polynomial([other])
+        return None
+
+    def __add__(self, other):
+        other = Polynomial._coerce(other)
+        if other is None:
+            return NotImplemented
+        a, b = self._coeffs, other._coeffs
+        if len(a) < len(b):
+            a, b = b, a
+        return Polynomial([x + y for x, y in zip(a, b)] + a[len(b):])
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return Polynomial([-c for c in self._coeffs])
+
+    def __sub__(self, other):
+        other = Polynomial._coerce(other)
+        if other is None:
+            return NotImplemented
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        other = Polynomial._coerce(other)
+        if other is None:
+            return NotImplemented
+        if not self._coeffs or not other._coeffs:
+            return Polynomial()
+        a, d1 = self._integer_form()
+        b, d2 = other._integer_form()
+        d = d1 * d2
+        return Polynomial([_from_gaussian(p, q, d) for p, q in convolve_gaussian(a, b)])
+
+    __rmul__ = __mul__
+
+    def __divmod__(self, other):
+        """
+        Divides by another polynomial with remainder.
+
+        :param other: The non-zero divisor.
+        :raises ZeroDivisionError: If other is the zero polynomial.
+        :return: The (quotient, remainder) pair with deg(remainder) < deg(other).
+        """
+        other = Polynomial._coerce(other)
+        if other is None:
+            return NotImplemented
+        if not other._coeffs:
+            raise ZeroDivisionError("Cannot divide by the zero polynomial")
+        remainder = list(self._coeffs)
+        divisor = other._coeffs
+        lead = divisor[-1]
+        zero = Complex._make(Rational._make(0, 1), Rational._make(0, 1))
+        quotient = [zero] * max(len(remainder) - len(divisor) + 1, 0)
+        for top in range(len(remainder) - 1, len(divisor) - 2, -1):
+            if remainder[top] == 0:
+                continue
+            factor = remainder[top] / lead
+            shift = top - len(divisor) + 1
+            quotient[shift] = factor
+            for k, c in enumerate(divisor):
+                remainder[shift + k] = remainder[shift + k] - factor * c
+        return Polynomial(quotient), Polynomial(remainder[:len(divisor) - 1])
+
+    def __floordiv__(self, other):
+        return divmod(self, other)[0]
+
+    def __mod__(self, other):
+        return divmod(self, other)[1]
+
+    def __truediv__(self, other):
+        """
+        Divides exactly by another polynomial.
+
+        :param other: The divisor.
+        :raises ValueError: If other does not divide the polynomial.
+        :return: The quotient.
+        """
+        result = divmod(self, other)
+        if result is NotImplemented:
+            return result
+        quotient, remainder = result
+        if remainder._coeffs:
+            raise ValueError("Polynomial is not divisible by the divisor")
+        return quotient
+
+    def __eq__(self, other):
+        other = Polynomial._coerce(other)
+        if other is None:
+            return False
+        return self._coeffs == other._coeffs
+
+    __hash__ = None
+
+    def __str__(self) -> str:
+        if not self._coeffs:
+            return "0"
+        terms = []
+        for k, c in enumerate(self._coeffs):
+            if c == 0:
+                continue
+            coeff = str(c) if (c.Re == 0 or c.Im == 0) else f"({c})"
+            terms.append(coeff if k == 0 else f"{coeff}*x" + (f"^{k}" if k > 1 else ""))
+        return " + ".join(reversed(terms))
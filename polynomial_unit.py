@@ -0,0 +1,101 @@
+import unittest
+import random
+from rational import Rational
+from complex import Complex
+from polynomial import Polynomial
+
+def naive_eval(coeffs, x):
+    result = Complex(0, 0)
+    power = Complex(1, 0)
+    for c in coeffs:
+        result = result + c * power
+        power = power * x
+    return result
+
+class TestPolynomial(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(5)
+        def rand_complex():
+            return Complex(Rational(rng.randint(-9, 9), rng.randint(1, 6)), Rational(rng.randint(-9, 9), rng.randint(1, 6)))
+        self.rand_complex = rand_complex
+        self.coeffs = [rand_complex() for _ in range(12)]
+        self.p = Polynomial(self.coeffs)
+
+    def test_init_trims_zeros(self):
+        p = Polynomial([1, Rational(1, 2), 0, Complex(0, 0)])
+        self.assertEqual(p.degree, 1)
+        self.assertEqual(Polynomial([0]).degree, -1)
+
+    def test_init_type_error(self):
+        with self.assertRaises(TypeError):
+            Polynomial([1, "a"])
+
+    def test_call(self):
+        x = Complex(Rational(1, 3), Rational(-2, 5))
+        self.assertEqual(self.p(x), naive_eval(self.coeffs, x))
+        self.assertEqual(self.p(2), naive_eval(self.coeffs, Complex(2, 0)))
+
+    def test_call_zero_polynomial(self):
+        self.assertEqual(Polynomial()(Complex(1, 1)), 0)
+
+    def test_evaluate_many(self):
+        points = [self.rand_complex() for _ in range(40)]
+        expected = [naive_eval(self.coeffs, x) for x in points]
+        self.assertEqual(self.p.evaluate_many(points), expected)
+
+    def test_evaluate_many_mixed_points(self):
+        points = [Complex(1, 1), Rational(1, 2), 3, Complex(1, 2), Complex(1, 2)]
+        self.assertEqual(self.p.evaluate_many(points), [self.p(x) for x in points])
+        self.assertEqual(self.p.evaluate_many([]), [])
+
+    def test_derivative(self):
+        p = Polynomial([1, 2, 3])
+        self.assertEqual(p.derivative(), Polynomial([2, 6]))
+
+    def test_mul_and_add(self):
+        a = Polynomial([1, Complex(0, 1)])
+        b = Polynomial([Rational(1, 2), 1])
+        x = Complex(2, -1)
+        self.assertEqual((a * b)(x), a(x) * b(x))
+        self.assertEqual((a + b)(x), a(x) + b(x))
+        self.assertEqual((a - b)(x), a(x) - b(x))
+
+    def test_mul_localcontext(self):
+        a = Polynomial([Rational(1, 7), Complex(0, Rational(1, 3))])
+        b = Polynomial([Rational(1, 11), 1])
+        exact = (a * b).coeffs
+        with Rational.localcontext(max_den=10):
+            result = (a * b).coeffs
+        self.assertEqual(result, [Complex(c.Re.limit_denominator(10), c.Im.limit_denominator(10)) for c in exact])
+
+    def test_compose(self):
+        a = Polynomial([1, 0, 1])
+        b = Polynomial([Complex(0, 1), 2])
+        x = Complex(Rational(1, 2), 3)
+        self.assertEqual(a.compose(b)(x), a(b(x)))
+
+    def test_divmod(self):
+        q, r = divmod(self.p, Polynomial([Complex(1, 1), 0, 2]))
+        self.assertEqual(q * Polynomial([Complex(1, 1), 0, 2]) + r, self.p)
+        self.assertLess(r.degree, 2)
+
+    def test_exact_division(self):
+        a = Polynomial([Complex(1, 2), Rational(1, 3), 5])
+        b = Polynomial([Complex(0, -1), 1])
+        self.assertEqual((a * b) / b, a)
+
+    def test_exact_division_not_divisible(self):
+        with self.assertRaises(ValueError):
+            _ = Polynomial([1, 0, 1]) / Polynomial([1, 1])
+
+    def test_division_by_zero(self):
+        with self.assertRaises(ZeroDivisionError):
+            divmod(self.p, Polynomial())
+
+    def test_str(self):
+        self.assertEqual(str(Polynomial([1, Complex(0, 2), Complex(1, -1)])), "(1 - 1i)*x^2 + 2i*x + 1")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,193 @@
+from rational import Rational
+from complex import Complex
+from collections import Counter
+import functools
+import json
+import rational
+import time
+
+# Methods instrumented while a Profiler is active. The classes define no in-place
+# operators: augmented assignment falls back to the binary ones, which are counted already.
+_INSTRUMENTED = {
+    Rational: ('__init__', '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__',
+               '__truediv__', '__rtruediv__', '__neg__', '__pow__', 'sum', 'prod',
+               'limit_denominator', 'from_float', 'float_to_rational', 'root', 'parse'),
+    Complex: ('__init__', '__add__', '__radd__', '__sub__', '__rsub__', '__mul__', '__rmul__',
+              '__truediv__', '__rtruediv__', '__neg__', '__pow__', 'sum', 'prod', 'parse'),
+}
+
+# The profiler currently swapped into the classes, if any.
+_active = None
+
+
+class Profiler:
+    """
+    Counts Rational and Complex constructions and tracks how large their parts grow.
+
+    While the profiler is active (inside a with block), the operators and
+    constructors of both classes and the gcd used by the rational module are
+    replaced by counting wrappers; on exit the original methods are put back, so
+    the profiler costs nothing while it is off. It records:
+
+    - constructions per operator, e.g. "Rational.__mul__" or "Complex.__init__";
+    - the number of gcd calls and a histogram of their largest input bit length;
+    - histograms of num/den bit lengths of every value produced, per class (a
+      Complex contributes both of its parts);
+    - a timeline with the maximum and mean bit lengths over every window of
+      recorded num/den pairs, so bit growth can be told apart from a growing
+      number of operations.
+
+    Only one profiler can be active at a time, and counting is not thread-safe.
+    """
+
+    def __init__(self, window: int = 1000):
+        """
+        :param window: The number of num/den pairs summarized by each timeline entry.
+        :raises ValueError: If window is not positive.
+        """
+        if window <= 0:
+            raise ValueError("window must be a positive integer")
+        self._window = window
+        self._saved = []
+        self._start = None
+        self._elapsed = 0.0
+        self._constructions = Counter()
+        self._gcd_calls = 0
+        self._gcd_bits = Counter()
+        self._bits = {Rational: (Counter(), Counter()), Complex: (Counter(), Counter())}
+        self._timeline = []
+        self._window_stats = [0, 0, 0, 0, 0]
+
+    def __enter__(self):
+        global _active
+        if _active is not None:
+            raise RuntimeError("Another Profiler is already active")
+        _active = self
+        for cls, names in _INSTRUMENTED.items():
+            for name in names:
+                self._wrap(cls, name)
+        self._saved.append((rational, 'gcd', rational.gcd))
+        rational.gcd = self._counting_gcd(rational.gcd)
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        global _active
+        for owner, name, original in reversed(self._saved):
+            setattr(owner, name, original)
+        self._saved.clear()
+        self._flush_window()
+        self._elapsed += time.perf_counter() - self._start
+        _active = None
+
+    def _wrap(self, cls: type, name: str):
+        original = cls.__dict__[name]
+        is_static = isinstance(original, staticmethod)
+        func = original.__func__ if is_static else original
+        key = f"{cls.__name__}.{name}"
+        record = self._record
+
+        if name == '__init__':
+            @functools.wraps(func)
+            def wrapper(obj, *args, **kwargs):
+                func(obj, *args, **kwargs)
+                record(key, obj)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                result = func(*args, **kwargs)
+                record(key, result)
+                return result
+
+        self._saved.append((cls, name, original))
+        setattr(cls, name, staticmethod(wrapper) if is_static else wrapper)
+
+    def _counting_gcd(self, gcd):
+        calls = self._gcd_bits
+
+        @functools.wraps(gcd)
+        def counting_gcd(*args):
+            self._gcd_calls += 1
+            calls[max(map(int.bit_length, args), default=0)] += 1
+            return gcd(*args)
+        return counting_gcd
+
+    def _record(self, key: str, value):
+        cls = type(value)
+        if cls is Rational:
+            parts = (value._num, value._den),
+        elif cls is Complex:
+            parts = (value._Re._num, value._Re._den), (value._Im._num, value._Im._den)
+        else:
+            return
+        self._constructions[key] += 1
+        num_bits, den_bits = self._bits[cls]
+        stats = self._window_stats
+        for num, den in parts:
+            n, d = num.bit_length(), den.bit_length()
+            num_bits[n] += 1
+            den_bits[d] += 1
+            stats[0] += 1
+            stats[1] += n
+            stats[2] += d
+            if n > stats[3]:
+                stats[3] = n
+            if d > stats[4]:
+                stats[4] = d
+        if stats[0] >= self._window:
+            self._flush_window()
+
+    def _flush_window(self):
+        count, num_total, den_total, num_max, den_max = self._window_stats
+        if not count:
+            return
+        self._timeline.append({
+            "time": self._elapsed + time.perf_counter() - self._start,
+            "values": count,
+            "mean_num_bits": num_total / count,
+            "mean_den_bits": den_total / count,
+            "max_num_bits": num_max,
+            "max_den_bits": den_max,
+        })
+        self._window_stats = [0, 0, 0, 0, 0]
+
+    @property
+    def constructions(self) -> dict[str, int]:
+        """
+        The number of values constructed per operator, most frequent first.
+        """
+        return dict(self._constructions.most_common())
+
+    @property
+    def gcd_calls(self) -> int:
+        return self._gcd_calls
+
+    def to_dict(self) -> dict:
+        """
+        Exports everything recorded so far.
+
+        Histograms map a bit length to the number of occurrences. Timeline times
+        are seconds since the profiler was first entered, excluding time spent
+        outside the with blocks.
+
+        :return: A dict with the keys "elapsed", "constructions", "gcd", "bits" and "timeline".
+        """
+        def histogram(counter):
+            return dict(sorted(counter.items()))
+        return {
+            "elapsed": self._elapsed,
+            "constructions": self.constructions,
+            "gcd": {"calls": self._gcd_calls, "input_bits": histogram(self._gcd_bits)},
+            "bits": {cls.__name__: {"num": histogram(num), "den": histogram(den)}
+                     for cls, (num, den) in self._bits.items()},
+            "timeline": list(self._timeline),
+        }
+
+    def to_json(self, **kwargs) -> str:
+        """
+        Exports everything recorded so far as JSON; see to_dict().
+
+        :param kwargs: Passed on to json.dumps, e.g. indent.
+        :return: The JSON document.
+        """
+        return json.dumps(self.to_dict(), **kwargs)
@@ -0,0 +1,87 @@
+import unittest
+import json
+from rational import Rational
+from complex import Complex
+from profiling import Profiler
+import rational
+
+class TestProfiler(unittest.TestCase):
+
+    def test_counts_per_operator(self):
+        a, b = Rational(1, 2), Rational(2, 3)
+        with Profiler() as p:
+            _ = a + b
+            _ = a * b
+            _ = a * b
+            _ = Complex(1, 2) * Complex(3, 4)
+        constructions = p.constructions
+        # a + b plus the sum forming the imaginary part of the Complex product.
+        self.assertEqual(constructions["Rational.__add__"], 2)
+        self.assertEqual(constructions["Complex.__init__"], 2)
+        self.assertEqual(constructions["Complex.__mul__"], 1)
+        # Two Rational products plus the four part products of the Complex one.
+        self.assertEqual(constructions["Rational.__mul__"], 6)
+
+    def test_gcd_calls(self):
+        with Profiler() as p:
+            Rational(2**100, 3**50)
+        self.assertGreaterEqual(p.gcd_calls, 1)
+        self.assertIn(101, p.to_dict()["gcd"]["input_bits"])
+
+    def test_bit_histograms(self):
+        with Profiler() as p:
+            Rational(2**40, 3)
+            Complex(Rational(1, 2**10), 5)
+        bits = p.to_dict()["bits"]
+        self.assertEqual(bits["Rational"]["num"][41], 1)
+        self.assertEqual(bits["Complex"]["den"], {1: 1, 11: 1})
+
+    def test_timeline_tracks_growth(self):
+        with Profiler(window=20) as p:
+            x = Rational(1, 1)
+            for _ in range(7):
+                x = (x + 2 / x) / 2
+        timeline = p.to_dict()["timeline"]
+        self.assertGreater(len(timeline), 1)
+        self.assertGreater(timeline[-1]["max_den_bits"], timeline[0]["max_den_bits"])
+        self.assertEqual(sorted(entry["time"] for entry in timeline), [entry["time"] for entry in timeline])
+
+    def test_restores_methods(self):
+        originals = dict(Rational.__dict__), dict(Complex.__dict__), rational.gcd
+        with Profiler():
+            self.assertIsNot(Rational.__dict__["__add__"], originals[0]["__add__"])
+        self.assertEqual(dict(Rational.__dict__), originals[0])
+        self.assertEqual(dict(Complex.__dict__), originals[1])
+        self.assertIs(rational.gcd, originals[2])
+
+    def test_restores_on_error(self):
+        original = Rational.__dict__["__mul__"]
+        with self.assertRaises(ZeroDivisionError):
+            with Profiler():
+                1 // 0
+        self.assertIs(Rational.__dict__["__mul__"], original)
+
+    def test_single_active(self):
+        with Profiler():
+            with self.assertRaises(RuntimeError):
+                with Profiler():
+                    pass
+        with Profiler():
+            pass
+
+    def test_json_export(self):
+        with Profiler() as p:
+            _ = Rational(1, 3) + Rational(1, 6)
+        data = json.loads(p.to_json())
+        self.assertEqual(set(data), {"elapsed", "constructions", "gcd", "bits", "timeline"})
+        self.assertEqual(data["constructions"]["Rational.__add__"], 1)
+
+    def test_staticmethods_still_work(self):
+        with Profiler() as p:
+            self.assertEqual(Rational.sum([Rational(1, 2), Rational(1, 2)]), 1)
+            self.assertEqual(Rational(1, 2).limit_denominator(10), Rational(1, 2))
+        self.assertEqual(p.constructions["Rational.sum"], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
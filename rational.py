@@ -1,39 +1,228 @@
-from math import gcd
+from contextvars import ContextVar
+from fractions import Fraction
+from functools import cmp_to_key
+from math import gcd, isinf, isnan, isqrt
+from operator import attrgetter
+import re
+import sys
+
+_HASH_MODULUS = sys.hash_info.modulus
+_HASH_INF = sys.hash_info.inf
+
+# Interning of small values is off while _intern_limit is 0.
+_intern_limit = 0
+_interned = {}
+
+# (modulus, set of squares modulo it) pairs used to reject non-squares before isqrt.
+_SQUARE_RESIDUES = [(m, {x * x % m for x in range(m)}) for m in (64, 63, 65, 11)]
+
+# n -> primes p = 1 (mod n) used to reject non-n-th powers before Newton, for n > 2.
+_RESIDUE_FILTERS = {}
+
+# A decimal literal: sign, ASCII digits with an optional fraction, optional exponent.
+_DECIMAL = re.compile(r"([+-]?)([0-9]*)(?:\.([0-9]*))?(?:[eE]([+-]?[0-9]+))?\Z")
+
+# The PrecisionContext active in the current thread or task; None while arithmetic is exact.
+_context = ContextVar("rational_context", default=None)
+_ROUNDINGS = ("nearest", "floor", "ceiling", "down", "up")
+
+
+def _bracket(num: int, den: int, max_den: int) -> tuple[int, int, int, int]:
+    """
+    Finds the two fractions with denominators <= max_den that enclose num/den most tightly.
+
+    Walks the continued fraction expansion (the Stern-Brocot path) of num/den; the
+    last convergent and the last semiconvergent are neighbours in the Farey
+    sequence of order max_den, one on each side of the value.
+
+    :param num: The numerator.
+    :param den: The positive denominator, coprime with num and greater than max_den.
+    :param max_den: The largest allowed denominator, at least 1.
+    :return: (convergent num, convergent den, semiconvergent num, semiconvergent den).
+    """
+    p0, q0, p1, q1 = 0, 1, 1, 0
+    n, d = num, den
+    while True:
+        a = n // d
+        q2 = q0 + a * q1
+        if q2 > max_den:
+            break
+        p0, q0, p1, q1 = p1, q1, p0 + a * p1, q2
+        n, d = d, n - a * d
+    k = (max_den - q0) // q1
+    return p1, q1, p0 + k * p1, q0 + k * q1
+
+
+def _nearest(num: int, den: int, max_den: int) -> tuple[int, int]:
+    """
+    Finds the closest fraction to num/den with a denominator <= max_den.
+
+    :param num: The numerator.
+    :param den: The positive denominator, coprime with num and greater than max_den.
+    :param max_den: The largest allowed denominator, at least 1.
+    :return: The normalized (num, den); on a tie the convergent, as Fraction does.
+    """
+    p1, q1, p2, q2 = _bracket(num, den, max_den)
+    if abs(num * q1 - p1 * den) * q2 <= abs(num * q2 - p2 * den) * q1:
+        return p1, q1
+    return p2, q2
+
 
 class Rational:
+    """
+    An immutable rational number num/den, always stored normalized (den > 0, coprime).
+
+    Augmented assignment rebinds the name to a new value, as it does for int, so
+    instances can be shared freely. Derived values such as the hash and float()
+    are computed on first use and cached.
+    """
+    # _float is a cache slot left unset until first use, so construction does not pay for it.
+    __slots__ = ('_num', '_den', '_hash', '_float')
+
     def __init__(self, num: int, den: int):
-        self.num = num
-        self.den = den
+        if type(num) is not int:
+            raise TypeError("numerator must be an integer")
+        if type(den) is not int:
+            raise TypeError("denominator must be an integer")
+        if den == 0:
+            raise ValueError("denominator can't be 0")
+        if den < 0:
+            num, den = -num, -den
+        common = gcd(num, den)
+        self._num = num // common
+        self._den = den // common
+        self._hash = None
+
+    @classmethod
+    def _make(cls, num: int, den: int) -> 'Rational':
+        """
+        Builds a rational number from parts that are already normalized.
+
+        Skips the setters and the gcd, so the caller must guarantee that den > 0
+        and gcd(num, den) == 1. The value is kept exact; arithmetic results go
+        through _result instead.
+
+        :param num: The numerator.
+        :param den: The positive denominator, coprime with num.
+        :return: The rational number num/den.
+        """
+        if _intern_limit and den <= _intern_limit and -_intern_limit <= num <= _intern_limit:
+            key = (num, den)
+            obj = _interned.get(key)
+            if obj is None:
+                obj = object.__new__(cls)
+                obj._num = num
+                obj._den = den
+                obj._hash = None
+                _interned[key] = obj
+            return obj
+        obj = object.__new__(cls)
+        obj._num = num
+        obj._den = den
+        obj._hash = None
+        return obj
+
+    @classmethod
+    def _result(cls, num: int, den: int) -> 'Rational':
+        """
+        Builds the result of an arithmetic operation from normalized parts.
+
+        Like _make, but the value is first snapped to the active PrecisionContext.
+        Integers are never snapped.
 
-        common = gcd(self.num, self.den)
+        :param num: The numerator.
+        :param den: The positive denominator, coprime with num.
+        :return: The rational number num/den, rounded to the active context.
+        """
+        if den > 1:
+            context = _context.get()
+            if context is not None:
+                num, den = context._snap(num, den)
+        if _intern_limit:
+            return cls._make(num, den)
+        # The uninterned case of _make, inlined: every operator result comes through here.
+        obj = object.__new__(cls)
+        obj._num = num
+        obj._den = den
+        obj._hash = None
+        return obj
+
+    @classmethod
+    def _reduced(cls, num: int, den: int) -> 'Rational':
+        """
+        Builds the result of an arithmetic operation from parts that may share factors.
+
+        Reduces the parts and hands them to _result, so an active PrecisionContext applies.
+
+        :param num: The numerator.
+        :param den: The non-zero denominator.
+        :raises ValueError: If den is 0.
+        :return: The rational number num/den.
+        """
+        if den == 0:
+            raise ValueError("denominator can't be 0")
+        if den < 0:
+            num, den = -num, -den
+        common = gcd(num, den)
+        return cls._result(num // common, den // common)
 
-        self.num //= common
-        self.den //= common
+    @staticmethod
+    def enable_interning(limit: int = 16):
+        """
+        Turns on the interning cache for small rational numbers.
+
+        While enabled, every result of Rational arithmetic with |num| <= limit and
+        den <= limit is shared instead of allocated anew.
+
+        :param limit: The largest |numerator| and denominator that are interned.
+        :raises ValueError: If limit is not positive.
+        """
+        global _intern_limit
+        if limit <= 0:
+            raise ValueError("limit must be a positive integer")
+        Rational.disable_interning()
+        _intern_limit = limit
+
+    @staticmethod
+    def disable_interning():
+        """
+        Turns off the interning cache and drops all interned values.
+        """
+        global _intern_limit
+        _intern_limit = 0
+        _interned.clear()
+
+    @staticmethod
+    def localcontext(max_den: int|None = None, max_bits: int|None = None,
+                     rounding: str = "nearest") -> 'PrecisionContext':
+        """
+        Returns a context manager that bounds the size of every computed value.
+
+        Inside the with block every Rational built by arithmetic (including the parts
+        of Complex results) is snapped to the best approximation whose denominator is
+        at most max_den and whose numerator and denominator fit in max_bits bits.
+        Construction, parsing, conversion, deserialization and indexing stay exact.
+        Like decimal.localcontext, the context applies to the current thread or
+        asyncio task only.
+
+        Integer results are never rounded, so max_bits does not bound them; a
+        non-integer too large for max_bits is rounded to an integer.
+
+        :param max_den: The largest allowed denominator, or None.
+        :param max_bits: The largest allowed bit length of numerator and denominator, or None.
+        :param rounding: "nearest", "floor", "ceiling", "down" (toward 0) or "up" (away from 0).
+        :raises ValueError: If neither bound is given, a bound is not positive or the rounding is unknown.
+        :return: The context; its rounded, error and max_error attributes track the rounding.
+        """
+        return PrecisionContext(max_den, max_bits, rounding)
 
     @property
     def num(self):
         return self._num
-    
-    @num.setter
-    def num(self, value : int):
-        if type(value) is not int:
-            raise TypeError("numerator must be an integer")
-        self._num = value
 
     @property
     def den(self):
         return self._den
-    
-    @den.setter
-    def den(self, value):
-        if type(value) is not int:
-            raise TypeError("denominator must be an integer")
-        if value == 0:
-            raise ValueError("denominator can't be 0")
-        if value < 0:
-            value *= -1
-            self.num = self.num * -1
-        self._den = value
 
     @staticmethod
     def sign(a: int) -> int:
@@ -62,13 +251,81 @@ class Rational:
         if n == 1:
             return base
 
-        num_root_candidate = round(base.num ** (1 / n))
-        den_root_candidate = round(base.den ** (1 / n))
-
-        if num_root_candidate ** n == base.num and den_root_candidate ** n == base.den:
-            return Rational(num_root_candidate, den_root_candidate)
+        num = base.num
+        if num < 0:
+            if n % 2 == 0:
+                raise ValueError(f"The {n}-th root of {base} is not real")
+            num_root = Rational._int_root(-num, n)
+            if num_root is not None:
+                num_root = -num_root
         else:
+            num_root = Rational._int_root(num, n)
+        den_root = Rational._int_root(base.den, n) if num_root is not None else None
+
+        if num_root is None or den_root is None:
             raise ValueError(f"The {n}-th root of {base} is irrational")
+        return Rational._result(num_root, den_root)
+
+    @staticmethod
+    def _residue_primes(n: int) -> list[int]:
+        """
+        Returns up to four primes p = 1 (mod n) used to filter out non-n-th powers.
+
+        Only about 1/n of the residues modulo such a prime are n-th powers, and
+        Euler's criterion tests one in a single modular power.
+
+        :param n: The degree of the root (greater than 2).
+        :return: The primes.
+        """
+        primes = _RESIDUE_FILTERS.get(n)
+        if primes is None:
+            primes = []
+            p = n + 1
+            while len(primes) < 4 and p < 64 * n + 2:
+                if all(p % d for d in range(2, isqrt(p) + 1)):
+                    primes.append(p)
+                p += n
+            _RESIDUE_FILTERS[n] = primes
+        return primes
+
+    @staticmethod
+    def _int_root(a: int, n: int) -> int|None:
+        """
+        Calculates the exact integer n-th root of a non-negative integer.
+
+        Candidates are first checked against modular residues, then the root is found
+        with math.isqrt for n == 2 or with integer Newton iteration otherwise.
+
+        :param a: The non-negative integer.
+        :param n: The degree of the root (at least 2).
+        :return: The integer r with r**n == a, or None if a is not a perfect n-th power.
+        """
+        if a < 2:
+            return a
+        if a.bit_length() <= n:
+            # 1 < a < 2**n, so the root lies strictly between 1 and 2.
+            return None
+
+        if n == 2:
+            for modulus, residues in _SQUARE_RESIDUES:
+                if a % modulus not in residues:
+                    return None
+            root = isqrt(a)
+        else:
+            # Euler's criterion: for p = 1 (mod n), a non-zero residue r is an n-th power
+            # exactly when r**((p - 1) / n) = 1 (mod p).
+            for p in Rational._residue_primes(n):
+                r = a % p
+                if r and pow(r, (p - 1) // n, p) != 1:
+                    return None
+            # Start from a power of two above the root; Newton then decreases monotonically.
+            root = 1 << -(-a.bit_length() // n)
+            while True:
+                candidate = ((n - 1) * root + a // root ** (n - 1)) // n
+                if candidate >= root:
+                    break
+                root = candidate
+        return root if root ** n == a else None
 
     @staticmethod
     def float_to_rational(float_number: float) -> 'Rational':
@@ -82,54 +339,320 @@ class Rational:
         """
         float_rounded = round(float_number, 10)
         return Rational(int(float_rounded*(10**10)), 10**10)
+
+    @staticmethod
+    def from_float(float_number: float, max_den: int|None = None) -> 'Rational':
+        """
+        Converts a floating-point number to a rational number without rounding.
+
+        The exact binary value is taken from float.as_integer_ratio, which is already
+        in lowest terms. If max_den is given, the result is the closest rational
+        with a denominator of at most max_den (see limit_denominator).
+
+        :param float_number: The floating-point number to convert.
+        :param max_den: Optional bound on the denominator of the result.
+        :raises ValueError: If float_number is infinite or NaN.
+        :return: The rational representation of the float_number.
+        """
+        result = Rational._make(*_float_parts(float_number))
+        if max_den is not None:
+            return result.limit_denominator(max_den)
+        return result
+
+    @staticmethod
+    def parse(text: str) -> 'Rational':
+        """
+        Parses a rational number; the exact inverse of __str__.
+
+        Accepts "n" and "n/d" with optional signs and surrounding whitespace or
+        parentheses, and decimal notation such as "-1.25" or "3e-4" (converted
+        exactly). Either side of the "/" may be a decimal. Digits are ASCII 0-9;
+        "_" separators are not accepted.
+
+        :param text: The string to parse.
+        :raises ValueError: If text is not a valid literal or the denominator is 0.
+        :return: The parsed rational number.
+        """
+        return Rational._make(*Rational._parse_parts(text))
+
+    @staticmethod
+    def _parse_parts(text: str) -> tuple[int, int]:
+        """
+        Parses a rational literal into its normalized (num, den) pair.
+
+        :param text: The string to parse.
+        :raises ValueError: If text is not a valid literal or the denominator is 0.
+        :return: The numerator and the positive denominator, coprime.
+        """
+        num_text, slash, den_text = text.partition("/")
+        try:
+            # Fast path: int() already handles signs and surrounding whitespace. It also
+            # takes "_" separators and non-ASCII digits, which the grammar does not, so
+            # those inputs go to the [0-9] patterns of the slow path.
+            if not text.isascii() or "_" in text:
+                raise ValueError
+            num = int(num_text)
+            den = int(den_text) if slash else 1
+        except ValueError:
+            num, den = Rational._parse_slow(text)
+        if den == 1:
+            return num, 1
+        if den == 0:
+            raise ValueError("denominator can't be 0")
+        if den < 0:
+            num, den = -num, -den
+        common = gcd(num, den)
+        return num // common, den // common
+
+    @staticmethod
+    def _parse_slow(text: str) -> tuple[int, int]:
+        """
+        Parses literals with parentheses or decimal parts; the result is not yet normalized.
+
+        :param text: The string to parse.
+        :raises ValueError: If text is not a valid literal.
+        :return: A (num, den) pair equal to the literal.
+        """
+        body = text.strip()
+        negative = False
+        if body[:1] in ("+", "-") and body[1:2] == "(":
+            negative = body[0] == "-"
+            body = body[1:]
+        if body[:1] == "(" and body[-1:] == ")":
+            body = body[1:-1].strip()
+        num_text, slash, den_text = body.partition("/")
+        num, den = Rational._parse_decimal(num_text.strip(), text)
+        if slash:
+            n2, d2 = Rational._parse_decimal(den_text.strip(), text)
+            num, den = num * d2, den * n2
+        return (-num if negative else num), den
+
+    @staticmethod
+    def _parse_decimal(part: str, text: str) -> tuple[int, int]:
+        digits = part[1:] if part[:1] in ("+", "-") else part
+        if digits.isascii() and digits.isdigit():
+            return int(part), 1
+        match = _DECIMAL.match(part)
+        if match is None or not (match.group(2) or match.group(3)):
+            raise ValueError(f"Invalid rational literal {text!r}")
+        sign, whole, fraction, exponent = match.groups()
+        fraction = fraction or ""
+        num = int(whole + fraction or "0")
+        den = 10 ** len(fraction)
+        if exponent:
+            shift = int(exponent)
+            if shift >= 0:
+                num *= 10 ** shift
+            else:
+                den *= 10 ** -shift
+        return (-num if sign == "-" else num), den
+
+    def limit_denominator(self, max_den: int = 1000000) -> 'Rational':
+        """
+        Finds the closest rational number with a denominator of at most max_den.
+
+        Walks the continued fraction expansion (the Stern-Brocot path) of the value
+        and picks the better of the last convergent and the last semiconvergent.
+
+        :param max_den: The largest allowed denominator.
+        :raises ValueError: If max_den is less than 1.
+        :return: The best rational approximation with den <= max_den.
+        """
+        if max_den < 1:
+            raise ValueError("max_den should be at least 1")
+        if self._den <= max_den:
+            return self
+        return Rational._make(*_nearest(self._num, self._den, max_den))
+
+    @staticmethod
+    def _tree_product(values: list[int]) -> int:
+        """
+        Multiplies integers pairwise in a balanced tree so operands stay of similar size.
+
+        :param values: The integers to multiply.
+        :return: Their product (1 for an empty list).
+        """
+        if not values:
+            return 1
+        while len(values) > 1:
+            paired = [values[i] * values[i + 1] for i in range(0, len(values) - 1, 2)]
+            if len(values) % 2:
+                paired.append(values[-1])
+            values = paired
+        return values[0]
+
+    @staticmethod
+    def _parts(value) -> tuple[int, int]:
+        """
+        Returns the numerator and denominator of a Rational, int, float or Fraction term.
+
+        :param value: The term to split.
+        :raises TypeError: If value is not a Rational, int, float or Fraction.
+        :return: The (num, den) pair.
+        """
+        parts = _operand_parts.get(type(value))
+        if parts is None:
+            raise TypeError(f"Can't sum or multiply rational and {type(value)}")
+        return parts(value)
+
+    @staticmethod
+    def sum(values) -> 'Rational':
+        """
+        Calculates the exact sum of an iterable of rational numbers.
+
+        Numerators are first added up per denominator, the groups are then combined
+        in a balanced tree over the lcm of their denominators, and the result is
+        reduced only once at the end.
+
+        :param values: An iterable of Rational/int/float terms.
+        :raises TypeError: If a term is not a Rational, int or float.
+        :return: The sum of the terms.
+        """
+        groups = {}
+        for value in values:
+            num, den = Rational._parts(value)
+            groups[den] = groups.get(den, 0) + num
+
+        terms = list(groups.items())
+        if not terms:
+            return Rational._make(0, 1)
+        while len(terms) > 1:
+            combined = []
+            for i in range(0, len(terms) - 1, 2):
+                (den1, num1), (den2, num2) = terms[i], terms[i + 1]
+                common = gcd(den1, den2)
+                den = den1 // common * den2
+                combined.append((den, num1 * (den2 // common) + num2 * (den1 // common)))
+            if len(terms) % 2:
+                combined.append(terms[-1])
+            terms = combined
+
+        den, num = terms[0]
+        common = gcd(num, den)
+        return Rational._result(num // common, den // common)
+
+    @staticmethod
+    def prod(values) -> 'Rational':
+        """
+        Calculates the exact product of an iterable of rational numbers.
+
+        Numerators and denominators are multiplied separately in balanced trees and
+        the result is reduced only once at the end.
+
+        :param values: An iterable of Rational/int/float factors.
+        :raises TypeError: If a factor is not a Rational, int or float.
+        :return: The product of the factors.
+        """
+        nums = []
+        dens = []
+        for value in values:
+            num, den = Rational._parts(value)
+            nums.append(num)
+            if den != 1:
+                dens.append(den)
+
+        num = Rational._tree_product(nums)
+        if num == 0:
+            return Rational._make(0, 1)
+        den = Rational._tree_product(dens)
+        common = gcd(num, den)
+        return Rational._result(num // common, den // common)
      
     def __add__(self, other):
-        if type(other) is int:
-            return Rational(self.num + other*self.den, self.den)
-        elif type(other) is float:
-            other = Rational.float_to_rational(other)
-            return self+other
-        elif type(other) is Rational:
-            return Rational(self.num * other.den + other.num * self.den, self.den * other.den)
+        # Rational and int operands skip the dispatch table; every other type is one lookup.
+        if type(other) is Rational:
+            num, den = other._num, other._den
+        elif type(other) is int:
+            num, den = other, 1
         else:
-            raise TypeError(f"Can't add rational to {type(other)}")
+            parts = _operand_parts.get(type(other))
+            if parts is None:
+                return _widen(other, "__radd__", self)
+            num, den = parts(other)
+        if den == 1:
+            return Rational._result(self._num + num * self._den, self._den)
+        d = self._den * den
+        n = self._num * den + num * self._den
+        common = gcd(n, d)
+        return Rational._result(n // common, d // common)
+
+    __radd__ = __add__
     
     def __sub__(self, other):
-        return self.__add__(-other)
+        if type(other) is Rational:
+            num, den = other._num, other._den
+        elif type(other) is int:
+            num, den = other, 1
+        else:
+            parts = _operand_parts.get(type(other))
+            if parts is None:
+                return _widen(other, "__rsub__", self)
+            num, den = parts(other)
+        if den == 1:
+            return Rational._result(self._num - num * self._den, self._den)
+        d = self._den * den
+        n = self._num * den - num * self._den
+        common = gcd(n, d)
+        return Rational._result(n // common, d // common)
+
+    def __rsub__(self, other):
+        result = self.__sub__(other)
+        return result if result is NotImplemented else -result
     
     def __neg__(self):
-        return Rational(-self.num, self.den)
+        return Rational._result(-self._num, self._den)
     
     def __mul__(self, other):
-        if type(other) is int:
-            return Rational(self.num*other, self.den)
-        elif type(other) is float:
-            other = Rational.float_to_rational(other)
-            return self*other
-        elif type(other) is Rational:
-            return Rational(self.num * other.num, self.den * other.den)
+        if type(other) is Rational:
+            num, den = other._num, other._den
+        elif type(other) is int:
+            num, den = other, 1
         else:
-            raise TypeError(f"Can't multiply rational by {type(other)}")
+            parts = _operand_parts.get(type(other))
+            if parts is None:
+                return _widen(other, "__rmul__", self)
+            num, den = parts(other)
+        if den == 1:
+            common = gcd(num, self._den)
+            return Rational._result(self._num * (num // common), self._den // common)
+        g1 = gcd(self._num, den)
+        g2 = gcd(num, self._den)
+        return Rational._result((self._num // g1) * (num // g2), (self._den // g2) * (den // g1))
+
+    __rmul__ = __mul__
     
     def __truediv__(self, other):
-        if type(other) is int:
-            other = Rational(other, 1)
-            return self/other
-        elif type(other) is float:
-            other = Rational.float_to_rational(other)
-            return self/other
-        elif type(other) is Rational:
-            other_sign = Rational.sign(other.num)
-            return Rational(other_sign * self.num * other.den, self.den * other.num * other_sign)
+        if type(other) is Rational:
+            num, den = other._num, other._den
+        elif type(other) is int:
+            num, den = other, 1
         else:
-            raise TypeError(f"Can't divide rational by {type(other)}")
+            parts = _operand_parts.get(type(other))
+            if parts is None:
+                return _widen(other, "__rtruediv__", self)
+            num, den = parts(other)
+        if num == 0:
+            raise ValueError("denominator can't be 0")
+        g1 = gcd(self._num, num)
+        g2 = gcd(self._den, den)
+        n = (self._num // g1) * (den // g2)
+        d = (self._den // g2) * (num // g1)
+        if d < 0:
+            n, d = -n, -d
+        return Rational._result(n, d)
+
+    def __rtruediv__(self, other):
+        parts = _operand_parts.get(type(other))
+        if parts is None:
+            return _widen(other, "__truediv__", self)
+        return Rational._make(*parts(other)) / self
         
     def __pow__(self, other):
         if type(other) is int:
             if other >= 0:
-                return Rational(self.num ** other, self.den ** other)
+                return Rational._result(self._num ** other, self._den ** other)
             else:
-                return Rational(self.den ** -other, self.num ** -other)
+                return Rational._reduced(self._den ** -other, self._num ** -other)
             
         elif type(other) is float:
             other = Rational.float_to_rational(other)
@@ -149,33 +672,141 @@ class Rational:
             raise TypeError("Exponent must be an integer or rational")
 
 
-    def __iadd__(self, other):
-        self.__dict__ = self.__add__(other).__dict__
-        return self
+    def __float__(self) -> float:
+        try:
+            return self._float
+        except AttributeError:
+            # int / int is correctly rounded, also for parts beyond the float range.
+            self._float = result = self._num / self._den
+            return result
 
-    def __imul__(self, other):
-        self.__dict__ = self.__mul__(other).__dict__
-        return self
-
-    def __isub__(self, other):
-        self.__iadd__(-other)
-        return self
+    def __eq__(self, other):
+        if type(other) is Rational:
+            return self._num == other._num and self._den == other._den
+        elif type(other) is float:
+            return self._compare(other) == 0
+        elif type(other) is complex:
+            return other.imag == 0 and self._compare(other.real) == 0
+        parts = _operand_parts.get(type(other))
+        if parts is None:
+            return NotImplemented
+        return (self._num, self._den) == parts(other)
 
-    def __itruediv__(self, other):
-        self.__dict__ = self.__truediv__(other).__dict__
-        return self
+    def _compare(self, other):
+        """
+        Compares the rational number with another value exactly.
 
+        Floats are compared through float.as_integer_ratio, so no rounding is involved.
 
-    def __eq__(self, other):
+        :param other: A Rational, int, float or Fraction.
+        :return: -1, 0 or 1 as self is less than, equal to or greater than other,
+                 None if other is NaN, NotImplemented for unsupported types.
+        """
         if type(other) is Rational:
-            return self.num == other.num and self.den == other.den
+            num, den = other._num, other._den
         elif type(other) is float:
-            other = Rational.float_to_rational(other)
-            return self == other
-        elif type(other) is int:
-            return self.num == other and self.den == 1
+            if isnan(other):
+                return None
+            if isinf(other):
+                return -1 if other > 0 else 1
+            num, den = other.as_integer_ratio()
+        else:
+            parts = _operand_parts.get(type(other))
+            if parts is None:
+                return NotImplemented
+            num, den = parts(other)
+
+        self_sign = (self._num > 0) - (self._num < 0)
+        other_sign = (num > 0) - (num < 0)
+        if self_sign != other_sign:
+            return 1 if self_sign > other_sign else -1
+        if den == self._den:
+            left, right = self._num, num
         else:
-            return False    
+            left, right = self._num * den, num * self._den
+        return (left > right) - (left < right)
+
+    def __lt__(self, other):
+        result = self._compare(other)
+        if result is NotImplemented:
+            return result
+        return result is not None and result < 0
+
+    def __le__(self, other):
+        result = self._compare(other)
+        if result is NotImplemented:
+            return result
+        return result is not None and result <= 0
+
+    def __gt__(self, other):
+        result = self._compare(other)
+        if result is NotImplemented:
+            return result
+        return result is not None and result > 0
+
+    def __ge__(self, other):
+        result = self._compare(other)
+        if result is NotImplemented:
+            return result
+        return result is not None and result >= 0
+
+    @staticmethod
+    def _float_key(value) -> float:
+        if type(value) is Rational:
+            try:
+                return value._num / value._den
+            except OverflowError:
+                return float("inf") if value._num > 0 else float("-inf")
+        try:
+            return float(value)
+        except OverflowError:
+            return float("inf") if value > 0 else float("-inf")
+
+    @staticmethod
+    def _exact_cmp(a, b) -> int:
+        if type(a) is Rational:
+            return a._compare(b)
+        return -b._compare(a) if type(b) is Rational else (a > b) - (a < b)
+
+    @staticmethod
+    def sorted(values, reverse: bool = False) -> list:
+        """
+        Sorts rational numbers exactly at close to the cost of a float sort.
+
+        The values are sorted by their correctly rounded float value first. Rounding
+        is monotonic, so only runs of equal float keys can be out of order, and those
+        runs are then sorted with exact comparisons.
+
+        :param values: An iterable of Rational/int/float values (no NaN).
+        :param reverse: If True, sort in descending order.
+        :return: A new sorted list.
+        """
+        keyed = sorted(((Rational._float_key(value), value) for value in values), key=lambda item: item[0])
+        result = [value for _, value in keyed]
+
+        exact_key = cmp_to_key(Rational._exact_cmp)
+        start = 0
+        while start < len(keyed):
+            end = start + 1
+            while end < len(keyed) and keyed[end][0] == keyed[start][0]:
+                end += 1
+            if end - start > 1:
+                result[start:end] = sorted(result[start:end], key=exact_key)
+            start = end
+
+        if reverse:
+            result.reverse()
+        return result
+
+    def __hash__(self):
+        result = self._hash
+        if result is None:
+            self._hash = result = _hash_parts(self._num, self._den)
+        return result
+
+    def __reduce__(self):
+        # Pickles as two plain ints; the cached hash and float are left behind.
+        return _restore, (self._num, self._den)
 
     def __str__(self) -> str:
         if self.den == 1:
@@ -183,3 +814,143 @@ class Rational:
         return f"{self.num}/{self.den}"
 
 
+def _restore(num: int, den: int) -> Rational:
+    """
+    Rebuilds a pickled rational number from its normalized parts.
+
+    Unlike Rational._make, it bypasses interning: an unpickled value is exactly
+    the one that was pickled.
+    """
+    obj = object.__new__(Rational)
+    obj._num = num
+    obj._den = den
+    obj._hash = None
+    return obj
+
+
+def _hash_parts(num: int, den: int) -> int:
+    """
+    Hashes the normalized fraction num/den.
+
+    Same algorithm as fractions.Fraction, so equal int/Fraction/Rational values hash alike.
+    """
+    try:
+        inverse = pow(den, -1, _HASH_MODULUS)
+    except ValueError:
+        result = _HASH_INF
+    else:
+        result = hash(hash(abs(num)) * inverse)
+    if num < 0:
+        result = -result
+    return -2 if result == -1 else result
+
+
+def _float_parts(value: float) -> tuple[int, int]:
+    """
+    Returns the exact binary value of a float as a normalized (num, den) pair.
+
+    Arithmetic, sum/prod, comparisons and from_float all convert floats this way,
+    so x + f - f == x holds for every finite float f.
+
+    :raises ValueError: If value is infinite or NaN.
+    """
+    if isinf(value) or isnan(value):
+        raise ValueError(f"Can't convert {value} to a rational number")
+    return value.as_integer_ratio()
+
+
+# Operand dispatch: each supported type maps to a function returning its (num, den).
+# Operators do a single lookup here instead of a chain of type tests.
+_operand_parts = {
+    Rational: attrgetter('_num', '_den'),
+    int: lambda value: (value, 1),
+    float: _float_parts,
+    Fraction: attrgetter('numerator', 'denominator'),
+}
+
+# Types that are wider than Rational (complex.py registers the builtin complex here); a
+# Rational operand is handed to the wider type's implementation of the operator.
+_widening = {}
+
+
+def _widen(other, method: str, value: Rational):
+    convert = _widening.get(type(other))
+    if convert is None:
+        return NotImplemented
+    return getattr(convert(other), method)(value)
+
+
+class PrecisionContext:
+    """
+    Bounds numerator and denominator growth of Rational arithmetic inside a with block.
+
+    Exact iterations such as Newton steps double the size of their values every
+    step; snapping each result to a bounded approximation keeps the cost per step
+    flat. Contexts nest like decimal.localcontext and are local to the current
+    thread or asyncio task.
+
+    Attributes for inspection:
+      rounded    the number of results that had to be snapped;
+      error      the sum of the absolute rounding errors, as a float;
+      max_error  the largest single absolute rounding error, as a float.
+    """
+    __slots__ = ('max_den', 'max_bits', 'rounding', 'rounded', 'error', 'max_error', '_token')
+
+    def __init__(self, max_den: int|None = None, max_bits: int|None = None, rounding: str = "nearest"):
+        if max_den is None and max_bits is None:
+            raise ValueError("max_den or max_bits must be given")
+        if max_den is not None and max_den < 1:
+            raise ValueError("max_den should be at least 1")
+        if max_bits is not None and max_bits < 1:
+            raise ValueError("max_bits should be at least 1")
+        if rounding not in _ROUNDINGS:
+            raise ValueError(f"Unknown rounding mode {rounding!r}")
+        self.max_den = max_den
+        self.max_bits = max_bits
+        self.rounding = rounding
+        self.rounded = 0
+        self.error = 0.0
+        self.max_error = 0.0
+        self._token = None
+
+    def __enter__(self):
+        self._token = _context.set(self)
+        return self
+
+    def __exit__(self, *exc):
+        _context.reset(self._token)
+        self._token = None
+
+    def _snap(self, num: int, den: int) -> tuple[int, int]:
+        """
+        Rounds the normalized fraction num/den to the bounds of this context.
+
+        :param num: The numerator.
+        :param den: The positive denominator, coprime with num.
+        :return: The rounded, normalized (num, den).
+        """
+        limit = den if self.max_den is None else self.max_den
+        if self.max_bits is not None:
+            cap = (1 << self.max_bits) - 1
+            # Keeps |num| <= cap as well, unless even an integer would exceed it.
+            limit = min(limit, cap, max(cap * den // abs(num), 1) if num else cap)
+        if den <= limit:
+            return num, den
+        if self.rounding == "nearest":
+            p, q = _nearest(num, den, limit)
+        else:
+            p1, q1, p2, q2 = _bracket(num, den, limit)
+            if p1 * q2 > p2 * q1:
+                p1, q1, p2, q2 = p2, q2, p1, q1
+            # p1/q1 < num/den < p2/q2
+            if self.rounding == "floor" or self.rounding == "down" and num > 0 \
+                    or self.rounding == "up" and num < 0:
+                p, q = p1, q1
+            else:
+                p, q = p2, q2
+        error = abs(num * q - p * den) / (den * q)
+        self.rounded += 1
+        self.error += error
+        if error > self.max_error:
+            self.max_error = error
+        return p, q
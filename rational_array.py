@@ -0,0 +1,381 @@
+from rational import Rational
+import numpy as np
+
+# Products whose float estimate stays below this bound are guaranteed to fit in int64,
+# even after adding two of them together.
+_SAFE_PRODUCT = float(2**62)
+# The int64 range is kept symmetric: -2**63 is never stored, so negating a lane cannot wrap.
+_INT64_MIN = -2**63 + 1
+_INT64_MAX = 2**63 - 1
+
+
+def _safe_mul(x: np.ndarray, y: np.ndarray) -> bool:
+    """
+    Checks whether every lane of x*y fits comfortably in int64.
+
+    :param x: The first factor array.
+    :param y: The second factor array.
+    :return: True if all products are below 2**62 in magnitude.
+    """
+    if x.dtype == object or y.dtype == object:
+        return False
+    estimate = np.abs(x.astype(np.float64)) * np.abs(y.astype(np.float64))
+    return bool(np.all(estimate < _SAFE_PRODUCT))
+
+
+def _promote(arr: np.ndarray) -> np.ndarray:
+    """
+    Converts an array to Python-int object storage.
+
+    :param arr: The array to convert.
+    :return: The same values with dtype=object.
+    """
+    if arr.dtype == object:
+        return arr
+    return np.array([int(v) for v in arr.tolist()], dtype=object).reshape(arr.shape)
+
+
+def _demote(arr: np.ndarray) -> np.ndarray:
+    """
+    Converts an object array back to int64 if every value fits.
+
+    :param arr: The array to convert.
+    :return: An int64 array when possible, otherwise arr unchanged.
+    """
+    if arr.dtype != object:
+        return arr
+    if len(arr) == 0:
+        return arr.astype(np.int64)
+    if min(arr) >= _INT64_MIN and max(arr) <= _INT64_MAX:
+        return arr.astype(np.int64)
+    return arr
+
+
+def _matched(num: np.ndarray, den: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Gives a numerator and a denominator column the same storage.
+
+    :param num: The numerator column.
+    :param den: The denominator column.
+    :return: Both columns as int64, or both as objects if either one is object storage.
+    """
+    if num.dtype != den.dtype:
+        return _promote(num), _promote(den)
+    return num, den
+
+
+def _as_parts(values) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Splits an iterable of Rational/int values into numerator and denominator arrays.
+
+    :param values: An iterable of Rational or int values.
+    :raises TypeError: If an element is neither Rational nor int.
+    :return: The numerator and denominator arrays.
+    """
+    nums = []
+    dens = []
+    for value in values:
+        if type(value) is Rational:
+            nums.append(value.num)
+            dens.append(value.den)
+        elif type(value) is int:
+            nums.append(value)
+            dens.append(1)
+        else:
+            raise TypeError(f"RationalArray elements must be Rational/int, not {type(value)}")
+    return _matched(_from_ints(nums), _from_ints(dens))
+
+
+def _from_ints(values: list) -> np.ndarray:
+    """
+    Stores a list of Python ints as int64, or as objects if any of them is too large.
+
+    :param values: The integers to store.
+    :return: A one-dimensional int64 or object array.
+    """
+    if values and (min(values) < _INT64_MIN or max(values) > _INT64_MAX):
+        return np.array(values, dtype=object)
+    return np.array(values, dtype=np.int64)
+
+
+class RationalArray:
+    """
+    A one-dimensional array of rational numbers stored as parallel numerator and
+    denominator columns.
+
+    The columns are int64 while every value fits and switch to Python-int object
+    storage as soon as an operation would overflow, so results always match scalar
+    Rational arithmetic exactly.
+    """
+    __slots__ = ('_num', '_den')
+
+    def __init__(self, values=()):
+        self._num, self._den = _as_parts(values)
+
+    @classmethod
+    def _make(cls, num: np.ndarray, den: np.ndarray) -> 'RationalArray':
+        """
+        Builds an array from columns that are already normalized.
+
+        :param num: The numerator column.
+        :param den: The positive denominator column, coprime with num lane by lane.
+        :return: The rational array num/den.
+        """
+        obj = object.__new__(cls)
+        obj._num = num
+        obj._den = den
+        return obj
+
+    @classmethod
+    def _normalized(cls, num: np.ndarray, den: np.ndarray) -> 'RationalArray':
+        """
+        Builds an array from arbitrary columns, reducing every lane by its gcd.
+
+        :param num: The numerator column.
+        :param den: The denominator column.
+        :raises ValueError: If any denominator is 0.
+        :return: The normalized rational array num/den.
+        """
+        if np.any(den == 0):
+            raise ValueError("denominator can't be 0")
+        negative = den < 0
+        if np.any(negative):
+            num = np.where(negative, -num, num)
+            den = np.where(negative, -den, den)
+        common = np.gcd(num, den)
+        num = num // common
+        den = den // common
+        if num.dtype == object:
+            num, den = _matched(_demote(num), _demote(den))
+        return cls._make(num, den)
+
+    @staticmethod
+    def from_parts(num, den) -> 'RationalArray':
+        """
+        Builds an array from numerator and denominator sequences.
+
+        :param num: The numerators (a sequence or integer array).
+        :param den: The denominators (a sequence or integer array) of the same length.
+        :raises ValueError: If the lengths differ or any denominator is 0.
+        :return: The normalized rational array.
+        """
+        num = _from_ints([int(v) for v in num])
+        den = _from_ints([int(v) for v in den])
+        if len(num) != len(den):
+            raise ValueError("numerator and denominator arrays must have the same length")
+        return RationalArray._normalized(*_matched(num, den))
+
+    @property
+    def num(self) -> np.ndarray:
+        return self._num
+
+    @property
+    def den(self) -> np.ndarray:
+        return self._den
+
+    @property
+    def dtype(self):
+        return self._num.dtype
+
+    def __len__(self) -> int:
+        return len(self._num)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Rational._make(int(self._num[index]), int(self._den[index]))
+        return RationalArray._make(self._num[index], self._den[index])
+
+    def __iter__(self):
+        for num, den in zip(self._num.tolist(), self._den.tolist()):
+            yield Rational._make(int(num), int(den))
+
+    def to_list(self) -> list[Rational]:
+        """
+        Unpacks the array into a list of Rational values.
+
+        :return: The list of Rational values.
+        """
+        return list(self)
+
+    def _coerce(self, other) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns numerator and denominator columns of other, broadcast against self.
+
+        :param other: A RationalArray, Rational or int.
+        :raises ValueError: If other is an array of a different length.
+        :return: The numerator and denominator columns, or None if other is unsupported.
+        """
+        if type(other) is RationalArray:
+            if len(other) != len(self):
+                raise ValueError("RationalArray lengths do not match")
+            return other._num, other._den
+        if type(other) is int:
+            other = Rational._make(other, 1)
+        if type(other) is Rational:
+            num = _from_ints([other.num])
+            den = _from_ints([other.den])
+            return num, den
+        return None
+
+    @staticmethod
+    def _mul(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+        if _safe_mul(x, y):
+            return x * y
+        return _promote(x) * _promote(y)
+
+    def _add_parts(self, num: np.ndarray, den: np.ndarray) -> 'RationalArray':
+        if _safe_mul(self._num, den) and _safe_mul(num, self._den) and _safe_mul(self._den, den):
+            new_num = self._num * den + num * self._den
+            new_den = self._den * den
+        else:
+            a, b, c, d = _promote(self._num), _promote(self._den), _promote(num), _promote(den)
+            new_num = a * d + c * b
+            new_den = b * d
+        return RationalArray._normalized(new_num, new_den)
+
+    def __add__(self, other):
+        parts = self._coerce(other)
+        if parts is None:
+            return NotImplemented
+        return self._add_parts(parts[0], parts[1])
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return RationalArray._make(-self._num, self._den)
+
+    def __sub__(self, other):
+        parts = self._coerce(other)
+        if parts is None:
+            return NotImplemented
+        return self._add_parts(-parts[0], parts[1])
+
+    def __rsub__(self, other):
+        return (-self).__add__(other)
+
+    def __mul__(self, other):
+        parts = self._coerce(other)
+        if parts is None:
+            return NotImplemented
+        num, den = parts
+        return RationalArray._normalized(RationalArray._mul(self._num, num),
+                                         RationalArray._mul(self._den, den))
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        parts = self._coerce(other)
+        if parts is None:
+            return NotImplemented
+        num, den = parts
+        return RationalArray._normalized(RationalArray._mul(self._num, den),
+                                         RationalArray._mul(self._den, num))
+
+    def __rtruediv__(self, other):
+        parts = self._coerce(other)
+        if parts is None:
+            return NotImplemented
+        num, den = parts
+        return RationalArray._normalized(RationalArray._mul(num, self._den),
+                                         RationalArray._mul(den, self._num))
+
+    def _cross(self, other) -> tuple[np.ndarray, np.ndarray]:
+        parts = self._coerce(other)
+        if parts is None:
+            return None
+        num, den = parts
+        return RationalArray._mul(self._num, den), RationalArray._mul(num, self._den)
+
+    def __eq__(self, other):
+        parts = self._coerce(other)
+        if parts is None:
+            return NotImplemented
+        return np.asarray(self._num == parts[0], dtype=bool) & np.asarray(self._den == parts[1], dtype=bool)
+
+    def __ne__(self, other):
+        result = self.__eq__(other)
+        if result is NotImplemented:
+            return result
+        return ~result
+
+    def __lt__(self, other):
+        cross = self._cross(other)
+        if cross is None:
+            return NotImplemented
+        return np.asarray(cross[0] < cross[1], dtype=bool)
+
+    def __le__(self, other):
+        cross = self._cross(other)
+        if cross is None:
+            return NotImplemented
+        return np.asarray(cross[0] <= cross[1], dtype=bool)
+
+    def __gt__(self, other):
+        cross = self._cross(other)
+        if cross is None:
+            return NotImplemented
+        return np.asarray(cross[0] > cross[1], dtype=bool)
+
+    def __ge__(self, other):
+        cross = self._cross(other)
+        if cross is None:
+            return NotImplemented
+        return np.asarray(cross[0] >= cross[1], dtype=bool)
+
+    __hash__ = None
+
+    def _reduce(self, op, empty: Rational) -> Rational:
+        """
+        Folds the array pairwise, halving its length with one vectorized step each time.
+
+        :param op: The binary operator applied to the two halves.
+        :param empty: The value returned for an empty array.
+        :return: The reduced Rational value.
+        """
+        if len(self) == 0:
+            return empty
+        current = self
+        while len(current) > 1:
+            half = len(current) // 2
+            combined = op(current[0:half], current[half:2 * half])
+            if len(current) % 2:
+                combined = RationalArray._make(_concat(combined._num, current._num[-1:]),
+                                               _concat(combined._den, current._den[-1:]))
+            current = combined
+        return Rational._result(int(current._num[0]), int(current._den[0]))
+
+    def sum(self) -> Rational:
+        """
+        Returns the exact sum of all elements.
+
+        :return: The sum as a Rational.
+        """
+        return self._reduce(RationalArray.__add__, Rational._make(0, 1))
+
+    def prod(self) -> Rational:
+        """
+        Returns the exact product of all elements.
+
+        :return: The product as a Rational.
+        """
+        return self._reduce(RationalArray.__mul__, Rational._make(1, 1))
+
+    def to_float(self) -> np.ndarray:
+        """
+        Converts every element to float64.
+
+        :return: A float64 array of the values.
+        """
+        if self._num.dtype == object:
+            return np.array([num / den for num, den in zip(self._num.tolist(), self._den.tolist())],
+                            dtype=np.float64)
+        return self._num / self._den
+
+    def __repr__(self) -> str:
+        return "RationalArray([" + ", ".join(str(value) for value in self) + "])"
+
+
+def _concat(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    if x.dtype != y.dtype:
+        x, y = _promote(x), _promote(y)
+    return np.concatenate((x, y))
@@ -0,0 +1,130 @@
+import unittest
+import random
+import numpy as np
+from rational import Rational
+from rational_array import RationalArray
+
+class TestRationalArray(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(1)
+        self.xs = [Rational(rng.randint(-50, 50), rng.randint(1, 50)) for _ in range(40)]
+        self.ys = [Rational(rng.randint(-50, 50), rng.randint(1, 50)) for _ in range(40)]
+        self.a = RationalArray(self.xs)
+        self.b = RationalArray(self.ys)
+
+    def test_init(self):
+        arr = RationalArray([Rational(2, 4), 3])
+        self.assertEqual(arr.num.tolist(), [1, 3])
+        self.assertEqual(arr.den.tolist(), [2, 1])
+        self.assertEqual(arr.dtype, np.int64)
+
+    def test_init_type_error(self):
+        with self.assertRaises(TypeError):
+            RationalArray([Rational(1, 2), "a"])
+
+    def test_from_parts_normalizes(self):
+        arr = RationalArray.from_parts([2, 3, 0], [-4, 9, 5])
+        self.assertEqual(arr.to_list(), [Rational(-1, 2), Rational(1, 3), Rational(0, 1)])
+        self.assertEqual(arr.den.tolist(), [2, 3, 1])
+
+    def test_from_parts_zero_den(self):
+        with self.assertRaises(ValueError):
+            RationalArray.from_parts([1], [0])
+
+    def test_add(self):
+        self.assertEqual((self.a + self.b).to_list(), [x + y for x, y in zip(self.xs, self.ys)])
+
+    def test_sub(self):
+        self.assertEqual((self.a - self.b).to_list(), [x - y for x, y in zip(self.xs, self.ys)])
+
+    def test_mul(self):
+        self.assertEqual((self.a * self.b).to_list(), [x * y for x, y in zip(self.xs, self.ys)])
+
+    def test_truediv(self):
+        ys = [y if y != 0 else Rational(1, 1) for y in self.ys]
+        result = self.a / RationalArray(ys)
+        self.assertEqual(result.to_list(), [x / y for x, y in zip(self.xs, ys)])
+
+    def test_truediv_zero(self):
+        with self.assertRaises(ValueError):
+            _ = self.a / RationalArray([0] * len(self.a))
+
+    def test_scalar_broadcast(self):
+        r = Rational(3, 7)
+        self.assertEqual((self.a + r).to_list(), [x + r for x in self.xs])
+        self.assertEqual((2 * self.a).to_list(), [x * 2 for x in self.xs])
+        self.assertEqual((1 - self.a).to_list(), [-x + 1 for x in self.xs])
+
+    def test_length_mismatch(self):
+        with self.assertRaises(ValueError):
+            _ = self.a + self.b[:3]
+
+    def test_overflow_promotes(self):
+        big = Rational(2**62 + 1, 3)
+        arr = RationalArray([big, Rational(1, 2)])
+        result = arr * arr
+        self.assertEqual(result.dtype, object)
+        self.assertEqual(result.to_list(), [big * big, Rational(1, 4)])
+
+    def test_overflow_demotes_after_reduction(self):
+        arr = RationalArray([Rational(2**40, 3)])
+        result = (arr * arr) / arr
+        self.assertEqual(result.to_list(), [Rational(2**40, 3)])
+        self.assertEqual(result.dtype, np.int64)
+
+    def test_wide_parts_share_dtype(self):
+        for value in (Rational(1, 2**70), Rational(2**70, 3)):
+            a = RationalArray([value, Rational(1, 2)])
+            self.assertEqual((a.num.dtype, a.den.dtype), (object, object))
+            self.assertEqual(a.to_list(), [value, Rational(1, 2)])
+
+    def test_int64_min_negation(self):
+        arr = RationalArray([Rational(-2**63, 1), Rational(1, 2)])
+        self.assertEqual((-arr).to_list(), [Rational(2**63, 1), Rational(-1, 2)])
+        self.assertEqual((RationalArray([0, 0]) - arr).to_list(), [Rational(2**63, 1), Rational(-1, 2)])
+        self.assertEqual((0 - arr).to_list(), [Rational(2**63, 1), Rational(-1, 2)])
+
+    def test_int64_min_denominator(self):
+        result = RationalArray.from_parts([1, 3], [-2**63, 4])
+        self.assertEqual(result.to_list(), [Rational(-1, 2**63), Rational(3, 4)])
+        self.assertTrue(all(den > 0 for den in result.den))
+
+    def test_comparisons(self):
+        self.assertEqual((self.a < self.b).tolist(), [x.num * y.den < y.num * x.den for x, y in zip(self.xs, self.ys)])
+        self.assertEqual((self.a == self.a).tolist(), [True] * len(self.a))
+        self.assertEqual((self.a != self.a).tolist(), [False] * len(self.a))
+        self.assertEqual((self.a >= Rational(0, 1)).tolist(), [x.num >= 0 for x in self.xs])
+
+    def test_sum(self):
+        expected = Rational(0, 1)
+        for x in self.xs:
+            expected += x
+        self.assertEqual(self.a.sum(), expected)
+
+    def test_prod(self):
+        expected = Rational(1, 1)
+        for y in self.ys[:10]:
+            expected *= y
+        self.assertEqual(self.b[:10].prod(), expected)
+
+    def test_sum_empty(self):
+        self.assertEqual(RationalArray().sum(), 0)
+
+    def test_getitem(self):
+        self.assertEqual(self.a[3], self.xs[3])
+        self.assertEqual(self.a[2:5].to_list(), self.xs[2:5])
+
+    def test_getitem_localcontext(self):
+        with Rational.localcontext(max_den=2):
+            self.assertEqual(RationalArray([Rational(1, 3)])[0], Rational(1, 3))
+            self.assertEqual(self.a.to_list(), self.xs)
+
+    def test_to_float(self):
+        floats = self.a.to_float()
+        for value, x in zip(floats, self.xs):
+            self.assertAlmostEqual(value, x.num / x.den)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,4 +1,8 @@
 import unittest
+import asyncio
+import pickle
+import random
+import threading
 from rational import Rational
 
 class TestRational(unittest.TestCase):
@@ -38,34 +42,25 @@ class TestRational(unittest.TestCase):
         r = Rational(2, 3)
         self.assertEqual(r.num, 2)
 
-    def test_num_setter(self):
+    def test_num_read_only(self):
         r = Rational(2, 3)
-        r.num = 5
-        self.assertEqual(r.num, 5)
-
-    def test_num_setter_type_error(self):
-        r = Rational(2, 3)
-        with self.assertRaises(TypeError):
-            r.num = "a"
+        with self.assertRaises(AttributeError):
+            r.num = 5
+        self.assertEqual(r.num, 2)
 
     def test_den_getter(self):
         r = Rational(2, 3)
         self.assertEqual(r.den, 3)
 
-    def test_den_setter(self):
+    def test_den_read_only(self):
         r = Rational(2, 3)
-        r.den = 7
-        self.assertEqual(r.den, 7)
+        with self.assertRaises(AttributeError):
+            r.den = 7
+        self.assertEqual(r.den, 3)
 
-    def test_den_setter_type_error(self):
-        r = Rational(2, 3)
-        with self.assertRaises(TypeError):
-            r.den = "b"
-
-    def test_den_setter_value_error_zero(self):
-        r = Rational(2, 3)
-        with self.assertRaises(ValueError):
-            r.den = 0
+    def test_no_instance_attributes(self):
+        with self.assertRaises(AttributeError):
+            Rational(2, 3).value = 1
 
     def test_add(self):
         r1 = Rational(1, 2)
@@ -430,6 +425,460 @@ class TestRational(unittest.TestCase):
         r = Rational(-2, 3)
         self.assertEqual(str(r), "-2/3")
 
+    def test_slots_no_instance_dict(self):
+        r = Rational(1, 2)
+        self.assertFalse(hasattr(r, "__dict__"))
+        with self.assertRaises(AttributeError):
+            r.other = 1
+
+    def test_make_skips_normalization(self):
+        r = Rational._make(3, 4)
+        self.assertEqual(r.num, 3)
+        self.assertEqual(r.den, 4)
+        self.assertEqual(r, Rational(6, 8))
+
+    def test_iadd_rebinds(self):
+        r = Rational(1, 2)
+        same = r
+        r += Rational(1, 3)
+        self.assertIsNot(r, same)
+        self.assertEqual(r, Rational(5, 6))
+        self.assertEqual(same, Rational(1, 2))
+
+    def test_mul_result_normalized(self):
+        result = Rational(4, 9) * Rational(3, 8)
+        self.assertEqual(result.num, 1)
+        self.assertEqual(result.den, 6)
+
+    def test_truediv_by_zero(self):
+        with self.assertRaises(ValueError):
+            _ = Rational(1, 2) / Rational(0, 1)
+
+    def test_sum(self):
+        values = [Rational(1, 2), Rational(1, 3), 2, Rational(-5, 6), Rational(7, 4)]
+        self.assertEqual(Rational.sum(values), Rational(15, 4))
+
+    def test_sum_matches_loop(self):
+        values = [Rational(i % 17 - 8, i % 13 + 1) for i in range(500)]
+        expected = Rational(0, 1)
+        for value in values:
+            expected += value
+        self.assertEqual(Rational.sum(values), expected)
+
+    def test_sum_empty(self):
+        self.assertEqual(Rational.sum([]), Rational(0, 1))
+
+    def test_sum_type_error(self):
+        with self.assertRaises(TypeError):
+            Rational.sum([Rational(1, 2), "a"])
+
+    def test_prod(self):
+        values = [Rational(2, 3), Rational(-9, 4), 2]
+        self.assertEqual(Rational.prod(values), Rational(-3, 1))
+
+    def test_prod_with_zero(self):
+        self.assertEqual(Rational.prod([Rational(2, 3), 0, Rational(1, 7)]), Rational(0, 1))
+
+    def test_prod_empty(self):
+        self.assertEqual(Rational.prod([]), Rational(1, 1))
+
+    def test_hash_matches_fraction(self):
+        from fractions import Fraction
+        for num, den in [(1, 2), (-1, 2), (0, 1), (7, 1), (-7, 1), (10**30, 7), (-3, 2**61 - 1)]:
+            self.assertEqual(hash(Rational(num, den)), hash(Fraction(num, den)))
+
+    def test_hash_matches_int(self):
+        self.assertEqual(hash(Rational(5, 1)), hash(5))
+        self.assertEqual(hash(Rational(-1, 1)), hash(-1))
+
+    def test_hash_dict_key(self):
+        d = {Rational(1, 2): "half"}
+        self.assertEqual(d[Rational(2, 4)], "half")
+        self.assertEqual(len({Rational(1, 2), Rational(2, 4), Rational(1, 3)}), 2)
+
+    def test_hash_after_iadd(self):
+        r = Rational(1, 2)
+        hash(r)
+        r += Rational(1, 2)
+        self.assertEqual(hash(r), hash(1))
+
+    def test_float(self):
+        self.assertEqual(float(Rational(1, 4)), 0.25)
+        self.assertEqual(float(Rational(-1, 3)), -1 / 3)
+        self.assertEqual(float(Rational(10**400 + 1, 10**400)), 1.0)
+        r = Rational(2, 3)
+        self.assertIs(float(r), float(r))
+
+    def test_interning(self):
+        Rational.enable_interning(4)
+        try:
+            a = Rational(1, 4) + Rational(1, 4)
+            b = Rational(3, 4) - Rational(1, 4)
+            self.assertIs(a, b)
+            self.assertIsNot(Rational(1, 7) * 7, Rational(100, 1) / 100 + 5)
+        finally:
+            Rational.disable_interning()
+
+    def test_interned_values_read_only(self):
+        Rational.enable_interning()
+        try:
+            half = Rational(1, 4) * 2
+            alias = half
+            alias += Rational(1, 2)
+            self.assertEqual(half, Rational(1, 2))
+            self.assertEqual(alias, Rational(1, 1))
+            with self.assertRaises(AttributeError):
+                half.num = 3
+        finally:
+            Rational.disable_interning()
+
+    def test_enable_interning_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            Rational.enable_interning(0)
+
+    def test_lt(self):
+        self.assertTrue(Rational(1, 3) < Rational(1, 2))
+        self.assertFalse(Rational(1, 2) < Rational(1, 2))
+        self.assertTrue(Rational(-1, 2) < Rational(1, 3))
+        self.assertTrue(Rational(-1, 2) < 0)
+
+    def test_le_ge(self):
+        self.assertTrue(Rational(2, 4) <= Rational(1, 2))
+        self.assertTrue(Rational(2, 4) >= Rational(1, 2))
+        self.assertTrue(Rational(5, 2) >= 2)
+        self.assertFalse(Rational(3, 2) >= 2)
+
+    def test_gt_negative(self):
+        self.assertTrue(Rational(-1, 3) > Rational(-1, 2))
+        self.assertFalse(Rational(-5, 1) > -3)
+
+    def test_compare_float_exact(self):
+        third = Rational(1, 3)
+        self.assertFalse(third == 1 / 3)
+        self.assertTrue(third > 1 / 3)
+        self.assertTrue(Rational(3, 4) == 0.75)
+        self.assertTrue(Rational(1, 10) < 0.1)
+
+    def test_compare_float_special(self):
+        self.assertTrue(Rational(10**400, 1) < float("inf"))
+        self.assertTrue(Rational(-10**400, 1) > float("-inf"))
+        self.assertFalse(Rational(1, 2) < float("nan"))
+        self.assertFalse(Rational(1, 2) >= float("nan"))
+        self.assertFalse(Rational(1, 2) == float("nan"))
+
+    def test_compare_type_error(self):
+        with self.assertRaises(TypeError):
+            _ = Rational(1, 2) < "a"
+
+    def test_bisect(self):
+        import bisect
+        values = [Rational(i, 7) for i in range(10)]
+        self.assertEqual(bisect.bisect_left(values, Rational(1, 2)), 4)
+
+    def test_sorted_exact_ties(self):
+        base = 10**30
+        values = [Rational(base + 2, base), Rational(base + 1, base), Rational(1, 1), Rational(-1, 3), 2, 0.5]
+        expected = [Rational(-1, 3), 0.5, Rational(1, 1), Rational(base + 1, base), Rational(base + 2, base), 2]
+        self.assertEqual(Rational.sorted(values), expected)
+        self.assertEqual(Rational.sorted(values, reverse=True), expected[::-1])
+
+    def test_sorted_huge_values(self):
+        values = [Rational(10**400 + 1, 1), Rational(-10**400, 1), Rational(10**400, 1)]
+        self.assertEqual(Rational.sorted(values), [values[1], values[2], values[0]])
+
+    def test_from_float_exact(self):
+        self.assertEqual(Rational.from_float(0.75), Rational(3, 4))
+        r = Rational.from_float(0.1)
+        self.assertEqual(r.num, 3602879701896397)
+        self.assertEqual(r.den, 2**55)
+
+    def test_from_float_small_and_large(self):
+        self.assertEqual(Rational.from_float(2.0**-1000), Rational(1, 2**1000))
+        self.assertEqual(Rational.from_float(1e300), Rational(int(1e300), 1))
+
+    def test_from_float_negative(self):
+        self.assertEqual(Rational.from_float(-2.5), Rational(-5, 2))
+
+    def test_from_float_invalid(self):
+        with self.assertRaises(ValueError):
+            Rational.from_float(float("inf"))
+        with self.assertRaises(ValueError):
+            Rational.from_float(float("nan"))
+
+    def test_from_float_max_den(self):
+        self.assertEqual(Rational.from_float(0.1, 1000), Rational(1, 10))
+        self.assertEqual(Rational.from_float(1 / 3, 100), Rational(1, 3))
+
+    def test_limit_denominator(self):
+        from fractions import Fraction
+        import math
+        r = Rational.from_float(math.pi)
+        for max_den in (1, 7, 100, 113, 1000, 10**6):
+            expected = Fraction(math.pi).limit_denominator(max_den)
+            self.assertEqual(r.limit_denominator(max_den), Rational(expected.numerator, expected.denominator))
+
+    def test_limit_denominator_negative(self):
+        self.assertEqual(Rational(-355, 113).limit_denominator(10), Rational(-22, 7))
+
+    def test_limit_denominator_already_small(self):
+        r = Rational(3, 7)
+        self.assertIs(r.limit_denominator(10), r)
+
+    def test_limit_denominator_invalid(self):
+        with self.assertRaises(ValueError):
+            Rational(1, 3).limit_denominator(0)
+
+    def test_root_large_square(self):
+        x = 3**2000 + 12345
+        self.assertEqual(Rational.root(Rational(x * x, 7**400), 2), Rational(x, 7**200))
+
+    def test_root_large_cube_irrational(self):
+        x = 2**1100 + 1
+        with self.assertRaises(ValueError):
+            Rational.root(Rational(x**3 + 1, 1), 3)
+
+    def test_root_beyond_float_precision(self):
+        x = 2**53 + 1
+        self.assertEqual(Rational.root(Rational(x**5, 1), 5), Rational(x, 1))
+        with self.assertRaises(ValueError):
+            Rational.root(Rational(x**5 - 1, 1), 5)
+
+    def test_root_negative_odd(self):
+        self.assertEqual(Rational.root(Rational(-8, 27), 3), Rational(-2, 3))
+
+    def test_root_negative_even(self):
+        with self.assertRaises(ValueError):
+            Rational.root(Rational(-4, 9), 2)
+
+    def test_int_root(self):
+        for n in range(2, 9):
+            for r in (0, 1, 2, 3, 10, 99, 2**70 + 3):
+                self.assertEqual(Rational._int_root(r**n, n), r)
+                if r > 1:
+                    self.assertIsNone(Rational._int_root(r**n + 1, n))
+
+    def test_root_large_degree(self):
+        for n in (10007, 100003):
+            with self.assertRaises(ValueError):
+                Rational.root(Rational(2, 1), n)
+        self.assertEqual(Rational.root(Rational(3**10007, 7**10007), 10007), Rational(3, 7))
+        with self.assertRaises(ValueError):
+            Rational.root(Rational(3**10007 + 1, 1), 10007)
+
+    def test_pow_rational_large(self):
+        x = 5**300
+        self.assertEqual(Rational(x**3, 8) ** Rational(2, 3), Rational(x**2, 4))
+
+    def test_reflected_int(self):
+        r = Rational(1, 2)
+        self.assertEqual(2 + r, Rational(5, 2))
+        self.assertEqual(2 - r, Rational(3, 2))
+        self.assertEqual(3 * r, Rational(3, 2))
+        self.assertEqual(3 / r, Rational(6, 1))
+
+    def test_reflected_float(self):
+        self.assertEqual(1.5 + Rational(1, 2), Rational(2, 1))
+        self.assertEqual(1.5 / Rational(1, 2), Rational(3, 1))
+
+    def test_float_operands_exact(self):
+        self.assertTrue(Rational(0, 1) + 0.1 == 0.1)
+        self.assertEqual(Rational(1, 2) * 1e-11, Rational.from_float(1e-11) / 2)
+        self.assertEqual(Rational(5, 1) * 1e20, Rational(5 * 10**20, 1))
+        self.assertEqual(Rational.sum([0.1, 0.2]), Rational.from_float(0.1) + Rational.from_float(0.2))
+        self.assertEqual(Rational.prod([0.1, Rational(3, 1)]), 3 * Rational.from_float(0.1))
+
+    def test_float_operands_round_trip(self):
+        rng = random.Random(9)
+        for _ in range(200):
+            x = Rational(rng.randint(-10**6, 10**6), rng.randint(1, 10**6))
+            f = rng.uniform(-1e6, 1e6) * 10.0 ** rng.randint(-20, 20)
+            self.assertEqual(x + f - f, x)
+            self.assertEqual((x - f > 0) - (x - f < 0), (x > f) - (x < f))
+
+    def test_float_operands_special(self):
+        for value in (float("inf"), float("-inf"), float("nan")):
+            with self.assertRaises(ValueError):
+                _ = Rational(1, 2) + value
+            with self.assertRaises(ValueError):
+                _ = value * Rational(1, 2)
+            with self.assertRaises(ValueError):
+                Rational.sum([Rational(1, 2), value])
+
+    def test_rtruediv_zero(self):
+        with self.assertRaises(ValueError):
+            _ = 1 / Rational(0, 1)
+
+    def test_fraction_operands(self):
+        from fractions import Fraction
+        r = Rational(1, 2)
+        self.assertEqual(r + Fraction(1, 3), Rational(5, 6))
+        self.assertEqual(Fraction(1, 3) - r, Rational(-1, 6))
+        self.assertEqual(r * Fraction(2, 3), Rational(1, 3))
+        self.assertEqual(Fraction(2, 3) / r, Rational(4, 3))
+        self.assertIs(type(Fraction(1, 3) + r), Rational)
+        self.assertTrue(r == Fraction(1, 2))
+        self.assertTrue(Fraction(1, 2) == r)
+        self.assertTrue(r < Fraction(2, 3))
+        self.assertEqual(Rational.sum([r, Fraction(1, 2)]), 1)
+
+    def test_builtin_complex_operands(self):
+        from complex import Complex
+        r = Rational(1, 2)
+        self.assertEqual(r + 1j, Complex(r, 1))
+        self.assertEqual(2j * r, Complex(0, 1))
+        self.assertEqual(r - 1j, Complex(r, -1))
+        self.assertEqual(1j / r, Complex(0, 2))
+        self.assertTrue(r == complex(0.5, 0))
+        self.assertFalse(r == 0.5j)
+
+    def test_complex_operands(self):
+        from complex import Complex
+        r = Rational(1, 2)
+        self.assertEqual(r + Complex(1, 1), Complex(Rational(3, 2), 1))
+        self.assertEqual(r - Complex(1, 1), Complex(Rational(-1, 2), -1))
+        self.assertEqual(r / Complex(0, 1), Complex(0, Rational(-1, 2)))
+        self.assertTrue(r == Complex(r, 0))
+
+    def test_unsupported_returns_not_implemented(self):
+        r = Rational(1, 2)
+        self.assertIs(r.__add__("a"), NotImplemented)
+        self.assertIs(r.__rtruediv__([1]), NotImplemented)
+        self.assertIs(r.__eq__("a"), NotImplemented)
+        with self.assertRaises(TypeError):
+            _ = "a" - r
+
+    def test_inplace_widens(self):
+        r = Rational(1, 2)
+        r += 1j
+        self.assertEqual(r, complex(0.5, 1))
+
+    def test_parse_inverts_str(self):
+        for r in [Rational(7, 3), Rational(-1, 2), Rational(5, 1), Rational(0, 1), Rational(-10**40, 3)]:
+            self.assertEqual(Rational.parse(str(r)), r)
+
+    def test_parse_forms(self):
+        self.assertEqual(Rational.parse(" -6/4 "), Rational(-3, 2))
+        self.assertEqual(Rational.parse("(1/2)"), Rational(1, 2))
+        self.assertEqual(Rational.parse("-(1/2)"), Rational(-1, 2))
+        self.assertEqual(Rational.parse("3/-4"), Rational(-3, 4))
+        self.assertEqual(Rational.parse("-1.25"), Rational(-5, 4))
+        self.assertEqual(Rational.parse(".5"), Rational(1, 2))
+        self.assertEqual(Rational.parse("3e-4"), Rational(3, 10000))
+        self.assertEqual(Rational.parse("1.5E2"), Rational(150, 1))
+        self.assertEqual(Rational.parse("0.5/1.5"), Rational(1, 3))
+
+    def test_parse_errors(self):
+        for text in ["", "abc", "1/", "/2", "1.2.3", "--1", "1 2", "e5", ".",
+                     "1_000", "1/2_0", "1.5_0", "\u0661\u0662", "\uff11/2", "1e\u0663"]:
+            with self.assertRaises(ValueError):
+                Rational.parse(text)
+        with self.assertRaises(ValueError):
+            Rational.parse("1/0")
+
+    def test_localcontext_max_den(self):
+        with Rational.localcontext(max_den=100) as ctx:
+            x = Rational(1, 1)
+            for _ in range(10):
+                x = (x + 2 / x) / 2
+            self.assertLessEqual(x.den, 100)
+        self.assertTrue(-Rational(1, 1000) < x * x - 2 < Rational(1, 1000))
+        self.assertGreater(ctx.rounded, 0)
+        self.assertGreater(ctx.error, 0)
+        self.assertLessEqual(ctx.max_error, ctx.error)
+        # Arithmetic is exact again outside the block.
+        self.assertEqual(Rational(1, 101) + 0, Rational(1, 101))
+
+    def test_localcontext_max_bits(self):
+        with Rational.localcontext(max_bits=20):
+            x = Rational(1, 3)
+            for _ in range(20):
+                x = x * x + Rational(1, 7)
+            self.assertLess(x.num.bit_length(), 21)
+            self.assertLess(x.den.bit_length(), 21)
+
+    def test_localcontext_rounding(self):
+        x, y = Rational(10, 1), Rational(31, 1)
+        expected = {"nearest": Rational(1, 3), "floor": Rational(2, 7), "ceiling": Rational(1, 3),
+                    "down": Rational(2, 7), "up": Rational(1, 3)}
+        for mode, value in expected.items():
+            with Rational.localcontext(max_den=7, rounding=mode):
+                self.assertEqual(x / y, value)
+                self.assertEqual(-x / y, -(value if mode in ("nearest", "down", "up") else expected[
+                    "ceiling" if mode == "floor" else "floor"]))
+
+    def test_localcontext_constructor_exact(self):
+        with Rational.localcontext(max_den=10) as ctx:
+            self.assertEqual(Rational(1, 97).den, 97)
+        self.assertEqual(ctx.rounded, 0)
+
+    def test_localcontext_conversions_exact(self):
+        with Rational.localcontext(max_den=2) as ctx:
+            self.assertEqual(Rational.parse("1/3"), Rational(1, 3))
+            self.assertEqual(Rational.from_float(0.1), Rational(3602879701896397, 36028797018963968))
+            self.assertEqual(pickle.loads(pickle.dumps(Rational(1, 3))), Rational(1, 3))
+            self.assertEqual(Rational(1, 3).limit_denominator(10), Rational(1, 3))
+        self.assertEqual(ctx.rounded, 0)
+
+    def test_localcontext_integers_not_rounded(self):
+        with Rational.localcontext(max_bits=8) as ctx:
+            self.assertEqual(Rational(1000, 1) * 3, Rational(3000, 1))
+            # Too large for 8 bits with any denominator, so it becomes the nearest integer.
+            self.assertEqual(Rational(1001, 3) + 0, Rational(334, 1))
+        self.assertEqual(ctx.rounded, 1)
+
+    def test_localcontext_thread_local(self):
+        results = []
+        with Rational.localcontext(max_den=10):
+            thread = threading.Thread(target=lambda: results.append(Rational(1, 19) * 1))
+            thread.start()
+            thread.join()
+            self.assertEqual(Rational(1, 19) * 1, Rational(1, 10))
+        self.assertEqual(results, [Rational(1, 19)])
+
+    def test_localcontext_async_tasks(self):
+        async def compute(max_den):
+            with Rational.localcontext(max_den=max_den):
+                await asyncio.sleep(0)
+                return Rational(1, 19) * 1
+
+        async def main():
+            return await asyncio.gather(compute(10), compute(100))
+
+        self.assertEqual(asyncio.run(main()), [Rational(1, 10), Rational(1, 19)])
+
+    def test_localcontext_nested(self):
+        with Rational.localcontext(max_den=1000) as outer:
+            with Rational.localcontext(max_den=10) as inner:
+                self.assertEqual(Rational(1, 19) * 1, Rational(1, 10))
+            self.assertEqual(Rational(1, 19) * 1, Rational(1, 19))
+            self.assertEqual(Rational(1, 1999) * 1, Rational(1, 1000))
+        self.assertEqual((inner.rounded, outer.rounded), (1, 1))
+
+    def test_localcontext_complex_parts(self):
+        from complex import Complex
+        with Rational.localcontext(max_den=50):
+            z = Complex(Rational(1, 3), Rational(2, 7))
+            for _ in range(10):
+                z = z * z + Complex(Rational(1, 5), 0)
+            self.assertLessEqual(z.Re.den, 50)
+            self.assertLessEqual(z.Im.den, 50)
+
+    def test_localcontext_negative_pow(self):
+        with Rational.localcontext(max_den=10) as ctx:
+            x = Rational(19, 1) ** -1
+        self.assertEqual(x, Rational(1, 19).limit_denominator(10))
+        self.assertEqual(ctx.rounded, 1)
+
+    def test_localcontext_errors(self):
+        with self.assertRaises(ValueError):
+            Rational.localcontext()
+        with self.assertRaises(ValueError):
+            Rational.localcontext(max_den=0)
+        with self.assertRaises(ValueError):
+            Rational.localcontext(max_bits=0)
+        with self.assertRaises(ValueError):
+            Rational.localcontext(max_den=10, rounding="half-even")
+
 
 if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    unittest.main()
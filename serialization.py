@@ -0,0 +1,487 @@
+from rational import Rational
+from complex import Complex
+from rational_array import RationalArray, _promote, _matched
+from complex_array import ComplexArray
+from array import array
+from operator import attrgetter
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+import numpy as np
+
+# File layout (all integers little-endian):
+#   header   MAGIC, version byte, kind byte, 2 padding bytes      (8 bytes)
+#   fixed    one record per value: int64 num, den for Rational;
+#            re.num, re.den, im.num, im.den for Complex
+#   spill    for every field stored as _SPILLED, in record order:
+#            varint byte length + signed little-endian bytes
+#   footer   uint64 count, uint64 spill offset, END_MAGIC           (24 bytes)
+# The fixed section starts at an 8-byte aligned offset, so it maps directly onto an
+# int64 NumPy array.
+MAGIC = b"RCXV"
+END_MAGIC = b"RCXVEND\0"
+VERSION = 1
+_HEADER = struct.Struct("<4sBB2x")
+_FOOTER = struct.Struct("<QQ8s")
+_KINDS = {Rational: 0, Complex: 1}
+_FIELDS = {Rational: 2, Complex: 4}
+
+# Marks a fixed-width field whose value lives in the spill section; it is the one
+# int64 value that is never stored inline.
+_SPILLED = -2**63
+_INT64_MAX = 2**63 - 1
+
+# Values buffered by the writer and read per chunk by the streaming reader.
+_CHUNK = 65536
+
+
+def _encode_varint(n: int) -> bytes:
+    out = bytearray()
+    while n >= 0x80:
+        out.append((n & 0x7F) | 0x80)
+        n >>= 7
+    out.append(n)
+    return bytes(out)
+
+
+def _decode_varint(data, pos: int) -> tuple[int, int]:
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return result, pos
+        shift += 7
+
+
+def _encode_big(n: int) -> bytes:
+    size = (n + (n < 0)).bit_length() // 8 + 1
+    return _encode_varint(size) + n.to_bytes(size, "little", signed=True)
+
+
+def _decode_big(data, pos: int) -> tuple[int, int]:
+    size, pos = _decode_varint(data, pos)
+    return int.from_bytes(data[pos:pos + size], "little", signed=True), pos + size
+
+
+# Per kind, the function that splits each accepted value type into its record fields.
+_RECORD_FIELDS = {
+    Rational: {
+        Rational: attrgetter('_num', '_den'),
+        int: lambda value: (value, 1),
+    },
+    Complex: {
+        Complex: attrgetter('_Re._num', '_Re._den', '_Im._num', '_Im._den'),
+        Rational: lambda value: (value._num, value._den, 0, 1),
+        int: lambda value: (value, 1, 0, 1),
+    },
+}
+
+
+def _fields(value, kind) -> tuple[int, ...]:
+    """
+    Splits a value into the integer fields of its record.
+
+    :param value: A Rational/int, or for Complex files also a Complex.
+    :param kind: Rational or Complex.
+    :raises TypeError: If the value does not fit the kind of the file.
+    :return: The fields (num, den) or (re.num, re.den, im.num, im.den).
+    """
+    split = _RECORD_FIELDS[kind].get(type(value))
+    if split is None:
+        raise TypeError(f"Can't store {type(value)} in a {kind.__name__} file")
+    return split(value)
+
+
+def _from_fields(fields, kind):
+    if kind is Rational:
+        return Rational._make(fields[0], fields[1])
+    return Complex._make(Rational._make(fields[0], fields[1]), Rational._make(fields[2], fields[3]))
+
+
+def _to_little_endian(values: array) -> bytes:
+    if sys.byteorder == "big":
+        values = array("q", values)
+        values.byteswap()
+    return values.tobytes()
+
+
+class Writer:
+    """
+    Streams Rational or Complex values into the binary format.
+
+    Fields that fit in int64 go into the fixed-width section as they are written;
+    larger ones go to a temporary spill file that is appended on close, so memory use
+    stays bounded by one chunk of records.
+    """
+
+    def __init__(self, file, kind: type = Rational):
+        """
+        :param file: A path, or a binary file object opened for writing.
+        :param kind: Rational or Complex.
+        :raises TypeError: If kind is not Rational or Complex.
+        """
+        if kind not in _KINDS:
+            raise TypeError(f"kind must be Rational or Complex, not {kind}")
+        self._owns_file = not hasattr(file, "write")
+        self._file = open(file, "wb") if self._owns_file else file
+        self._kind = kind
+        self._spill = tempfile.TemporaryFile()
+        self._buffer = array("q")
+        self._count = 0
+        self._start = self._file.tell() if not self._owns_file else 0
+        self._file.write(_HEADER.pack(MAGIC, VERSION, _KINDS[kind]))
+
+    def write(self, value):
+        """
+        Appends one value.
+
+        :param value: A Rational/int, or for Complex files a Complex/Rational/int.
+        :raises TypeError: If the value does not fit the kind of the file.
+        """
+        self._append(_fields(value, self._kind))
+        self._count += 1
+        if len(self._buffer) >= _CHUNK * _FIELDS[self._kind]:
+            self._flush()
+
+    def write_many(self, values):
+        """
+        Appends every value of an iterable.
+
+        Fields are collected per chunk and converted to int64 in one step; only a
+        chunk that contains an oversized field is re-scanned field by field.
+
+        :param values: An iterable of values accepted by write.
+        :raises TypeError: If a value does not fit the kind of the file.
+        """
+        splitters = _RECORD_FIELDS[self._kind]
+        limit = _CHUNK * _FIELDS[self._kind]
+        batch = []
+        for value in values:
+            split = splitters.get(type(value))
+            if split is None:
+                raise TypeError(f"Can't store {type(value)} in a {self._kind.__name__} file")
+            batch.extend(split(value))
+            if len(batch) >= limit:
+                self._write_batch(batch)
+                batch = []
+        self._write_batch(batch)
+
+    def _write_batch(self, fields: list[int]):
+        try:
+            chunk = array("q", fields)
+        except OverflowError:
+            chunk = None
+        if chunk is None or _SPILLED in chunk:
+            self._append(fields)
+        else:
+            self._buffer.extend(chunk)
+        self._count += len(fields) // _FIELDS[self._kind]
+        if len(self._buffer) >= _CHUNK * _FIELDS[self._kind]:
+            self._flush()
+
+    def _append(self, fields):
+        for field in fields:
+            if _SPILLED < field <= _INT64_MAX:
+                self._buffer.append(field)
+            else:
+                self._buffer.append(_SPILLED)
+                self._spill.write(_encode_big(field))
+
+    def _flush(self):
+        self._file.write(_to_little_endian(self._buffer))
+        self._buffer = array("q")
+
+    def close(self):
+        """
+        Writes the spill section and the footer, and closes the file if the writer opened it.
+        """
+        if self._spill is None:
+            return
+        self._flush()
+        spill_offset = self._file.tell() - self._start
+        self._spill.seek(0)
+        shutil.copyfileobj(self._spill, self._file)
+        self._spill.close()
+        self._spill = None
+        self._file.write(_FOOTER.pack(self._count, spill_offset, END_MAGIC))
+        if self._owns_file:
+            self._file.close()
+        else:
+            self._file.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def _parse_layout(header: bytes, footer: bytes, size: int) -> tuple[type, int, int]:
+    """
+    Checks the header and footer of a file.
+
+    :param header: The first bytes of the data.
+    :param footer: The last bytes of the data.
+    :param size: The total size of the data in bytes.
+    :raises ValueError: If the data is not a file in this format.
+    :return: (kind, count, spill offset).
+    """
+    if size < _HEADER.size + _FOOTER.size:
+        raise ValueError("File is too short")
+    magic, version, kind_code = _HEADER.unpack(header[:_HEADER.size])
+    count, spill_offset, end = _FOOTER.unpack(footer[-_FOOTER.size:])
+    if magic != MAGIC or end != END_MAGIC:
+        raise ValueError("Not a Rational/Complex value file")
+    if version != VERSION:
+        raise ValueError(f"Unsupported format version {version}")
+    kind = next((kind for kind, code in _KINDS.items() if code == kind_code), None)
+    if kind is None:
+        raise ValueError(f"Unknown value kind {kind_code}")
+    if spill_offset != _HEADER.size + 8 * _FIELDS[kind] * count or spill_offset > size - _FOOTER.size:
+        raise ValueError("Fixed-width section does not match the value count")
+    return kind, count, spill_offset
+
+
+class _SpillStream:
+    """
+    Reads the spill section sequentially, sharing the file with the fixed-section reads.
+    """
+
+    def __init__(self, file, pos: int):
+        self._file = file
+        self._pos = pos
+        self._data = b""
+        self._at = 0
+
+    def _fill(self, n: int):
+        if len(self._data) - self._at < n:
+            self._file.seek(self._pos)
+            more = self._file.read(max(_CHUNK, n))
+            self._pos += len(more)
+            self._data = self._data[self._at:] + more
+            self._at = 0
+
+    def read_int(self) -> int:
+        # A varint length prefix takes at most 10 bytes.
+        self._fill(10)
+        size, self._at = _decode_varint(self._data, self._at)
+        self._fill(size)
+        value = int.from_bytes(self._data[self._at:self._at + size], "little", signed=True)
+        self._at += size
+        return value
+
+
+def iter_values(file):
+    """
+    Reads values one at a time without loading the file.
+
+    The fixed-width section is read one chunk at a time and the spill section is
+    read alongside it, so memory use stays bounded by one chunk.
+
+    :param file: A path, or a seekable binary file object positioned at the start of the data.
+    :raises ValueError: If the file is not in this format.
+    :return: An iterator of Rational or Complex values.
+    """
+    owns_file = not hasattr(file, "read")
+    f = open(file, "rb") if owns_file else file
+    try:
+        start = f.tell()
+        header = f.read(_HEADER.size)
+        end = f.seek(0, 2)
+        f.seek(max(end - _FOOTER.size, start))
+        footer = f.read(_FOOTER.size)
+        kind, count, spill_offset = _parse_layout(header, footer, end - start)
+        width = _FIELDS[kind]
+        fixed_pos = start + _HEADER.size
+        spill = _SpillStream(f, start + spill_offset)
+        remaining = count
+        while remaining:
+            n = min(remaining, _CHUNK)
+            f.seek(fixed_pos)
+            chunk = array("q")
+            chunk.frombytes(f.read(8 * width * n))
+            if sys.byteorder == "big":
+                chunk.byteswap()
+            fixed_pos += 8 * width * n
+            remaining -= n
+            if _SPILLED not in chunk:
+                # Fast path: every field of the chunk is inline.
+                fields = iter(chunk)
+                if kind is Rational:
+                    for num, den in zip(fields, fields):
+                        yield Rational._make(num, den)
+                else:
+                    for a, b, c, d in zip(fields, fields, fields, fields):
+                        yield Complex._make(Rational._make(a, b), Rational._make(c, d))
+                continue
+            for i in range(0, width * n, width):
+                fields = chunk[i:i + width]
+                if _SPILLED in fields:
+                    fields = [spill.read_int() if field == _SPILLED else field for field in fields]
+                yield _from_fields(fields, kind)
+    finally:
+        if owns_file:
+            f.close()
+
+
+def dump(values, file, kind: type|None = None):
+    """
+    Writes a sequence of values to a file.
+
+    :param values: An iterable of Rational/int or Complex values.
+    :param file: A path, or a binary file object opened for writing.
+    :param kind: Rational or Complex; by default Complex if any value is a Complex.
+    """
+    if kind is None:
+        values = list(values)
+        kind = Complex if any(type(value) is Complex for value in values) else Rational
+    with Writer(file, kind) as writer:
+        writer.write_many(values)
+
+
+def load(file) -> list:
+    """
+    Reads all values of a file.
+
+    :param file: A path, or a seekable binary file object.
+    :raises ValueError: If the file is not in this format.
+    :return: The list of Rational or Complex values.
+    """
+    return list(iter_values(file))
+
+
+class MappedReader:
+    """
+    Memory-maps a value file for random access.
+
+    The fixed-width section is exposed zero-copy as an int64 NumPy array, so large
+    files load in constant time; Python objects are only built for the values that
+    are actually accessed.
+    """
+
+    def __init__(self, path):
+        """
+        :param path: The path of a file in this format.
+        :raises ValueError: If the file is not in this format.
+        """
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            self._file.close()
+            raise ValueError("File is too short")
+        size = len(self._map)
+        self._kind, self._count, self._spill_offset = _parse_layout(
+            self._map[:_HEADER.size], self._map[max(size - _FOOTER.size, 0):], size)
+        width = _FIELDS[self._kind]
+        self._fixed = np.frombuffer(self._map, dtype="<i8", count=width * self._count,
+                                    offset=_HEADER.size).reshape(self._count, width)
+        # Offsets into the spill section, built on first access to a spilled field.
+        self._spill_index = None
+
+    @property
+    def kind(self) -> type:
+        return self._kind
+
+    @property
+    def fixed(self) -> np.ndarray:
+        """
+        The fixed-width section as a read-only (count, fields) int64 array.
+
+        Columns are num, den for Rational and re.num, re.den, im.num, im.den for
+        Complex. Fields that did not fit in int64 hold -2**63.
+        """
+        return self._fixed
+
+    @property
+    def spilled(self) -> np.ndarray:
+        """
+        A boolean array marking the values with at least one field in the spill section.
+        """
+        return (self._fixed == _SPILLED).any(axis=1)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def _spilled_fields(self) -> tuple[np.ndarray, list[int]]:
+        if self._spill_index is None:
+            flat = (self._fixed == _SPILLED).ravel()
+            # Rank of every field among the spilled ones, in record order.
+            ranks = np.cumsum(flat) - 1
+            offsets = []
+            pos = self._spill_offset
+            for _ in range(int(flat.sum())):
+                offsets.append(pos)
+                size, pos = _decode_varint(self._map, pos)
+                pos += size
+            self._spill_index = (ranks, offsets)
+        return self._spill_index
+
+    def __getitem__(self, index: int):
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("index out of range")
+        fields = self._fixed[index].tolist()
+        if _SPILLED in fields:
+            ranks, offsets = self._spilled_fields()
+            width = len(fields)
+            for j in range(width):
+                if fields[j] == _SPILLED:
+                    fields[j] = _decode_big(self._map, offsets[ranks[index * width + j]])[0]
+        return _from_fields(fields, self._kind)
+
+    def __iter__(self):
+        for index in range(self._count):
+            yield self[index]
+
+    def _column(self, j: int) -> np.ndarray:
+        column = self._fixed[:, j]
+        if not (column == _SPILLED).any():
+            return column
+        ranks, offsets = self._spilled_fields()
+        column = _promote(column)
+        width = self._fixed.shape[1]
+        for index in np.nonzero(self._fixed[:, j] == _SPILLED)[0].tolist():
+            column[index] = _decode_big(self._map, offsets[ranks[index * width + j]])[0]
+        return column
+
+    def to_array(self):
+        """
+        Converts the file to a RationalArray or ComplexArray.
+
+        A numerator and denominator pair without spilled fields is a zero-copy view of
+        the mapped file; if either column of the pair has spilled fields, both are
+        converted to Python-int object storage.
+
+        :return: The values as an array.
+        """
+        if self._kind is Rational:
+            return self._rational_array(0)
+        return ComplexArray._make(self._rational_array(0), self._rational_array(2))
+
+    def _rational_array(self, j: int) -> RationalArray:
+        return RationalArray._make(*_matched(self._column(j), self._column(j + 1)))
+
+    def close(self):
+        """
+        Releases the mapping; arrays still viewing it keep it alive until they are freed.
+        """
+        self._fixed = None
+        self._spill_index = None
+        try:
+            self._map.close()
+        except BufferError:
+            pass
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,142 @@
+import unittest
+import io
+import os
+import random
+import tempfile
+import numpy as np
+from rational import Rational
+from complex import Complex
+from rational_array import RationalArray
+from complex_array import ComplexArray
+import serialization
+
+class TestSerialization(unittest.TestCase):
+
+    def setUp(self):
+        rng = random.Random(17)
+        self.rationals = [Rational(rng.randint(-10**6, 10**6), rng.randint(1, 10**6)) for _ in range(200)]
+        self.rationals += [Rational(10**30 + 1, 7), Rational(-2**63, 1), Rational(2**63 - 1, 2**64 + 1), Rational(0, 1)]
+        self.complexes = [Complex(x, y) for x, y in zip(self.rationals, reversed(self.rationals))]
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_round_trip_rational(self):
+        serialization.dump(self.rationals, self.path)
+        self.assertEqual(serialization.load(self.path), self.rationals)
+
+    def test_round_trip_complex(self):
+        serialization.dump(self.complexes, self.path)
+        self.assertEqual(serialization.load(self.path), self.complexes)
+
+    def test_round_trip_file_object(self):
+        buffer = io.BytesIO()
+        buffer.write(b"prefix")
+        serialization.dump(self.rationals, buffer)
+        buffer.seek(6)
+        self.assertEqual(serialization.load(buffer), self.rationals)
+
+    def test_localcontext_exact(self):
+        serialization.dump(self.complexes, self.path)
+        with Rational.localcontext(max_den=2):
+            self.assertEqual(serialization.load(self.path), self.complexes)
+            with serialization.MappedReader(self.path) as reader:
+                self.assertEqual(reader[0], self.complexes[0])
+
+    def test_empty(self):
+        serialization.dump([], self.path)
+        self.assertEqual(serialization.load(self.path), [])
+        with serialization.MappedReader(self.path) as reader:
+            self.assertEqual(len(reader), 0)
+            self.assertEqual(reader.fixed.shape, (0, 2))
+
+    def test_kind_inference_and_ints(self):
+        serialization.dump([1, Rational(1, 2), Complex(0, 1)], self.path)
+        self.assertEqual(serialization.load(self.path), [Complex(1, 0), Complex(Rational(1, 2), 0), Complex(0, 1)])
+
+    def test_writer_type_error(self):
+        with serialization.Writer(self.path, Rational) as writer:
+            with self.assertRaises(TypeError):
+                writer.write(Complex(1, 1))
+        with self.assertRaises(TypeError):
+            serialization.Writer(self.path, int)
+
+    def test_streaming_chunks(self):
+        values = [Rational(k, 3) if k % 1000 else Rational(10**50 + k, 1) for k in range(70000)]
+        with serialization.Writer(self.path) as writer:
+            writer.write_many(values)
+        for k, value in enumerate(serialization.iter_values(self.path)):
+            self.assertEqual(value, values[k])
+        self.assertEqual(k, len(values) - 1)
+
+    def test_size(self):
+        serialization.dump([Rational(k, 7) for k in range(1000)], self.path)
+        self.assertEqual(os.path.getsize(self.path), 8 + 16 * 1000 + 24)
+
+    def test_invalid_file(self):
+        with open(self.path, "wb") as f:
+            f.write(b"not a value file at all, really not")
+        with self.assertRaises(ValueError):
+            serialization.load(self.path)
+        with self.assertRaises(ValueError):
+            serialization.MappedReader(self.path)
+
+    def test_truncated_file(self):
+        serialization.dump(self.rationals, self.path)
+        with open(self.path, "r+b") as f:
+            f.truncate(100)
+        with self.assertRaises(ValueError):
+            serialization.load(self.path)
+
+    def test_mapped_reader(self):
+        serialization.dump(self.rationals, self.path)
+        with serialization.MappedReader(self.path) as reader:
+            self.assertIs(reader.kind, Rational)
+            self.assertEqual(len(reader), len(self.rationals))
+            self.assertEqual(reader[0], self.rationals[0])
+            self.assertEqual(reader[-4], Rational(10**30 + 1, 7))
+            self.assertEqual(reader[-2], self.rationals[-2])
+            self.assertEqual(list(reader), self.rationals)
+            self.assertEqual(reader.fixed.dtype, np.dtype("<i8"))
+            self.assertEqual(reader.fixed[5].tolist(), [self.rationals[5].num, self.rationals[5].den])
+            self.assertEqual(np.nonzero(reader.spilled)[0].tolist(), [200, 201, 202])
+            with self.assertRaises(IndexError):
+                reader[len(self.rationals)]
+
+    def test_mapped_zero_copy(self):
+        serialization.dump([Rational(k, 3) for k in range(10)], self.path)
+        with serialization.MappedReader(self.path) as reader:
+            self.assertFalse(reader.fixed.flags.owndata)
+            self.assertFalse(reader.fixed.flags.writeable)
+            array = reader.to_array()
+            self.assertIsInstance(array, RationalArray)
+            self.assertEqual(array.to_list(), [Rational(k, 3) for k in range(10)])
+            self.assertEqual(array.dtype, np.int64)
+            del array
+
+    def test_mapped_to_array_spilled(self):
+        serialization.dump(self.complexes, self.path)
+        with serialization.MappedReader(self.path) as reader:
+            array = reader.to_array()
+            self.assertIsInstance(array, ComplexArray)
+            self.assertEqual(array.to_list(), self.complexes)
+            del array
+
+    def test_mapped_to_array_dtypes(self):
+        for values in ([Rational(1, 2**70), Rational(3, 5)], [Rational(2**70, 3), Rational(-1, 2)]):
+            serialization.dump(values, self.path)
+            with serialization.MappedReader(self.path) as reader:
+                array = reader.to_array()
+                self.assertEqual((array.num.dtype, array.den.dtype), (object, object))
+                self.assertEqual((array + array).to_list(), [x + x for x in values])
+                del array
+        serialization.dump([Rational(1, 3), Rational(-2, 7)], self.path)
+        with serialization.MappedReader(self.path) as reader:
+            array = reader.to_array()
+            self.assertEqual((array.num.dtype, array.den.dtype), (np.int64, np.int64))
+            del array
+
+if __name__ == "__main__":
+    unittest.main()